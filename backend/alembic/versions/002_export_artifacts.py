@@ -0,0 +1,41 @@
+"""Export artifact store columns
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 导出记录表增加版本、主题、内容哈希和访问时间，用于导出文件缓存
+    op.add_column('quote_exports', sa.Column('theme', sa.String(length=20), nullable=False, server_default='', comment='主题'))
+    op.add_column('quote_exports', sa.Column('quote_version', sa.DateTime(), nullable=True, comment='报价单版本(更新时间)'))
+    op.add_column('quote_exports', sa.Column('content_hash', sa.String(length=64), nullable=True, comment='文件内容SHA256'))
+    op.add_column('quote_exports', sa.Column('last_accessed_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP'), comment='最后访问时间'))
+    op.create_index(
+        'ix_quote_exports_artifact',
+        'quote_exports',
+        ['quote_id', 'export_format', 'theme', 'quote_version'],
+        unique=True
+    )
+    op.create_index('ix_quote_exports_last_accessed_at', 'quote_exports', ['last_accessed_at'])
+    op.create_index('ix_quote_exports_content_hash', 'quote_exports', ['content_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quote_exports_content_hash', table_name='quote_exports')
+    op.drop_index('ix_quote_exports_last_accessed_at', table_name='quote_exports')
+    op.drop_index('ix_quote_exports_artifact', table_name='quote_exports')
+    op.drop_column('quote_exports', 'last_accessed_at')
+    op.drop_column('quote_exports', 'content_hash')
+    op.drop_column('quote_exports', 'quote_version')
+    op.drop_column('quote_exports', 'theme')
@@ -0,0 +1,55 @@
+"""Export job queue table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 创建导出任务表
+    op.create_table(
+        'export_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='主键ID'),
+        sa.Column('job_key', sa.String(length=32), nullable=False, comment='任务标识'),
+        sa.Column('user_id', sa.Integer(), nullable=False, comment='创建人ID'),
+        sa.Column('params', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='导出参数'),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='queued', comment='状态(queued/running/succeeded/failed)'),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0', comment='报价单总数'),
+        sa.Column('completed', sa.Integer(), nullable=False, server_default='0', comment='已完成数'),
+        sa.Column('error', sa.Text(), nullable=True, comment='错误信息'),
+        sa.Column('result_path', sa.String(length=255), nullable=True, comment='结果文件路径'),
+        sa.Column('filename', sa.String(length=255), nullable=True, comment='下载文件名'),
+        sa.Column('media_type', sa.String(length=100), nullable=True, comment='文件类型'),
+        sa.Column('worker_id', sa.String(length=100), nullable=True, comment='处理该任务的Worker'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0', comment='领取次数'),
+        sa.Column('started_at', sa.DateTime(), nullable=True, comment='开始时间'),
+        sa.Column('finished_at', sa.DateTime(), nullable=True, comment='完成时间'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP'), comment='创建时间'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP'), comment='更新时间'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_export_jobs_id'), 'export_jobs', ['id'])
+    op.create_index(op.f('ix_export_jobs_job_key'), 'export_jobs', ['job_key'], unique=True)
+    op.create_index(
+        'ix_export_jobs_queued',
+        'export_jobs',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'queued'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_export_jobs_queued', table_name='export_jobs')
+    op.drop_table('export_jobs')
@@ -0,0 +1,40 @@
+"""Quote number counter table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 创建报价单编号计数表
+    op.create_table(
+        'quote_number_counters',
+        sa.Column('quote_date', sa.Date(), nullable=False, comment='编号日期'),
+        sa.Column('last_seq', sa.Integer(), nullable=False, server_default='0', comment='已分配的最大序号'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP'), comment='更新时间'),
+        sa.PrimaryKeyConstraint('quote_date')
+    )
+
+    # 按已有报价单编号初始化计数（编号中的日期与序号，序号可能超过两位）
+    op.execute("""
+        INSERT INTO quote_number_counters (quote_date, last_seq)
+        SELECT to_date(split_part(quote_number, '-', 3), 'YYYYMMDD'),
+               MAX(CAST(split_part(quote_number, '-', 4) AS INTEGER))
+        FROM quotes
+        WHERE quote_number ~ '^ZTO-JCYB-[0-9]{8}-[0-9]+$'
+        GROUP BY 1
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('quote_number_counters')
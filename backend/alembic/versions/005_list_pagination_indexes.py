@@ -0,0 +1,44 @@
+"""List pagination indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+# (索引名, 表, 列)：列表游标分页的排序键组合索引（倒序分页时反向扫描同一索引）
+INDEXES = [
+    ('ix_quotes_created_at_id', 'quotes', ['created_at', 'id']),
+    ('ix_templates_created_at_id', 'templates', ['created_at', 'id']),
+    ('ix_quoters_sort_order_created_at_id', 'quoters', ['sort_order', 'created_at', 'id']),
+    ('ix_users_created_at_id', 'users', ['created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    # 与 007 相同在事务外 CONCURRENTLY 创建，部署时建索引不阻塞报价单等表的写入
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
@@ -0,0 +1,48 @@
+"""Trigram indexes for quote search
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+# (索引名, 列)
+INDEXES = [
+    ('ix_quotes_customer_name_trgm', 'customer_name'),
+    ('ix_quotes_contact_phone_trgm', 'contact_phone'),
+]
+
+
+def upgrade() -> None:
+    # 客户名称、联系电话子串搜索（ILIKE '%关键字%'）使用三元组GIN索引
+    # 在报价单表上建GIN索引耗时较长，与 007 相同在事务外 CONCURRENTLY 创建，建索引期间不阻塞写入；
+    # 扩展须在索引之前创建（pg_trgm 为可信扩展（PostgreSQL 13+），数据库所有者即可创建）
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, column in INDEXES:
+            op.create_index(
+                name, 'quotes', [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    # 扩展可能被其他对象使用，不删除
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name='quotes',
+                postgresql_concurrently=True,
+                if_exists=True
+            )
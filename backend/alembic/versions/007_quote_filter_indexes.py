@@ -0,0 +1,49 @@
+"""Quote list filter indexes (built concurrently)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+# (索引名, 列)，与报价单列表、数据接口的筛选组合对应
+INDEXES = [
+    # 按状态筛选，按创建时间倒序分页
+    ('ix_quotes_status_created_at_id', ['status', 'created_at', 'id']),
+    # 按报价日期范围筛选；状态 + 报价日期范围
+    ('ix_quotes_quote_date', ['quote_date']),
+    ('ix_quotes_status_quote_date', ['status', 'quote_date']),
+    # 数据接口增量同步：updated_at >= 上次同步时间，按 (updated_at, id) 输出
+    ('ix_quotes_updated_at_id', ['updated_at', 'id']),
+    # 外键：按报价人查询、删除报价人时的引用检查
+    ('ix_quotes_quoter_id', ['quoter_id']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY 不能在事务中执行，建索引期间不阻塞报价单的写入；
+    # 中途失败会留下无效索引，重新执行前需先删除（IF NOT EXISTS 会跳过无效索引）
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name, 'quotes', columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name='quotes',
+                postgresql_concurrently=True,
+                if_exists=True
+            )
@@ -0,0 +1,186 @@
+"""
+导出任务API
+大批量导出和PDF渲染在后台执行，前端轮询进度后下载结果
+"""
+import logging
+import os
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db, SessionLocal
+from app.models.quote import Quote
+from app.models.user import User, UserRole
+from app.schemas.export_job import ExportJobCreate, ExportJobResponse
+from app.api.auth import get_current_user
+from app.api.quotes import check_quote_filters
+from app.api.exports import (
+    EXPORT_FORMATS, get_quote_and_quoter, load_export, check_bulk_export, iter_bulk_export
+)
+from app.services.pdf_renderer import get_pdf_render_pool
+from app.services.export_jobs import (
+    get_job_store, new_job, submit_job, job_result_dir,
+    JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/export-jobs", tags=["导出任务"])
+
+
+def run_export_job(job_id: str) -> None:
+    """
+    执行导出任务
+    单个报价单直接渲染，批量导出写入ZIP；结果保存到 UPLOAD_DIR/jobs
+    """
+    store = get_job_store()
+    job = store.get(job_id)
+    if job is None:
+        return
+
+    params = ExportJobCreate(**job["params"])
+    export_format = params.export_format
+    store.update(job_id, status=JOB_RUNNING, started_at=datetime.utcnow().isoformat())
+
+    try:
+        if params.quote_id:
+            ext = EXPORT_FORMATS[export_format]["ext"]
+            media_type = EXPORT_FORMATS[export_format]["media_type"]
+            db = SessionLocal()
+            try:
+                quote, quoter = get_quote_and_quoter(db, params.quote_id)
+                filename = f"quote-{quote.quote_number}.{ext}"
+                content = load_export(
+                    quote, quoter, export_format, params.theme,
+                    wait=get_pdf_render_pool().timeout
+                )
+            finally:
+                db.close()
+            chunks = [content]
+        else:
+            ext = "zip"
+            media_type = "application/zip"
+            filename = f"quotes-{datetime.now().strftime('%Y%m%d')}.zip"
+            chunks = iter_bulk_export(
+                params.filters(), export_format, params.theme,
+                on_entry=lambda: store.increment(job_id, "completed")
+            )
+
+        result_path = job_result_dir() / f"{job_id}.{ext}"
+        tmp_path = result_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, result_path)
+        if params.quote_id:
+            store.increment(job_id, "completed")
+
+        store.update(
+            job_id,
+            status=JOB_SUCCEEDED,
+            result_path=str(result_path),
+            filename=filename,
+            media_type=media_type,
+            finished_at=datetime.utcnow().isoformat()
+        )
+    except HTTPException as exc:
+        store.update(job_id, status=JOB_FAILED, error=str(exc.detail), finished_at=datetime.utcnow().isoformat())
+    except Exception as exc:
+        logger.exception("导出任务失败: %s", job_id)
+        store.update(job_id, status=JOB_FAILED, error=f"导出失败: {exc}", finished_at=datetime.utcnow().isoformat())
+
+
+def get_job_or_404(job_id: str, current_user: User) -> dict:
+    """查询任务；只能查看自己创建的任务（管理员除外）"""
+    job = get_job_store().get(job_id)
+    if not job or (job["user_id"] != current_user.id and current_user.role != UserRole.ADMIN):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="导出任务不存在"
+        )
+    return job
+
+
+def to_job_response(job: dict) -> dict:
+    """任务记录转换为响应"""
+    total = job["total"] or 0
+    completed = min(job["completed"] or 0, total)
+    return {
+        "id": job["id"],
+        "status": job["status"],
+        "quote_id": job["params"].get("quote_id"),
+        "export_format": job["params"].get("export_format"),
+        "total": total,
+        "completed": completed,
+        "progress": round(completed / total, 4) if total else 0.0,
+        "error": job["error"],
+        "filename": job["filename"],
+        "download_url": (
+            f"{router.prefix}/{job['id']}/download" if job["status"] == JOB_SUCCEEDED else None
+        ),
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+    }
+
+
+@router.post("", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_export_job(
+    job_in: ExportJobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    创建导出任务
+    指定quote_id导出单个报价单，否则按筛选条件批量导出ZIP
+    """
+    if job_in.quote_id:
+        if not db.query(Quote.id).filter(Quote.id == job_in.quote_id).first():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="报价单不存在"
+            )
+        total = 1
+    else:
+        total = check_bulk_export(db, check_quote_filters(job_in.filters()))
+
+    job = new_job(current_user.id, job_in.model_dump(mode="json"), total)
+    get_job_store().create(job)
+    submit_job(run_export_job, job["id"])
+    return to_job_response(job)
+
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+def get_export_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """查询导出任务状态和进度"""
+    return to_job_response(get_job_or_404(job_id, current_user))
+
+
+@router.get("/{job_id}/download")
+def download_export_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """下载导出任务结果"""
+    job = get_job_or_404(job_id, current_user)
+    if job["status"] != JOB_SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="导出任务尚未完成"
+        )
+
+    if not os.path.exists(job["result_path"]):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="导出文件已过期"
+        )
+
+    return FileResponse(
+        job["result_path"],
+        media_type=job["media_type"],
+        filename=job["filename"]
+    )
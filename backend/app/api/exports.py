@@ -1,21 +1,153 @@
 """
 报价单导出API
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse
-from sqlalchemy.orm import Session
-from io import BytesIO
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
+from typing import Callable, Iterator, Optional, Tuple
+from datetime import date, datetime, timedelta
+from io import StringIO
+import csv
+import enum
+import hashlib
 import json
+import tempfile
 
-from app.database import get_db
-from app.models.quote import Quote
+from app.config import get_settings
+from app.database import get_db, SessionLocal
+from app.models.quote import Quote, QuoteExport, QuoteStatus
 from app.models.quoter import Quoter
 from app.models.user import User
-from app.api.auth import get_current_user
+from app.api.auth import get_current_user, get_current_active_admin
+from app.services.pdf_renderer import (
+    get_pdf_render_pool, PdfRenderBusy, PdfRenderTimeout, PdfRenderError
+)
+from app.services.render_cache import get_render_cache, make_render_key
+from app.services.compression import (
+    compress, compress_variant, encoding_headers, negotiate, StreamCompressor
+)
+from app.services.quote_templates import get_quote_templates, build_document_context, THEMES
+from app.services.artifact_store import get_artifact_store, STORED_STATUSES
+from app.services.bulk_export import stream_zip, render_ahead
+from app.services.prerender import get_prerenderer
+from app.services.render_admission import get_render_admission
+from app.services.price_data import iter_price_items, PRICE_ITEM_FIELDS
+from app.api.quotes import apply_quote_filters, check_quote_filters
+from app.utils.http_cache import check_quote_not_modified, quote_headers
+from app.utils.security import create_share_token
+from app.schemas.quote import QuoteCreate
+from app.schemas.share_link import ShareLinkCreate, ShareLinkResponse
 
 router = APIRouter(prefix="/api/v1/exports", tags=["导出功能"])
 
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# 导出格式: 媒体类型、扩展名、是否区分主题
+EXPORT_FORMATS = {
+    "pdf": {"media_type": "application/pdf", "ext": "pdf", "themed": True},
+    "excel": {"media_type": XLSX_MEDIA_TYPE, "ext": "xlsx", "themed": False},
+    "word": {"media_type": DOCX_MEDIA_TYPE, "ext": "docx", "themed": False},
+    "html": {"media_type": "text/html", "ext": "html", "themed": True},
+}
+EXPORT_FORMAT_PATTERN = "^(pdf|excel|word|html)$"
+# 主题参数作为导出文件记录的一部分保存，只接受已定义的主题
+THEME_PATTERN = f"^({'|'.join(THEMES)})$"
+
+# 文档数据、PDF用HTML（不含样式表，各主题共用）在渲染缓存中的键（占用主题位置，不会与主题名冲突）
+DOCUMENT_CONTEXT_KEY = "#context"
+PDF_DOCUMENT_KEY = "#pdf"
+
+# 未保存报价单预览：缓存键前缀（不会与报价单ID冲突）、编号占位
+DRAFT_PREVIEW_KEY = "#draft"
+DRAFT_QUOTE_NUMBER = "（保存后生成）"
+
+# 报价单状态显示名称
+QUOTE_STATUS_LABELS = {
+    QuoteStatus.DRAFT: "草稿",
+    QuoteStatus.SENT: "已发送",
+    QuoteStatus.CONFIRMED: "已确认",
+    QuoteStatus.EXPIRED: "已过期",
+}
+
+# 报价单汇总表列: 表头、查询列、列宽（只查询需要的列，不加载price_data等JSON字段）
+REPORT_COLUMNS = [
+    ("报价单编号", Quote.quote_number, 22),
+    ("客户名称", Quote.customer_name, 30),
+    ("联系人", Quote.contact_person, 12),
+    ("联系电话", Quote.contact_phone, 16),
+    ("客户地址", Quote.customer_address, 36),
+    ("日均发货量", Quote.daily_volume, 12),
+    ("重量段", Quote.weight_range, 12),
+    ("产品类型", Quote.product_type, 12),
+    ("价格模板", Quote.template_type, 12),
+    ("报价人", Quoter.name, 12),
+    ("报价日期", Quote.quote_date, 12),
+    ("有效期(天)", Quote.valid_days, 10),
+    ("到期日期", Quote.expire_date, 12),
+    ("是否含税", Quote.is_tax_included, 10),
+    ("状态", Quote.status, 10),
+    ("创建时间", Quote.created_at, 20),
+]
+
+# 汇总表每批读取行数、响应分块大小
+REPORT_BATCH_SIZE = 1000
+REPORT_CHUNK_SIZE = 64 * 1024
+
+# 数据接口字段（供下游系统同步，字段名使用英文）
+FEED_COLUMNS = [
+    Quote.id,
+    Quote.quote_number,
+    Quote.customer_name,
+    Quote.contact_person,
+    Quote.contact_phone,
+    Quote.customer_address,
+    Quote.daily_volume,
+    Quote.weight_range,
+    Quote.product_type,
+    Quote.template_type,
+    Quote.quoter_id,
+    Quoter.name.label("quoter_name"),
+    Quote.quote_date,
+    Quote.valid_days,
+    Quote.expire_date,
+    Quote.is_tax_included,
+    Quote.status,
+    Quote.remark,
+    Quote.created_at,
+    Quote.updated_at,
+]
+FEED_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def get_quote_and_quoter(db: Session, quote_id: int) -> Tuple[Quote, Quoter]:
+    """
+    查询报价单及其报价人（单次JOIN查询）
+
+    Raises:
+        HTTPException: 报价单或报价人不存在
+    """
+    quote = db.query(Quote).options(
+        joinedload(Quote.quoter)
+    ).filter(Quote.id == quote_id).first()
+    if not quote:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="报价单不存在"
+        )
+
+    if not quote.quoter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="报价人不存在"
+        )
+
+    return quote, quote.quoter
+
 
 def render_quote_html(quote: Quote, quoter: Quoter, theme: str = "blue") -> str:
     """
@@ -29,296 +161,442 @@ def render_quote_html(quote: Quote, quoter: Quoter, theme: str = "blue") -> str:
     Returns:
         HTML字符串
     """
-    # 主题颜色配置
-    themes = {
-        "blue": {"primary": "#0066CC", "secondary": "#E6F2FF"},
-        "gray": {"primary": "#666666", "secondary": "#F5F5F5"},
-        "beige": {"primary": "#8B7355", "secondary": "#FFF8DC"}
-    }
+    return get_quote_templates().render_document(quote, quoter, theme)
 
-    colors = themes.get(theme, themes["blue"])
-
-    # 构建价格表HTML
-    price_table_html = ""
-    if quote.template_type == "TONGPIAO":
-        # 通票模式 - 区域价格表
-        price_table_html = "<table class='price-table'>"
-        price_table_html += "<thead><tr><th>区域</th><th>省份</th><th>首重(元/KG)</th><th>续重(元/KG)</th><th>时效</th></tr></thead>"
-        price_table_html += "<tbody>"
-
-        for region in quote.price_data.get("regions", []):
-            provinces = "、".join(region.get("provinces", []))
-            price_table_html += f"""
-            <tr>
-                <td>{region.get('regionName', '')}</td>
-                <td>{provinces}</td>
-                <td>{region.get('firstWeight', 0):.2f}</td>
-                <td>{region.get('additionalWeight', 0):.2f}</td>
-                <td>{region.get('remark', '')}</td>
-            </tr>
-            """
-
-        price_table_html += "</tbody></table>"
-
-    # 构建条款HTML
-    terms_html = ""
-
-    # 固定条款
-    if quote.fixed_terms:
-        terms_html += "<h3>服务条款</h3>"
-        for term in quote.fixed_terms:
-            terms_html += f"<p><strong>{term.get('title', '')}:</strong> {term.get('content', '')}</p>"
-
-    # 非固定条款
-    if quote.optional_terms:
-        for term in quote.optional_terms:
-            terms_html += f"<p><strong>{term.get('title', '')}:</strong> {term.get('content', '')}</p>"
-
-    # 自定义条款
-    if quote.custom_terms:
-        terms_html += "<h3>特别说明</h3>"
-        for term in quote.custom_terms:
-            terms_html += f"<p>• {term}</p>"
-
-    # HTML模板
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>报价单 - {quote.quote_number}</title>
-        <style>
-            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-            body {{
-                font-family: "Microsoft YaHei", Arial, sans-serif;
-                line-height: 1.6;
-                padding: 40px;
-                background: #f5f5f5;
-            }}
-            .container {{
-                max-width: 900px;
-                margin: 0 auto;
-                background: white;
-                padding: 40px;
-                box-shadow: 0 0 20px rgba(0,0,0,0.1);
-            }}
-            .header {{
-                border-bottom: 3px solid {colors['primary']};
-                padding-bottom: 20px;
-                margin-bottom: 30px;
-            }}
-            .header h1 {{
-                color: {colors['primary']};
-                font-size: 28px;
-                margin-bottom: 10px;
-            }}
-            .header .quote-number {{
-                color: #666;
-                font-size: 14px;
-            }}
-            .info-grid {{
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 15px;
-                margin-bottom: 30px;
-            }}
-            .info-item {{
-                padding: 10px;
-                background: {colors['secondary']};
-                border-left: 3px solid {colors['primary']};
-            }}
-            .info-item label {{
-                color: #666;
-                font-size: 12px;
-                display: block;
-            }}
-            .info-item value {{
-                color: #333;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            .price-section {{
-                margin: 30px 0;
-            }}
-            .price-section h2 {{
-                color: {colors['primary']};
-                font-size: 20px;
-                margin-bottom: 15px;
-                padding-bottom: 10px;
-                border-bottom: 2px solid {colors['secondary']};
-            }}
-            .price-table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 20px;
-            }}
-            .price-table th {{
-                background: {colors['primary']};
-                color: white;
-                padding: 12px;
-                text-align: left;
-                font-weight: normal;
-            }}
-            .price-table td {{
-                padding: 10px 12px;
-                border-bottom: 1px solid #eee;
-            }}
-            .price-table tr:hover {{
-                background: {colors['secondary']};
-            }}
-            .terms-section {{
-                margin: 30px 0;
-            }}
-            .terms-section h3 {{
-                color: {colors['primary']};
-                font-size: 16px;
-                margin-bottom: 10px;
-            }}
-            .terms-section p {{
-                margin: 8px 0;
-                color: #333;
-                font-size: 14px;
-            }}
-            .footer {{
-                margin-top: 40px;
-                padding-top: 20px;
-                border-top: 1px solid #ddd;
-                text-align: center;
-                color: #999;
-                font-size: 12px;
-            }}
-            @media print {{
-                body {{ padding: 0; background: white; }}
-                .container {{ box-shadow: none; }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>中通快递服务报价单</h1>
-                <div class="quote-number">编号: {quote.quote_number} | 生成日期: {datetime.now().strftime('%Y-%m-%d %H:%M')}</div>
-            </div>
-
-            <div class="info-grid">
-                <div class="info-item">
-                    <label>客户名称</label>
-                    <value>{quote.customer_name}</value>
-                </div>
-                <div class="info-item">
-                    <label>联系人</label>
-                    <value>{quote.contact_person}</value>
-                </div>
-                <div class="info-item">
-                    <label>联系电话</label>
-                    <value>{quote.contact_phone}</value>
-                </div>
-                <div class="info-item">
-                    <label>报价日期</label>
-                    <value>{quote.quote_date}</value>
-                </div>
-                <div class="info-item">
-                    <label>有效期至</label>
-                    <value>{quote.expire_date}</value>
-                </div>
-                <div class="info-item">
-                    <label>报价人</label>
-                    <value>{quoter.name} ({quoter.phone})</value>
-                </div>
-            </div>
-
-            <div class="price-section">
-                <h2>价格方案</h2>
-                {price_table_html}
-                <p style="margin-top: 10px; color: #666; font-size: 14px;">
-                    {'含税价格' if quote.is_tax_included else '不含税价格'}
-                </p>
-            </div>
-
-            <div class="terms-section">
-                {terms_html}
-            </div>
-
-            {f'<div style="margin-top: 20px; padding: 15px; background: #fff3cd; border-left: 4px solid #ffc107;"><strong>备注:</strong> {quote.remark}</div>' if quote.remark else ''}
-
-            <div class="footer">
-                <p>中通快递服务有限公司</p>
-                <p>本报价单由系统自动生成 | 如有疑问请联系报价人</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    return html
 
+def get_document_context(quote: Quote, quoter: Quoter) -> dict:
+    """
+    获取报价单文档数据（价格表、条款，带缓存）
+    HTML各主题与Word共用，同一版本的报价单只整理一次
+    """
+    return get_render_cache().get_or_render(
+        make_render_key(quote, quoter, DOCUMENT_CONTEXT_KEY),
+        lambda: build_document_context(quote)
+    )
 
-@router.get("/quotes/{quote_id}/preview")
-def preview_quote(
-    quote_id: int,
+
+def render_quote_html_cached(quote: Quote, quoter: Quoter, theme: str = "blue") -> str:
+    """
+    渲染报价单HTML（带缓存）
+    报价单或报价人更新后缓存键随之变化
+    """
+    return get_render_cache().get_or_render(
+        make_render_key(quote, quoter, theme),
+        lambda: get_quote_templates().render_document(
+            quote, quoter, theme, get_document_context(quote, quoter)
+        )
+    )
+
+
+def encoded_render_key(key: tuple, encoding: str) -> tuple:
+    """渲染结果压缩版本的缓存键（在原键后追加编码，按报价单/报价人失效的规则不变）"""
+    return key + (encoding,)
+
+
+def stream_quote_html(
+    quote: Quote, quoter: Quoter, theme: str = "blue", encoding: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    流式输出报价单HTML
+    命中缓存直接输出；否则边渲染边发送，文档不超过单条上限时同时写入缓存
+
+    文档数据需在调用前准备好（见 get_document_context），
+    生成器在响应发送阶段执行，此时请求的数据库会话已关闭
+
+    Args:
+        encoding: 内容编码 (gzip/br)；压缩版本与HTML一起缓存，再次请求不再压缩
+    """
+    cache = get_render_cache()
+    key = make_render_key(quote, quoter, theme)
+    if encoding:
+        body = cache.get(encoded_render_key(key, encoding))
+        if body is not None:
+            yield body
+            return
+
+    html_content = cache.get(key)
+    if html_content is not None:
+        body = html_content.encode("utf-8")
+        if encoding:
+            body = compress(body, encoding)
+            cache.put(encoded_render_key(key, encoding), body)
+        yield body
+        return
+
+    context = get_document_context(quote, quoter)
+    max_entry = get_settings().RENDER_CACHE_MAX_ENTRY_BYTES
+    compressor = StreamCompressor(encoding) if encoding else None
+    pieces = []
+    encoded = []
+    size = 0
+    for chunk in get_quote_templates().stream_document(quote, quoter, theme, context):
+        data = chunk.encode("utf-8")
+        if pieces is not None:
+            pieces.append(chunk)
+            size += len(data)
+            if size > max_entry:
+                pieces = None
+        if compressor is not None:
+            data = compressor.compress(data)
+            encoded.append(data)
+        yield data
+
+    if compressor is not None:
+        data = compressor.finish()
+        encoded.append(data)
+        yield data
+
+    if pieces is not None:
+        cache.put(key, "".join(pieces))
+        if compressor is not None:
+            cache.put(encoded_render_key(key, encoding), b"".join(encoded))
+
+
+def render_quote_pdf(
+    quote: Quote, quoter: Quoter, theme: str = "blue", wait: Optional[float] = None
+) -> bytes:
+    """
+    渲染报价单PDF
+
+    Args:
+        quote: 报价单对象
+        quoter: 报价人对象
+        theme: 主题 (blue/gray/beige)
+        wait: 渲染队列已满时的等待秒数，默认立即返回503
+
+    Returns:
+        PDF字节
+    """
+    # 样式表和字体由渲染进程缓存，HTML不内嵌样式表，各主题共用同一份
+    html_content = get_render_cache().get_or_render(
+        make_render_key(quote, quoter, PDF_DOCUMENT_KEY),
+        lambda: get_quote_templates().render_document(
+            quote, quoter, context=get_document_context(quote, quoter), inline_styles=False
+        )
+    )
+
+    try:
+        return get_pdf_render_pool().render(html_content, wait=wait, theme=theme)
+    except PdfRenderBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF渲染繁忙，请稍后重试",
+            headers={"Retry-After": "5"}
+        )
+    except PdfRenderTimeout:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="PDF渲染超时"
+        )
+    except PdfRenderError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="PDF渲染失败"
+        )
+
+
+def build_quote_excel(quote: Quote, quoter: Quoter) -> bytes:
+    """
+    生成报价单Excel（支持通票、大客户、仓配价格表）
+
+    Args:
+        quote: 报价单对象
+        quoter: 报价人对象
+
+    Returns:
+        xlsx文件字节
+    """
+    try:
+        from app.services.quote_excel import get_quote_excel_builder
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Excel导出功能未安装"
+        )
+
+    return get_quote_excel_builder().build(quote, quoter)
+
+
+def build_quote_word(quote: Quote, quoter: Quoter) -> bytes:
+    """
+    生成报价单Word
+
+    Args:
+        quote: 报价单对象
+        quoter: 报价人对象
+
+    Returns:
+        docx文件字节
+    """
+    try:
+        from app.services.quote_word import get_quote_word_builder
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Word导出功能未安装"
+        )
+
+    return get_quote_word_builder().build(quote, quoter, get_document_context(quote, quoter))
+
+
+def render_export(
+    quote: Quote,
+    quoter: Quoter,
+    export_format: str,
     theme: str = "blue",
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    wait: Optional[float] = None
+) -> bytes:
+    """
+    渲染指定格式的导出文件
+
+    Args:
+        export_format: 导出格式 (pdf/excel/word/html)
+        wait: PDF渲染队列已满时的等待秒数
+
+    Returns:
+        文件字节
+    """
+    if export_format == "pdf":
+        return render_quote_pdf(quote, quoter, theme, wait=wait)
+    if export_format == "excel":
+        return build_quote_excel(quote, quoter)
+    if export_format == "word":
+        return build_quote_word(quote, quoter)
+    return render_quote_html_cached(quote, quoter, theme).encode("utf-8")
+
+
+def get_export_artifact(
+    db: Session,
+    quote: Quote,
+    quoter: Quoter,
+    export_format: str,
+    theme: str = "blue",
+    wait: Optional[float] = None
+) -> QuoteExport:
+    """
+    获取报价单当前版本的导出文件记录，不存在时渲染并保存
+    不区分主题的格式（Excel/Word）按空主题保存
+    """
+    artifact_theme = theme if EXPORT_FORMATS[export_format]["themed"] else ""
+    return get_artifact_store().get_or_create(
+        db, quote, export_format, artifact_theme,
+        lambda: render_export(quote, quoter, export_format, theme, wait=wait)
+    )
+
+
+def load_export(
+    quote: Quote,
+    quoter: Quoter,
+    export_format: str,
+    theme: str = "blue",
+    wait: Optional[float] = None
+) -> bytes:
+    """
+    获取导出文件内容（批量导出、后台任务使用）
+    已发送/已确认报价单的导出文件复用导出文件存储；
+    使用独立的数据库会话，可在工作线程中调用
+    """
+    if quote.status not in STORED_STATUSES:
+        return render_export(quote, quoter, export_format, theme, wait=wait)
+
+    db = SessionLocal()
+    try:
+        artifact = get_export_artifact(db, quote, quoter, export_format, theme, wait=wait)
+        return get_artifact_store().path_of(artifact).read_bytes()
+    finally:
+        db.close()
+
+
+def serve_export(
+    db: Session,
+    quote: Quote,
+    export_format: str,
+    theme: str,
+    render: Callable[[], bytes],
+    media_type: str,
+    filename: str,
+    disposition: str = "attachment",
+    headers: Optional[dict] = None,
+    accept_encoding: Optional[str] = None
 ):
     """
-    预览报价单HTML
+    返回导出文件
+    已发送/已确认的报价单从导出文件存储读取（首次渲染后落盘），草稿每次重新渲染
+
+    Args:
+        headers: 附加响应头（ETag等缓存验证头）
+        accept_encoding: 请求的 Accept-Encoding，存在压缩版本时直接发送压缩文件
     """
-    # 查询报价单
-    quote = db.query(Quote).filter(Quote.id == quote_id).first()
-    if not quote:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="报价单不存在"
+    if quote.status in STORED_STATUSES:
+        store = get_artifact_store()
+        artifact = store.get_or_create(db, quote, export_format, theme, render)
+        path, encoding = store.encoded_path(artifact.file_path, accept_encoding)
+        return FileResponse(
+            path,
+            media_type=media_type,
+            filename=filename,
+            content_disposition_type=disposition,
+            headers={**(headers or {}), **encoding_headers(encoding)}
         )
 
-    # 查询报价人
-    quoter = db.query(Quoter).filter(Quoter.id == quote.quoter_id).first()
+    # 草稿不保存，只按本次请求的编码压缩一次（压缩效果不明显时发送原文）
+    content = render()
+    encoding = negotiate(accept_encoding)
+    if encoding:
+        body = compress_variant(content, encoding)
+        if body is None:
+            encoding = None
+        else:
+            content = body
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={
+            **(headers or {}),
+            **encoding_headers(encoding),
+            "Content-Disposition": f"{disposition}; filename={filename}"
+        }
+    )
+
+
+def draft_render_key(quote_in: QuoteCreate, quoter: Quoter, theme: str) -> tuple:
+    """
+    未保存报价单的缓存键：请求内容的哈希代替报价单ID和版本
+    报价人位置与 make_render_key 一致，报价人更新时同样失效
+    """
+    body = json.dumps(quote_in.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return (DRAFT_PREVIEW_KEY, digest, quoter.id, quoter.updated_at, theme)
+
+
+@router.post("/preview", response_class=HTMLResponse)
+def preview_draft(
+    quote_in: QuoteCreate,
+    request: Request,
+    theme: str = Query("blue", pattern=THEME_PATTERN, description="主题 (blue/gray/beige)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    预览未保存的报价单HTML
+    创建/编辑向导中直接渲染表单内容，不写数据库；相同内容的结果带缓存
+    """
+    quoter = db.query(Quoter).filter(Quoter.id == quote_in.quoter_id).first()
     if not quoter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="报价人不存在"
         )
 
-    # 渲染HTML
-    html_content = render_quote_html(quote, quoter, theme)
+    def render() -> str:
+        # 临时对象，不加入会话
+        draft = Quote(
+            **quote_in.model_dump(),
+            quote_number=DRAFT_QUOTE_NUMBER,
+            expire_date=quote_in.quote_date + timedelta(days=quote_in.valid_days),
+            status=QuoteStatus.DRAFT
+        )
+        return render_quote_html(draft, quoter, theme)
+
+    cache = get_render_cache()
+    key = draft_render_key(quote_in, quoter, theme)
+    html_content = cache.get_or_render(key, render)
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return HTMLResponse(content=html_content, headers=encoding_headers(None))
+    return HTMLResponse(
+        content=cache.get_or_render(
+            encoded_render_key(key, encoding),
+            lambda: compress(html_content.encode("utf-8"), encoding)
+        ),
+        headers=encoding_headers(encoding)
+    )
+
+
+def serve_quote_html(
+    db: Session,
+    request: Request,
+    quote: Quote,
+    quoter: Quoter,
+    theme: str,
+    disposition: str = "attachment"
+):
+    """返回导出文件存储中的报价单HTML（不存在时渲染并保存）"""
+    return serve_export(
+        db, quote, "html", theme,
+        lambda: render_quote_html_cached(quote, quoter, theme).encode("utf-8"),
+        media_type="text/html; charset=utf-8",
+        filename=f"quote-{quote.quote_number}.html",
+        disposition=disposition,
+        headers=quote_headers(quote, quoter, f"html:{theme}"),
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
+
+@router.get("/quotes/{quote_id}/preview")
+def preview_quote(
+    quote_id: int,
+    request: Request,
+    theme: str = Query("blue", pattern=THEME_PATTERN, description="主题 (blue/gray/beige)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    预览报价单HTML
+    分块输出，大报价单无需等待整个文档渲染完成
+    """
+    # 内容未变化时只查询更新时间，直接返回304
+    not_modified = check_quote_not_modified(request, db, quote_id, f"html:{theme}")
+    if not_modified is not None:
+        return not_modified
+
+    # 查询报价单及报价人
+    quote, quoter = get_quote_and_quoter(db, quote_id)
+
+    # 已发送/已确认的报价单从导出文件存储读取（预渲染时已生成，含压缩版本）
+    if quote.status in STORED_STATUSES:
+        return serve_quote_html(db, request, quote, quoter, theme, disposition="inline")
 
-    return HTMLResponse(content=html_content)
+    get_document_context(quote, quoter)
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    return StreamingResponse(
+        stream_quote_html(quote, quoter, theme, encoding),
+        media_type="text/html; charset=utf-8",
+        headers={**quote_headers(quote, quoter, f"html:{theme}"), **encoding_headers(encoding)}
+    )
 
 
 @router.get("/quotes/{quote_id}/export/html")
 def export_html(
     quote_id: int,
-    theme: str = "blue",
+    request: Request,
+    theme: str = Query("blue", pattern=THEME_PATTERN, description="主题 (blue/gray/beige)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     导出HTML文件
     """
-    # 查询报价单
-    quote = db.query(Quote).filter(Quote.id == quote_id).first()
-    if not quote:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="报价单不存在"
-        )
+    # 内容未变化时只查询更新时间，直接返回304
+    not_modified = check_quote_not_modified(request, db, quote_id, f"html:{theme}")
+    if not_modified is not None:
+        return not_modified
 
-    # 查询报价人
-    quoter = db.query(Quoter).filter(Quoter.id == quote.quoter_id).first()
-    if not quoter:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="报价人不存在"
-        )
+    # 查询报价单及报价人
+    quote, quoter = get_quote_and_quoter(db, quote_id)
 
-    # 渲染HTML
-    html_content = render_quote_html(quote, quoter, theme)
+    # 已发送/已确认的报价单从导出文件存储读取（预渲染时已生成，含压缩版本）
+    if quote.status in STORED_STATUSES:
+        return serve_quote_html(db, request, quote, quoter, theme)
 
-    # 返回文件
+    get_document_context(quote, quoter)
+    encoding = negotiate(request.headers.get("accept-encoding"))
     return StreamingResponse(
-        BytesIO(html_content.encode('utf-8')),
-        media_type="text/html",
+        stream_quote_html(quote, quoter, theme, encoding),
+        media_type="text/html; charset=utf-8",
         headers={
+            **quote_headers(quote, quoter, f"html:{theme}"),
+            **encoding_headers(encoding),
             "Content-Disposition": f"attachment; filename=quote-{quote.quote_number}.html"
         }
     )
@@ -327,147 +605,454 @@ def export_html(
 @router.get("/quotes/{quote_id}/export/excel")
 def export_excel(
     quote_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     导出Excel文件
     """
-    try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-    except ImportError:
+    # 内容未变化时只查询更新时间，直接返回304
+    not_modified = check_quote_not_modified(request, db, quote_id, "excel")
+    if not_modified is not None:
+        return not_modified
+
+    # 查询报价单及报价人
+    quote, quoter = get_quote_and_quoter(db, quote_id)
+
+    return serve_export(
+        db, quote, "excel", "",
+        lambda: build_quote_excel(quote, quoter),
+        media_type=XLSX_MEDIA_TYPE,
+        filename=f"quote-{quote.quote_number}.xlsx",
+        headers=quote_headers(quote, quoter, "excel"),
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
+
+@router.get("/quotes/{quote_id}/export/word")
+def export_word(
+    quote_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    导出Word文件
+    基于预置的docx模板填充价格表和条款，便于客户编辑
+    """
+    # 内容未变化时只查询更新时间，直接返回304
+    not_modified = check_quote_not_modified(request, db, quote_id, "word")
+    if not_modified is not None:
+        return not_modified
+
+    # 查询报价单及报价人
+    quote, quoter = get_quote_and_quoter(db, quote_id)
+
+    return serve_export(
+        db, quote, "word", "",
+        lambda: build_quote_word(quote, quoter),
+        media_type=DOCX_MEDIA_TYPE,
+        filename=f"quote-{quote.quote_number}.docx",
+        headers=quote_headers(quote, quoter, "word"),
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
+
+@router.get("/quotes/{quote_id}/export/pdf")
+def export_pdf(
+    quote_id: int,
+    request: Request,
+    theme: str = Query("blue", pattern=THEME_PATTERN, description="主题 (blue/gray/beige)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    导出PDF文件
+    在独立的渲染进程池中使用WeasyPrint生成
+    """
+    # 内容未变化时只查询更新时间，直接返回304
+    not_modified = check_quote_not_modified(request, db, quote_id, f"pdf:{theme}")
+    if not_modified is not None:
+        return not_modified
+
+    # 查询报价单及报价人
+    quote, quoter = get_quote_and_quoter(db, quote_id)
+
+    return serve_export(
+        db, quote, "pdf", theme,
+        lambda: render_quote_pdf(quote, quoter, theme),
+        media_type="application/pdf",
+        filename=f"quote-{quote.quote_number}.pdf",
+        disposition="inline",
+        headers=quote_headers(quote, quoter, f"pdf:{theme}"),
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
+
+@router.post(
+    "/quotes/{quote_id}/share",
+    response_model=ShareLinkResponse,
+    status_code=status.HTTP_201_CREATED
+)
+def create_share_link(
+    quote_id: int,
+    share_in: ShareLinkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    创建报价单分享链接（带签名和有效期，无需登录即可打开）
+    创建时生成导出文件；客户打开时查找报价单当前版本的导出文件，由nginx直接发送
+    """
+    quote, quoter = get_quote_and_quoter(db, quote_id)
+    if quote.status not in STORED_STATUSES:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Excel导出功能未安装"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="只能分享已发送或已确认的报价单"
         )
 
-    # 查询报价单
-    quote = db.query(Quote).filter(Quote.id == quote_id).first()
-    if not quote:
+    # 提前生成导出文件；链接不固定文件，打开时按报价单当前版本查找
+    get_export_artifact(
+        db, quote, quoter, share_in.export_format, share_in.theme,
+        wait=get_pdf_render_pool().timeout
+    )
+    expires_delta = timedelta(hours=share_in.expires_in)
+    token = create_share_token({
+        "quote_id": quote.id,
+        "format": share_in.export_format,
+        "theme": share_in.theme,
+    }, expires_delta)
+    return {
+        "url": f"/api/v1/share/{token}",
+        "expires_at": datetime.utcnow() + expires_delta,
+    }
+
+
+def check_bulk_export(db: Session, filters: dict) -> int:
+    """
+    检查批量导出数量
+
+    Returns:
+        符合条件的报价单数
+
+    Raises:
+        HTTPException: 没有符合条件的报价单或超过上限
+    """
+    total = apply_quote_filters(db.query(func.count(Quote.id)), **filters).scalar()
+    if not total:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="报价单不存在"
+            detail="没有符合条件的报价单"
         )
 
-    # 查询报价人
-    quoter = db.query(Quoter).filter(Quoter.id == quote.quoter_id).first()
-
-    # 创建工作簿
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "报价单"
-
-    # 标题
-    ws['A1'] = f"报价单编号: {quote.quote_number}"
-    ws['A1'].font = Font(size=14, bold=True)
-
-    # 基本信息
-    row = 3
-    ws[f'A{row}'] = "客户名称:"
-    ws[f'B{row}'] = quote.customer_name
-    row += 1
-    ws[f'A{row}'] = "联系人:"
-    ws[f'B{row}'] = quote.contact_person
-    row += 1
-    ws[f'A{row}'] = "联系电话:"
-    ws[f'B{row}'] = quote.contact_phone
-    row += 1
-    ws[f'A{row}'] = "报价日期:"
-    ws[f'B{row}'] = str(quote.quote_date)
-    row += 1
-    ws[f'A{row}'] = "有效期至:"
-    ws[f'B{row}'] = str(quote.expire_date)
-    row += 1
-    ws[f'A{row}'] = "报价人:"
-    ws[f'B{row}'] = f"{quoter.name} ({quoter.phone})" if quoter else ""
-
-    # 价格表
-    row += 2
-    ws[f'A{row}'] = "价格明细"
-    ws[f'A{row}'].font = Font(size=12, bold=True)
-
-    row += 1
-    if quote.template_type == "TONGPIAO":
-        # 表头
-        headers = ['区域', '省份', '首重(元/KG)', '续重(元/KG)', '时效']
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-
-        # 数据
-        for region in quote.price_data.get("regions", []):
-            row += 1
-            ws.cell(row=row, column=1, value=region.get('regionName', ''))
-            ws.cell(row=row, column=2, value='、'.join(region.get('provinces', [])))
-            ws.cell(row=row, column=3, value=region.get('firstWeight', 0))
-            ws.cell(row=row, column=4, value=region.get('additionalWeight', 0))
-            ws.cell(row=row, column=5, value=region.get('remark', ''))
-
-    # 调整列宽
-    ws.column_dimensions['A'].width = 15
-    ws.column_dimensions['B'].width = 30
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 15
-    ws.column_dimensions['E'].width = 20
-
-    # 保存到内存
-    excel_file = BytesIO()
-    wb.save(excel_file)
-    excel_file.seek(0)
-
-    # 返回文件
+    max_quotes = get_settings().BULK_EXPORT_MAX_QUOTES
+    if total > max_quotes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"导出数量({total})超过上限{max_quotes}，请缩小筛选范围"
+        )
+    return total
+
+
+def iter_bulk_export(
+    filters: dict,
+    export_format: str,
+    theme: str,
+    on_entry: Optional[Callable[[], None]] = None
+) -> Iterator[bytes]:
+    """
+    批量导出ZIP数据流
+    按创建时间倒序分批读取报价单，并行渲染后依次写入ZIP；
+    单个报价单渲染失败时写入错误说明，不中断整个下载
+
+    Args:
+        on_entry: 每渲染完一个报价单时回调（用于进度统计）
+    """
+    settings = get_settings()
+    ext = EXPORT_FORMATS[export_format]["ext"]
+    pdf_wait = get_pdf_render_pool().timeout
+
+    def render(quote: Quote) -> Tuple[str, bytes]:
+        try:
+            content = load_export(quote, quote.quoter, export_format, theme, wait=pdf_wait)
+            entry = f"quote-{quote.quote_number}.{ext}", content
+        except HTTPException as exc:
+            entry = f"quote-{quote.quote_number}.error.txt", str(exc.detail).encode("utf-8")
+        if on_entry:
+            on_entry()
+        return entry
+
+    # 响应流式发送期间请求依赖的会话已关闭，这里使用独立会话
+    db = SessionLocal()
+    try:
+        quotes = apply_quote_filters(
+            db.query(Quote).options(joinedload(Quote.quoter)), **filters
+        ).order_by(Quote.created_at.desc()).yield_per(50)
+
+        yield from stream_zip(render_ahead(
+            quotes, render,
+            workers=settings.BULK_EXPORT_WORKERS,
+            lookahead=settings.BULK_EXPORT_LOOKAHEAD
+        ))
+    finally:
+        db.close()
+
+
+@router.get("/quotes/bulk")
+def export_bulk(
+    export_format: str = Query("pdf", alias="format", pattern=EXPORT_FORMAT_PATTERN, description="导出格式: pdf/excel/word/html"),
+    theme: str = Query("blue", pattern=THEME_PATTERN, description="主题 (blue/gray/beige)"),
+    customer_name: Optional[str] = Query(None, description="客户名称搜索"),
+    contact_phone: Optional[str] = Query(None, description="联系电话搜索"),
+    quote_status: Optional[QuoteStatus] = Query(None, alias="status", description="状态筛选"),
+    start_date: Optional[date] = Query(None, description="开始日期"),
+    end_date: Optional[date] = Query(None, description="结束日期"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    批量导出报价单为ZIP
+    筛选条件与报价单列表相同，边渲染边下载
+    """
+    filters = check_quote_filters({
+        "customer_name": customer_name,
+        "contact_phone": contact_phone,
+        "status": quote_status,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
+
+    check_bulk_export(db, filters)
+
+    filename = f"quotes-{date.today().strftime('%Y%m%d')}.zip"
     return StreamingResponse(
-        excel_file,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        iter_bulk_export(filters, export_format, theme),
+        media_type="application/zip",
         headers={
-            "Content-Disposition": f"attachment; filename=quote-{quote.quote_number}.xlsx"
+            "Content-Disposition": f"attachment; filename={filename}"
         }
     )
 
 
-@router.get("/quotes/{quote_id}/export/pdf")
-def export_pdf(
-    quote_id: int,
-    theme: str = "blue",
-    db: Session = Depends(get_db),
+def iter_quote_report(filters: dict) -> Iterator[bytes]:
+    """
+    报价单汇总表Excel数据流
+
+    使用服务端游标分批读取投影列，openpyxl write_only 模式逐行写入临时文件，
+    内存占用与行数无关；生成完毕后分块发送
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("报价单汇总")
+    for index, (_, _, width) in enumerate(REPORT_COLUMNS, start=1):
+        ws.column_dimensions[get_column_letter(index)].width = width
+    ws.freeze_panes = "A2"
+
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+    header = []
+    for title, _, _ in REPORT_COLUMNS:
+        cell = WriteOnlyCell(ws, value=title)
+        cell.font = header_font
+        cell.fill = header_fill
+        header.append(cell)
+    ws.append(header)
+
+    columns = [column for _, column, _ in REPORT_COLUMNS]
+    keys = [column.key for column in columns]
+    tax_index = keys.index("is_tax_included")
+    status_index = keys.index("status")
+
+    # 响应流式发送期间请求依赖的会话已关闭，这里使用独立会话
+    db = SessionLocal()
+    try:
+        rows = apply_quote_filters(
+            db.query(*columns).outerjoin(Quoter, Quote.quoter_id == Quoter.id),
+            **filters
+        ).order_by(Quote.created_at.desc()).yield_per(REPORT_BATCH_SIZE)
+
+        for row in rows:
+            row = list(row)
+            row[tax_index] = "是" if row[tax_index] else "否"
+            row[status_index] = QUOTE_STATUS_LABELS.get(row[status_index], row[status_index])
+            ws.append(row)
+    finally:
+        db.close()
+
+    with tempfile.TemporaryFile() as f:
+        wb.save(f)
+        f.seek(0)
+        while True:
+            chunk = f.read(REPORT_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+@router.get("/quotes/report.xlsx")
+def export_quote_report(
+    customer_name: Optional[str] = Query(None, description="客户名称搜索"),
+    contact_phone: Optional[str] = Query(None, description="联系电话搜索"),
+    quote_status: Optional[QuoteStatus] = Query(None, alias="status", description="状态筛选"),
+    start_date: Optional[date] = Query(None, description="开始日期"),
+    end_date: Optional[date] = Query(None, description="结束日期"),
     current_user: User = Depends(get_current_user)
 ):
     """
-    导出PDF文件
-    注意: 需要在Docker环境中使用WeasyPrint生成真实PDF
-    当前返回HTML预览
+    导出报价单汇总表Excel
+    筛选条件与报价单列表相同，不限制行数
     """
-    # 查询报价单
-    quote = db.query(Quote).filter(Quote.id == quote_id).first()
-    if not quote:
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="报价单不存在"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Excel导出功能未安装"
         )
 
-    # 查询报价人
-    quoter = db.query(Quoter).filter(Quoter.id == quote.quoter_id).first()
-    if not quoter:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="报价人不存在"
+    filters = check_quote_filters({
+        "customer_name": customer_name,
+        "contact_phone": contact_phone,
+        "status": quote_status,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
+
+    filename = f"quote-report-{date.today().strftime('%Y%m%d')}.xlsx"
+    return StreamingResponse(
+        iter_quote_report(filters),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
+        }
+    )
+
+
+def feed_value(value):
+    """数据接口字段值转换为可序列化的形式"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def iter_quote_feed(
+    filters: dict,
+    feed_format: str,
+    include_prices: bool,
+    updated_since: Optional[datetime]
+) -> Iterator[bytes]:
+    """
+    报价单数据流（CSV / NDJSON）
+
+    单次查询通过服务端游标分批读取，按 (updated_at, id) 升序输出，
+    攒够一块再发送，内存占用与数据量无关。
+    包含价格时：CSV每条价格明细一行（报价单字段重复），NDJSON增加 price_items 数组
+    """
+    columns = list(FEED_COLUMNS)
+    if include_prices:
+        columns.append(Quote.price_data)
+    fields = [column.key for column in FEED_COLUMNS]
+    price_fields = [f"price_{field}" for field in PRICE_ITEM_FIELDS]
+
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    if feed_format == "csv":
+        writer.writerow(fields + price_fields if include_prices else fields)
+
+    # 响应流式发送期间请求依赖的会话已关闭，这里使用独立会话
+    db = SessionLocal()
+    try:
+        query = apply_quote_filters(
+            db.query(*columns).outerjoin(Quoter, Quote.quoter_id == Quoter.id),
+            **filters
         )
+        if updated_since:
+            query = query.filter(Quote.updated_at >= updated_since)
+        rows = query.order_by(Quote.updated_at, Quote.id).yield_per(REPORT_BATCH_SIZE)
+
+        for row in rows:
+            values = [feed_value(value) for value in row[:len(fields)]]
+            price_items = list(iter_price_items(row.price_data)) if include_prices else None
 
-    # 渲染HTML
-    html_content = render_quote_html(quote, quoter, theme)
+            if feed_format == "ndjson":
+                record = dict(zip(fields, values))
+                if include_prices:
+                    record["price_items"] = price_items
+                buffer.write(json.dumps(record, ensure_ascii=False))
+                buffer.write("\n")
+            elif include_prices and price_items:
+                for item in price_items:
+                    writer.writerow(values + [item[field] for field in PRICE_ITEM_FIELDS])
+            elif include_prices:
+                writer.writerow(values + [None] * len(price_fields))
+            else:
+                writer.writerow(values)
 
-    # TODO: 在Docker环境中使用WeasyPrint转换为PDF
-    # from weasyprint import HTML
-    # pdf_bytes = HTML(string=html_content).write_pdf()
-    # return StreamingResponse(BytesIO(pdf_bytes), media_type="application/pdf")
+            if buffer.tell() >= REPORT_CHUNK_SIZE:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+    finally:
+        db.close()
 
-    # 当前返回HTML（浏览器可以打印为PDF）
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+@router.get("/quotes/feed")
+def export_quote_feed(
+    feed_format: str = Query("ndjson", alias="format", pattern="^(csv|ndjson)$", description="输出格式: csv/ndjson"),
+    include_prices: bool = Query(False, description="是否包含展开的价格明细"),
+    updated_since: Optional[datetime] = Query(None, description="只返回该时间之后更新的报价单（增量同步）"),
+    customer_name: Optional[str] = Query(None, description="客户名称搜索"),
+    contact_phone: Optional[str] = Query(None, description="联系电话搜索"),
+    quote_status: Optional[QuoteStatus] = Query(None, alias="status", description="状态筛选"),
+    start_date: Optional[date] = Query(None, description="开始日期"),
+    end_date: Optional[date] = Query(None, description="结束日期"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    报价单数据接口（供BI等下游系统同步）
+    一次请求流式返回全部符合条件的报价单，按更新时间升序；
+    增量同步时传入上次同步的最大 updated_at
+    """
+    filters = check_quote_filters({
+        "customer_name": customer_name,
+        "contact_phone": contact_phone,
+        "status": quote_status,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
+
+    filename = f"quotes-{date.today().strftime('%Y%m%d')}.{feed_format}"
     return StreamingResponse(
-        BytesIO(html_content.encode('utf-8')),
-        media_type="text/html",
+        iter_quote_feed(filters, feed_format, include_prices, updated_since),
+        media_type=FEED_MEDIA_TYPES[feed_format],
         headers={
-            "Content-Disposition": f"inline; filename=quote-{quote.quote_number}.html"
+            "Content-Disposition": f"attachment; filename={filename}"
         }
     )
+
+
+@router.get("/stats")
+def export_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_admin)
+):
+    """
+    导出统计（仅管理员）
+    当前进程的准入控制（并发、排队、等待时间）、渲染缓存命中情况、预渲染情况、导出文件存储占用
+    """
+    return {
+        "admission": get_render_admission().stats(),
+        "render_cache": get_render_cache().stats(),
+        "prerender": get_prerenderer().stats(),
+        "artifact_store": get_artifact_store().usage(db),
+    }
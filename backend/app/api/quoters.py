@@ -2,21 +2,28 @@
 报价人管理API
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.quoter import Quoter
 from app.models.user import User
 from app.schemas.quoter import QuoterCreate, QuoterUpdate, QuoterResponse
 from app.api.auth import get_current_user
+from app.services.render_cache import get_render_cache
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/api/v1/quoters", tags=["报价人管理"])
 
+# 列表排序键（组合索引 ix_quoters_sort_order_created_at_id）
+QUOTER_LIST_ORDER = (Quoter.sort_order, Quoter.created_at, Quoter.id)
+
 
 @router.get("", response_model=List[QuoterResponse])
 def list_quoters(
+    response: Response,
     skip: int = Query(0, ge=0, description="跳过的记录数"),
     limit: int = Query(100, ge=1, le=100, description="返回的记录数"),
+    cursor: Optional[str] = Query(None, description="分页游标（上一页响应头 X-Next-Cursor），传入时忽略skip"),
     name: Optional[str] = Query(None, description="姓名搜索"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -28,12 +35,11 @@ def list_quoters(
     if name:
         query = query.filter(Quoter.name.ilike(f"%{name}%"))
 
-    # 按sort_order和创建时间排序
-    query = query.order_by(Quoter.sort_order, Quoter.created_at)
-
-    # 分页
-    quoters = query.offset(skip).limit(limit).all()
-    return quoters
+    # 按sort_order和创建时间排序分页
+    return paginate(
+        query, QUOTER_LIST_ORDER, limit,
+        cursor=cursor, skip=skip, response=response
+    )
 
 
 @router.post("", response_model=QuoterResponse, status_code=status.HTTP_201_CREATED)
@@ -104,6 +110,7 @@ def update_quoter(
         setattr(quoter, field, value)
 
     db.commit()
+    get_render_cache().invalidate_quoter(quoter_id)
     db.refresh(quoter)
     return quoter
 
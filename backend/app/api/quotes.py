@@ -2,9 +2,9 @@
 报价单管理API
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, Integer
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 from datetime import date, timedelta
 from app.database import get_db
 from app.models.quote import Quote, QuoteStatus
@@ -13,36 +13,79 @@ from app.models.quoter import Quoter
 from app.models.user import User
 from app.schemas.quote import (
     QuoteCreate, QuoteUpdate, QuoteResponse, QuoteListItem,
-    QuoteStatusUpdate, NextQuoteNumber
+    QuoteStatusUpdate, NextQuoteNumber, QuoteSummary
 )
 from app.api.auth import get_current_user
+from app.services.render_cache import get_render_cache
+from app.services.artifact_store import get_artifact_store, STORED_STATUSES
+from app.services.prerender import schedule_prerender
+from app.services.quote_numbers import reserve_quote_numbers, peek_quote_number
+from app.services.quote_search import apply_keyword_filters, normalize_keyword
+from app.utils.http_cache import check_quote_not_modified, quote_headers
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/api/v1/quotes", tags=["报价单管理"])
 
+# 列表排序键（组合索引 ix_quotes_created_at_id）
+QUOTE_LIST_ORDER = (Quote.created_at, Quote.id)
+
+# 列表投影列（QuoteListItem 的字段），不读取价格数据、条款等JSON列
+QUOTE_LIST_COLUMNS = (
+    Quote.id,
+    Quote.quote_number,
+    Quote.customer_name,
+    Quote.contact_person,
+    Quote.contact_phone,
+    Quote.quote_date,
+    Quote.expire_date,
+    Quote.status,
+    Quote.created_at,
+)
+
 
 def generate_quote_number(db: Session, quote_date: date) -> str:
     """
     生成报价单编号
-    格式: ZTO-JCYB-{YYYYMMDD}-{序号}
+    格式: ZTO-JCYB-{YYYYMMDD}-{序号}，序号由当天的计数行原子分配（见 reserve_quote_numbers）
     """
-    date_str = quote_date.strftime("%Y%m%d")
-
-    # 查询当天已有的最大序号
-    # 从quote_number字段提取序号部分（最后两位）
-    # PostgreSQL substring是1-based，ZTO-JCYB-20251230-01中01在第19-20位
-    max_seq = db.query(
-        func.max(
-            func.cast(
-                func.substring(Quote.quote_number, 19, 2),
-                Integer
-            )
-        )
-    ).filter(
-        Quote.quote_number.like(f"ZTO-JCYB-{date_str}-%")
-    ).scalar() or 0
+    return reserve_quote_numbers(db, quote_date)[0]
+
+
+def apply_quote_filters(
+    query,
+    customer_name: Optional[str] = None,
+    contact_phone: Optional[str] = None,
+    status: Optional[QuoteStatus] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+):
+    """
+    应用报价单列表筛选条件
+    列表、批量导出等接口共用
+
+    Raises:
+        HTTPException: 搜索关键字短于最小长度
+    """
+    query = apply_keyword_filters(query, customer_name, contact_phone)
+    if status:
+        query = query.filter(Quote.status == status)
+    if start_date:
+        query = query.filter(Quote.quote_date >= start_date)
+    if end_date:
+        query = query.filter(Quote.quote_date <= end_date)
+    return query
 
-    seq = max_seq + 1
-    return f"ZTO-JCYB-{date_str}-{seq:02d}"
+
+def check_quote_filters(filters: dict) -> dict:
+    """
+    校验筛选条件中的搜索关键字
+    流式导出在响应开始前调用，关键字过短时直接返回400，而不是在数据流中途出错
+    """
+    return {
+        **filters,
+        "customer_name": normalize_keyword(filters.get("customer_name"), "客户名称"),
+        "contact_phone": normalize_keyword(filters.get("contact_phone"), "联系电话"),
+    }
 
 
 @router.get("/number/next", response_model=NextQuoteNumber)
@@ -55,17 +98,39 @@ def get_next_quote_number(
     if not quote_date:
         quote_date = date.today()
 
-    quote_number = generate_quote_number(db, quote_date)
+    # 只读取计数，不占用编号
+    quote_number = peek_quote_number(db, quote_date)
     return {
         "quote_number": quote_number,
         "quote_date": quote_date
     }
 
 
+@router.get("/summary", response_model=QuoteSummary)
+def get_quote_summary(
+    recent_limit: int = Query(5, ge=1, le=20, description="最近报价单数量"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """获取报价单概览：各状态数量和最近创建的报价单"""
+    counts = dict(db.query(Quote.status, func.count(Quote.id)).group_by(Quote.status).all())
+    status_counts = {quote_status: counts.get(quote_status, 0) for quote_status in QuoteStatus}
+    recent = db.query(*QUOTE_LIST_COLUMNS).order_by(
+        *(column.desc() for column in QUOTE_LIST_ORDER)
+    ).limit(recent_limit).all()
+    return {
+        "total": sum(status_counts.values()),
+        "status_counts": status_counts,
+        "recent": recent
+    }
+
+
 @router.get("", response_model=List[QuoteListItem])
 def list_quotes(
+    response: Response,
     skip: int = Query(0, ge=0, description="跳过的记录数"),
     limit: int = Query(100, ge=1, le=100, description="返回的记录数"),
+    cursor: Optional[str] = Query(None, description="分页游标（上一页响应头 X-Next-Cursor），传入时忽略skip"),
     customer_name: Optional[str] = Query(None, description="客户名称搜索"),
     contact_phone: Optional[str] = Query(None, description="联系电话搜索"),
     status: Optional[QuoteStatus] = Query(None, description="状态筛选"),
@@ -75,26 +140,20 @@ def list_quotes(
     current_user: User = Depends(get_current_user)
 ):
     """获取报价单列表"""
-    query = db.query(Quote)
-
-    # 应用筛选条件
-    if customer_name:
-        query = query.filter(Quote.customer_name.ilike(f"%{customer_name}%"))
-    if contact_phone:
-        query = query.filter(Quote.contact_phone.ilike(f"%{contact_phone}%"))
-    if status:
-        query = query.filter(Quote.status == status)
-    if start_date:
-        query = query.filter(Quote.quote_date >= start_date)
-    if end_date:
-        query = query.filter(Quote.quote_date <= end_date)
-
-    # 按创建时间倒序
-    query = query.order_by(Quote.created_at.desc())
+    query = apply_quote_filters(
+        db.query(*QUOTE_LIST_COLUMNS),
+        customer_name=customer_name,
+        contact_phone=contact_phone,
+        status=status,
+        start_date=start_date,
+        end_date=end_date
+    )
 
-    # 分页
-    quotes = query.offset(skip).limit(limit).all()
-    return quotes
+    # 按创建时间倒序分页
+    return paginate(
+        query, QUOTE_LIST_ORDER, limit,
+        cursor=cursor, skip=skip, descending=True, response=response
+    )
 
 
 @router.post("", response_model=QuoteResponse, status_code=status.HTTP_201_CREATED)
@@ -151,16 +210,29 @@ def create_quote(
 @router.get("/{quote_id}", response_model=QuoteResponse)
 def get_quote(
     quote_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """获取报价单详情"""
-    quote = db.query(Quote).filter(Quote.id == quote_id).first()
+    """
+    获取报价单详情
+    支持 If-None-Match / If-Modified-Since，未修改时返回304且不加载价格数据
+    """
+    not_modified = check_quote_not_modified(request, db, quote_id, "json")
+    if not_modified is not None:
+        return not_modified
+
+    quote = db.query(Quote).options(
+        joinedload(Quote.quoter)
+    ).filter(Quote.id == quote_id).first()
     if not quote:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="报价单不存在"
         )
+
+    response.headers.update(quote_headers(quote, quote.quoter, "json"))
     return quote
 
 
@@ -201,6 +273,10 @@ def update_quote(
         setattr(quote, field, value)
 
     db.commit()
+    get_render_cache().invalidate_quote(quote_id)
+    # 已发出的报价单修改后重新生成导出文件
+    if quote.status in STORED_STATUSES:
+        schedule_prerender(quote_id)
     db.refresh(quote)
     return quote
 
@@ -222,6 +298,10 @@ def update_quote_status(
 
     quote.status = status_in.status
     db.commit()
+    get_render_cache().invalidate_quote(quote_id)
+    # 发出后客户通常很快下载，后台预先生成导出文件，不阻塞本次请求
+    if status_in.status in STORED_STATUSES:
+        schedule_prerender(quote_id)
     db.refresh(quote)
     return quote
 
@@ -289,6 +369,10 @@ def delete_quote(
             detail="报价单不存在"
         )
 
+    # 先删除导出文件记录及磁盘文件
+    get_artifact_store().purge_quote(db, quote_id)
+
     db.delete(quote)
     db.commit()
+    get_render_cache().invalidate_quote(quote_id)
     return None
@@ -0,0 +1,118 @@
+"""
+报价单分享API
+客户通过带签名的链接查看报价单，无需登录；
+链接只指定报价单、格式和主题，每次打开时查找报价单当前版本的导出文件，
+文件由nginx通过 X-Accel-Redirect 直接发送
+"""
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.api.exports import EXPORT_FORMATS, get_quote_and_quoter, get_export_artifact
+from app.services.artifact_store import get_artifact_store, STORED_STATUSES
+from app.services.compression import encoding_headers
+from app.services.pdf_renderer import get_pdf_render_pool
+from app.services.render_admission import get_render_admission, RenderRejected
+from app.utils.security import decode_share_token
+
+router = APIRouter(prefix="/api/v1/share", tags=["报价单分享"])
+
+# 客户端缓存时间(秒)：报价单修改后，已打开过链接的客户最多在该时间后看到新版本
+SHARE_MAX_AGE = 300
+
+
+def resolve_share_artifact(payload: dict, render: bool) -> Tuple[str, Optional[str]]:
+    """
+    查找分享报价单当前版本的导出文件
+
+    Args:
+        render: 不存在时是否渲染并保存；为False时只查找
+
+    Returns:
+        (报价单编号, 文件相对路径)，未渲染时路径为None
+
+    Raises:
+        HTTPException: 报价单已删除或已改回草稿
+    """
+    db = SessionLocal()
+    try:
+        quote, quoter = get_quote_and_quoter(db, payload["quote_id"])
+        if quote.status not in STORED_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="报价单不存在或未发出"
+            )
+
+        export_format = payload["format"]
+        if render:
+            artifact = get_export_artifact(
+                db, quote, quoter, export_format, payload["theme"],
+                wait=get_pdf_render_pool().timeout
+            )
+        else:
+            artifact_theme = payload["theme"] if EXPORT_FORMATS[export_format]["themed"] else ""
+            artifact = get_artifact_store().lookup(db, quote, export_format, artifact_theme)
+        return quote.quote_number, artifact.file_path if artifact is not None else None
+    finally:
+        db.close()
+
+
+@router.get("/{token}")
+async def open_share_link(token: str, request: Request):
+    """
+    打开分享链接
+    签名有效时返回 X-Accel-Redirect，由nginx发送文件（gzip_static 选择压缩版本）；
+    未配置nginx时由应用按 Accept-Encoding 直接发送原文件或压缩版本
+
+    当前版本的导出文件不存在（报价单已修改或文件已淘汰）时重新渲染，渲染受导出准入控制
+    """
+    payload = decode_share_token(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="分享链接无效或已过期"
+        )
+
+    quote_number, relative_path = await run_in_threadpool(resolve_share_artifact, payload, False)
+    if relative_path is None:
+        admission = get_render_admission()
+        try:
+            await admission.acquire()
+        except RenderRejected:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="导出繁忙，请稍后重试",
+                headers={"Retry-After": str(get_settings().RENDER_RETRY_AFTER)}
+            )
+        try:
+            quote_number, relative_path = await run_in_threadpool(resolve_share_artifact, payload, True)
+        finally:
+            admission.release()
+
+    export_format = EXPORT_FORMATS[payload["format"]]
+    headers = {
+        "Content-Disposition": f"inline; filename=quote-{quote_number}.{export_format['ext']}",
+        "Cache-Control": f"private, max-age={SHARE_MAX_AGE}",
+    }
+
+    accel_prefix = get_settings().SHARE_ACCEL_REDIRECT_PREFIX
+    if accel_prefix:
+        return Response(
+            media_type=export_format["media_type"],
+            headers={
+                **headers,
+                "X-Accel-Redirect": f"{accel_prefix.rstrip('/')}/{relative_path}",
+            }
+        )
+
+    store = get_artifact_store()
+    path, encoding = store.encoded_path(relative_path, request.headers.get("accept-encoding"))
+    return FileResponse(
+        path,
+        media_type=export_format["media_type"],
+        headers={**headers, **encoding_headers(encoding)}
+    )
@@ -2,28 +2,47 @@
 价格模板管理API
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.template import Template, TemplateType
 from app.models.user import User
-from app.schemas.template import TemplateCreate, TemplateUpdate, TemplateResponse
+from app.schemas.template import TemplateCreate, TemplateUpdate, TemplateResponse, TemplateListItem
 from app.api.auth import get_current_user
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/api/v1/templates", tags=["模板管理"])
 
+# 列表排序键（组合索引 ix_templates_created_at_id）
+TEMPLATE_LIST_ORDER = (Template.created_at, Template.id)
 
-@router.get("", response_model=List[TemplateResponse])
+# 不含模板数据的列表投影列（模板管理页只展示名称、类型等，编辑时再读取详情）
+TEMPLATE_LIST_COLUMNS = (
+    Template.id,
+    Template.name,
+    Template.template_type,
+    Template.description,
+    Template.is_default,
+    Template.is_active,
+    Template.created_at,
+    Template.updated_at,
+)
+
+
+@router.get("", response_model=List[TemplateListItem])
 def list_templates(
+    response: Response,
     skip: int = Query(0, ge=0, description="跳过的记录数"),
     limit: int = Query(100, ge=1, le=100, description="返回的记录数"),
+    cursor: Optional[str] = Query(None, description="分页游标（上一页响应头 X-Next-Cursor），传入时忽略skip"),
     template_type: Optional[TemplateType] = Query(None, description="模板类型筛选"),
     is_active: Optional[bool] = Query(True, description="是否激活"),
+    include_data: bool = Query(True, description="是否返回模板数据，为false时不读取template_data列"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """获取模板列表"""
-    query = db.query(Template)
+    query = db.query(Template) if include_data else db.query(*TEMPLATE_LIST_COLUMNS)
 
     # 应用筛选条件
     if template_type:
@@ -31,12 +50,11 @@ def list_templates(
     if is_active is not None:
         query = query.filter(Template.is_active == is_active)
 
-    # 按创建时间倒序
-    query = query.order_by(Template.created_at.desc())
-
-    # 分页
-    templates = query.offset(skip).limit(limit).all()
-    return templates
+    # 按创建时间倒序分页
+    return paginate(
+        query, TEMPLATE_LIST_ORDER, limit,
+        cursor=cursor, skip=skip, descending=True, response=response
+    )
 
 
 @router.post("", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
@@ -2,21 +2,27 @@
 用户管理API
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.api.auth import get_current_active_admin
 from app.utils.security import get_password_hash
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/api/v1/users", tags=["用户管理"])
 
+# 列表排序键（组合索引 ix_users_created_at_id）
+USER_LIST_ORDER = (User.created_at, User.id)
+
 
 @router.get("", response_model=List[UserResponse])
 def list_users(
+    response: Response,
     skip: int = Query(0, ge=0, description="跳过的记录数"),
     limit: int = Query(100, ge=1, le=100, description="返回的记录数"),
+    cursor: Optional[str] = Query(None, description="分页游标（上一页响应头 X-Next-Cursor），传入时忽略skip"),
     username: Optional[str] = Query(None, description="用户名搜索"),
     role: Optional[UserRole] = Query(None, description="角色筛选"),
     is_active: Optional[bool] = Query(None, description="是否激活"),
@@ -34,9 +40,11 @@ def list_users(
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
 
-    # 分页
-    users = query.offset(skip).limit(limit).all()
-    return users
+    # 按创建时间倒序分页
+    return paginate(
+        query, USER_LIST_ORDER, limit,
+        cursor=cursor, skip=skip, descending=True, response=response
+    )
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -38,6 +38,55 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     UPLOAD_DIR: str = "uploads"
 
+    # 进程配置
+    WEB_CONCURRENCY: int = 1  # uvicorn进程数（uvicorn读取同名环境变量作为 --workers 默认值）
+
+    # PDF渲染配置
+    PDF_RENDER_WORKERS: int = 0  # 每个进程的渲染进程数，0表示CPU核数 / WEB_CONCURRENCY
+    PDF_RENDER_QUEUE_SIZE: int = 8  # 等待队列长度（不含正在渲染的任务）
+    PDF_RENDER_TIMEOUT: int = 30  # 单次渲染超时(秒)，从开始渲染时计算
+    PDF_RENDER_QUEUE_TIMEOUT: int = 30  # 排队等待空闲渲染进程的最长秒数，超时返回503
+    PDF_RENDER_MAX_TASKS_PER_CHILD: int = 50  # 每个进程渲染N次后回收，限制内存增长
+    PDF_FONT_FILE: str = ""  # 中文字体文件路径（如微软雅黑），为空时使用系统字体
+
+    # 导出准入控制（每个进程）
+    RENDER_MAX_CONCURRENT: int = 4  # 同时执行的导出请求数
+    RENDER_QUEUE_SIZE: int = 8  # 排队等待的请求数，超出直接返回503
+    RENDER_QUEUE_TIMEOUT: float = 10  # 排队最长等待(秒)
+    RENDER_RETRY_AFTER: int = 5  # 503响应的Retry-After(秒)
+
+    # 渲染缓存配置
+    RENDER_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+    RENDER_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024  # 流式输出的HTML超过该大小时不写入缓存
+
+    # 导出文件存储配置（存放于 UPLOAD_DIR/exports）
+    EXPORT_STORE_QUOTA_BYTES: int = 1024 * 1024 * 1024  # 1GB
+    EXPORT_STORE_EVICT_INTERVAL: int = 600  # 淘汰任务执行间隔(秒)
+
+    # 预渲染配置（报价单发出后在后台生成默认主题的导出文件）
+    PRERENDER_FORMATS: list[str] = ["pdf", "excel", "word", "html"]  # 为空时不预渲染
+    PRERENDER_WORKERS: int = 1  # 预渲染线程数，限制占用的PDF渲染进程
+
+    # 分享链接配置
+    SHARE_ACCEL_REDIRECT_PREFIX: str = ""  # nginx内部location前缀（如 /protected-exports/），为空时由应用直接发送文件
+
+    # 报价单搜索配置
+    QUOTE_SEARCH_MIN_LENGTH: int = 3  # 客户名称/联系电话搜索关键字最小长度（三元组索引要求至少3个字符）
+    QUOTE_SEARCH_MIN_LENGTH_CJK: int = 2  # 含中文的关键字最小长度（2字简称不走索引，按ILIKE扫描）
+
+    # 批量导出配置
+    BULK_EXPORT_MAX_QUOTES: int = 2000  # 单次最多导出的报价单数
+    BULK_EXPORT_WORKERS: int = 4  # 并行渲染线程数
+    BULK_EXPORT_LOOKAHEAD: int = 8  # 最多提前渲染的报价单数
+
+    # 导出任务配置
+    EXPORT_JOB_BACKEND: str = "redis"  # 任务状态存储: redis/memory/postgres(由独立Worker执行)
+    EXPORT_JOB_WORKERS: int = 2  # 每个进程的后台任务线程数
+    EXPORT_JOB_TTL: int = 24 * 60 * 60  # 任务状态及结果文件保留时间(秒)
+    EXPORT_JOB_POLL_INTERVAL: float = 1.0  # Worker空闲时的轮询间隔(秒)
+    EXPORT_JOB_STALE_AFTER: int = 10 * 60  # 执行中任务无进度多久视为中断(秒)
+    EXPORT_JOB_MAX_ATTEMPTS: int = 3  # 中断任务最多领取次数
+
     @property
     def database_url(self) -> str:
         """数据库连接URL"""
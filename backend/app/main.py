@@ -1,12 +1,59 @@
 """
 FastAPI主应用
 """
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
-from app.api import auth, users, quoters, base, templates, quotes, exports
+from app.api import auth, users, quoters, base, templates, quotes, exports, export_jobs, share
+from app.services.pdf_renderer import get_pdf_render_pool
+from app.services.quote_templates import get_quote_templates
+from app.services.artifact_store import get_artifact_store
+from app.services.export_jobs import get_job_executor, cleanup_job_files
+from app.services.prerender import get_prerenderer
+from app.services.render_admission import RenderAdmissionMiddleware
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.database import SessionLocal
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def evict_export_artifacts() -> None:
+    """按配额淘汰导出文件，清理过期的导出任务结果"""
+    db = SessionLocal()
+    try:
+        get_artifact_store().evict(db)
+    finally:
+        db.close()
+    cleanup_job_files(settings.EXPORT_JOB_TTL)
+
+
+async def run_artifact_eviction():
+    """定期执行导出文件淘汰"""
+    while True:
+        await asyncio.sleep(settings.EXPORT_STORE_EVICT_INTERVAL)
+        try:
+            await asyncio.to_thread(evict_export_artifacts)
+        except Exception:
+            logger.exception("导出文件淘汰失败")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：启动时编译报价单模板、预热PDF渲染进程池、启动导出文件淘汰任务"""
+    get_quote_templates()
+    pdf_pool = get_pdf_render_pool()
+    await asyncio.to_thread(pdf_pool.start)
+    eviction_task = asyncio.create_task(run_artifact_eviction())
+    yield
+    eviction_task.cancel()
+    get_job_executor().shutdown(wait=False, cancel_futures=True)
+    get_prerenderer().shutdown()
+    pdf_pool.shutdown()
+
 
 # 创建FastAPI应用
 app = FastAPI(
@@ -15,6 +62,14 @@ app = FastAPI(
     description="快速、智能的快递报价单生成系统",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+)
+
+# 导出接口准入控制（在CORS内层，503响应同样带CORS头；统计接口不受限）
+app.add_middleware(
+    RenderAdmissionMiddleware,
+    path_prefix=exports.router.prefix,
+    exclude=[f"{exports.router.prefix}/stats"],
 )
 
 # 配置CORS
@@ -24,6 +79,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # 注册路由
@@ -34,6 +90,8 @@ app.include_router(base.router)
 app.include_router(templates.router)
 app.include_router(quotes.router)
 app.include_router(exports.router)
+app.include_router(export_jobs.router)
+app.include_router(share.router)
 
 
 @app.get("/")
@@ -7,7 +7,8 @@ from app.models.quoter import Quoter
 from app.models.province import Province
 from app.models.term import FixedTerm, OptionalTerm
 from app.models.template import Template, TemplateType
-from app.models.quote import Quote, QuoteExport, QuoteStatus
+from app.models.quote import Quote, QuoteExport, QuoteNumberCounter, QuoteStatus
+from app.models.export_job import ExportJob
 
 __all__ = [
     "BaseModel",
@@ -21,5 +22,7 @@ __all__ = [
     "TemplateType",
     "Quote",
     "QuoteExport",
+    "QuoteNumberCounter",
     "QuoteStatus",
+    "ExportJob",
 ]
@@ -0,0 +1,42 @@
+"""
+导出任务表模型
+"""
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.models.base import BaseModel
+
+
+class ExportJob(BaseModel):
+    """导出任务表（独立渲染Worker通过 SKIP LOCKED 领取）"""
+
+    __tablename__ = "export_jobs"
+
+    job_key = Column(String(32), unique=True, nullable=False, index=True, comment="任务标识")
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, comment="创建人ID")
+    params = Column(JSONB, nullable=False, comment="导出参数")
+
+    status = Column(String(20), default="queued", nullable=False, comment="状态(queued/running/succeeded/failed)")
+    total = Column(Integer, default=0, nullable=False, comment="报价单总数")
+    completed = Column(Integer, default=0, nullable=False, comment="已完成数")
+    error = Column(Text, nullable=True, comment="错误信息")
+
+    result_path = Column(String(255), nullable=True, comment="结果文件路径")
+    filename = Column(String(255), nullable=True, comment="下载文件名")
+    media_type = Column(String(100), nullable=True, comment="文件类型")
+
+    worker_id = Column(String(100), nullable=True, comment="处理该任务的Worker")
+    attempts = Column(Integer, default=0, nullable=False, comment="领取次数")
+    started_at = Column(DateTime, nullable=True, comment="开始时间")
+    finished_at = Column(DateTime, nullable=True, comment="完成时间")
+
+    __table_args__ = (
+        # 待处理任务按创建时间领取
+        Index(
+            "ix_export_jobs_queued",
+            "created_at",
+            postgresql_where=text("status = 'queued'")
+        ),
+    )
+
+    def __repr__(self):
+        return f"<ExportJob {self.job_key} ({self.status})>"
@@ -1,9 +1,11 @@
 """
 报价单表模型
 """
-from sqlalchemy import Column, String, Text, Date, Integer, Boolean, Enum, JSON, ForeignKey
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from sqlalchemy import Column, String, Text, Date, DateTime, Integer, Boolean, Enum, JSON, ForeignKey, Index
+from sqlalchemy.orm import relationship, backref
 import enum
+from app.database import Base
 from app.models.base import BaseModel
 
 
@@ -58,6 +60,31 @@ class Quote(BaseModel):
     # 状态
     status = Column(Enum(QuoteStatus), default=QuoteStatus.DRAFT, nullable=False, comment="状态")
 
+    __table_args__ = (
+        # 列表按 (created_at, id) 游标分页
+        Index("ix_quotes_created_at_id", "created_at", "id"),
+        # 列表筛选：状态、报价日期范围及其组合
+        Index("ix_quotes_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_quotes_quote_date", "quote_date"),
+        Index("ix_quotes_status_quote_date", "status", "quote_date"),
+        # 数据接口增量同步
+        Index("ix_quotes_updated_at_id", "updated_at", "id"),
+        Index("ix_quotes_quoter_id", "quoter_id"),
+        # 客户名称、联系电话子串搜索（pg_trgm）
+        Index(
+            "ix_quotes_customer_name_trgm",
+            "customer_name",
+            postgresql_using="gin",
+            postgresql_ops={"customer_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_quotes_contact_phone_trgm",
+            "contact_phone",
+            postgresql_using="gin",
+            postgresql_ops={"contact_phone": "gin_trgm_ops"}
+        ),
+    )
+
     def __repr__(self):
         return f"<Quote {self.quote_number} - {self.customer_name}>"
 
@@ -68,11 +95,34 @@ class QuoteExport(BaseModel):
     __tablename__ = "quote_exports"
 
     quote_id = Column(Integer, ForeignKey("quotes.id"), nullable=False, comment="报价单ID")
-    quote = relationship("Quote", backref="exports")
+    quote = relationship("Quote", backref=backref("exports", cascade="all, delete-orphan"))
 
     export_format = Column(String(20), nullable=False, comment="导出格式(pdf/excel/word)")
     file_path = Column(String(255), nullable=False, comment="文件路径")
     file_size = Column(Integer, nullable=True, comment="文件大小(字节)")
 
+    # 导出文件缓存
+    theme = Column(String(20), default="", nullable=False, comment="主题")
+    quote_version = Column(DateTime, nullable=True, comment="报价单版本(更新时间)")
+    content_hash = Column(String(64), nullable=True, index=True, comment="文件内容SHA256")
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True, comment="最后访问时间")
+
+    __table_args__ = (
+        Index("ix_quote_exports_artifact", "quote_id", "export_format", "theme", "quote_version", unique=True),
+    )
+
     def __repr__(self):
         return f"<QuoteExport {self.export_format} - Quote#{self.quote_id}>"
+
+
+class QuoteNumberCounter(Base):
+    """报价单编号计数表（每个日期一行，记录当天已分配的最大序号）"""
+
+    __tablename__ = "quote_number_counters"
+
+    quote_date = Column(Date, primary_key=True, comment="编号日期")
+    last_seq = Column(Integer, default=0, nullable=False, comment="已分配的最大序号")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, comment="更新时间")
+
+    def __repr__(self):
+        return f"<QuoteNumberCounter {self.quote_date} - {self.last_seq}>"
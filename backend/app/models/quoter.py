@@ -1,7 +1,7 @@
 """
 报价人表模型
 """
-from sqlalchemy import Column, String, Boolean, Integer
+from sqlalchemy import Column, String, Boolean, Integer, Index
 from app.models.base import BaseModel
 
 
@@ -17,5 +17,10 @@ class Quoter(BaseModel):
     is_default = Column(Boolean, default=False, nullable=False, comment="是否默认")
     sort_order = Column(Integer, default=0, nullable=False, comment="排序序号")
 
+    __table_args__ = (
+        # 列表按 (sort_order, created_at, id) 游标分页
+        Index("ix_quoters_sort_order_created_at_id", "sort_order", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Quoter {self.name}>"
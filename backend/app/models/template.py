@@ -1,7 +1,7 @@
 """
 价格模板表模型
 """
-from sqlalchemy import Column, String, Text, Boolean, Enum, JSON
+from sqlalchemy import Column, String, Text, Boolean, Enum, JSON, Index
 import enum
 from app.models.base import BaseModel
 
@@ -25,5 +25,10 @@ class Template(BaseModel):
     is_default = Column(Boolean, default=False, nullable=False, comment="是否默认")
     is_active = Column(Boolean, default=True, nullable=False, comment="是否激活")
 
+    __table_args__ = (
+        # 列表按 (created_at, id) 游标分页
+        Index("ix_templates_created_at_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Template {self.name} ({self.template_type})>"
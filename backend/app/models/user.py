@@ -1,7 +1,7 @@
 """
 用户表模型
 """
-from sqlalchemy import Column, String, Boolean, Enum
+from sqlalchemy import Column, String, Boolean, Enum, Index
 import enum
 from app.models.base import BaseModel
 
@@ -24,5 +24,10 @@ class User(BaseModel):
     role = Column(Enum(UserRole), default=UserRole.OPERATOR, nullable=False, comment="角色")
     is_active = Column(Boolean, default=True, nullable=False, comment="是否激活")
 
+    __table_args__ = (
+        # 列表按 (created_at, id) 游标分页
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<User {self.username}>"
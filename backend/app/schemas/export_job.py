@@ -0,0 +1,48 @@
+"""
+导出任务相关的数据验证模式
+"""
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import date, datetime
+from app.models.quote import QuoteStatus
+
+
+class ExportJobCreate(BaseModel):
+    """创建导出任务"""
+    quote_id: Optional[int] = Field(None, description="报价单ID，为空时按筛选条件批量导出ZIP")
+    export_format: str = Field("pdf", pattern="^(pdf|excel|word|html)$", description="导出格式: pdf/excel/word/html")
+    theme: str = Field("blue", pattern="^(blue|gray|beige)$", description="主题 (blue/gray/beige)")
+
+    # 批量导出筛选条件（与报价单列表相同）
+    customer_name: Optional[str] = Field(None, description="客户名称搜索")
+    contact_phone: Optional[str] = Field(None, description="联系电话搜索")
+    status: Optional[QuoteStatus] = Field(None, description="状态筛选")
+    start_date: Optional[date] = Field(None, description="开始日期")
+    end_date: Optional[date] = Field(None, description="结束日期")
+
+    def filters(self) -> dict:
+        """批量导出筛选条件"""
+        return {
+            "customer_name": self.customer_name,
+            "contact_phone": self.contact_phone,
+            "status": self.status,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+
+class ExportJobResponse(BaseModel):
+    """导出任务状态"""
+    id: str
+    status: str = Field(..., description="queued/running/succeeded/failed")
+    quote_id: Optional[int]
+    export_format: str
+    total: int = Field(..., description="需要渲染的报价单数")
+    completed: int = Field(..., description="已渲染的报价单数")
+    progress: float = Field(..., description="进度(0-1)")
+    error: Optional[str]
+    filename: Optional[str]
+    download_url: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
@@ -2,7 +2,7 @@
 报价单相关的数据验证模式
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import date, datetime
 from app.models.quote import QuoteStatus
 
@@ -109,6 +109,13 @@ class QuoteListItem(BaseModel):
         from_attributes = True
 
 
+class QuoteSummary(BaseModel):
+    """报价单概览（仪表盘）"""
+    total: int
+    status_counts: Dict[QuoteStatus, int]
+    recent: List[QuoteListItem]
+
+
 class NextQuoteNumber(BaseModel):
     """下一个报价单编号"""
     quote_number: str
@@ -0,0 +1,18 @@
+"""
+报价单分享链接相关的数据验证模式
+"""
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+
+class ShareLinkCreate(BaseModel):
+    """创建分享链接"""
+    export_format: str = Field("pdf", pattern="^(pdf|html)$", description="分享格式: pdf/html")
+    theme: str = Field("blue", pattern="^(blue|gray|beige)$", description="主题 (blue/gray/beige)")
+    expires_in: int = Field(7 * 24, ge=1, le=30 * 24, description="有效期(小时)")
+
+
+class ShareLinkResponse(BaseModel):
+    """分享链接"""
+    url: str = Field(..., description="分享地址（无需登录）")
+    expires_at: datetime
@@ -41,3 +41,16 @@ class TemplateResponse(TemplateBase):
 
     class Config:
         from_attributes = True
+
+
+class TemplateListItem(TemplateBase):
+    """模板列表项（include_data=false 时不返回模板数据）"""
+    id: int
+    template_data: Optional[dict] = None
+    is_default: bool
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,305 @@
+"""
+导出文件存储
+按内容哈希保存导出文件，每个 (报价单版本, 格式, 主题) 对应一条 quote_exports 记录；
+保存时同时生成 gzip / brotli 压缩版本（原文件名加 .gz / .br），下载时直接发送
+"""
+import hashlib
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.quote import Quote, QuoteExport, QuoteStatus
+from app.services.compression import compress_variants, negotiate
+
+logger = logging.getLogger(__name__)
+
+# 只缓存已发出的报价单，草稿频繁修改不落盘
+STORED_STATUSES = {QuoteStatus.SENT, QuoteStatus.CONFIRMED}
+
+# 文件扩展名
+EXTENSIONS = {
+    "pdf": "pdf",
+    "excel": "xlsx",
+    "word": "docx",
+    "html": "html",
+}
+
+# 压缩版本文件后缀（与nginx gzip_static / brotli_static 约定一致），按优先顺序排列
+ENCODING_SUFFIXES = {
+    "br": ".br",
+    "gzip": ".gz",
+}
+
+# 访问时间更新间隔，避免每次下载都写库
+ACCESS_TOUCH_INTERVAL = timedelta(minutes=1)
+
+
+def _content_lock_key(content_hash: str) -> int:
+    """内容哈希对应的咨询锁键（取前60位，落在bigint范围内）"""
+    return int(content_hash[:15], 16)
+
+
+class ArtifactStore:
+    """基于磁盘的导出文件存储，超出配额时按最久未访问淘汰"""
+
+    def __init__(self, root: Path, quota_bytes: int):
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+
+    def path_of(self, artifact: QuoteExport) -> Path:
+        """导出记录对应的绝对路径"""
+        return self.root / artifact.file_path
+
+    def _relative_path(self, content_hash: str, export_format: str) -> str:
+        ext = EXTENSIONS.get(export_format, export_format)
+        return f"{content_hash[:2]}/{content_hash}.{ext}"
+
+    def _write(self, relative_path: str, content: bytes) -> bool:
+        """
+        原子写入：相同内容的文件已存在时直接复用
+
+        Returns:
+            是否写入了新文件
+        """
+        path = self.root / relative_path
+        if path.exists():
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return True
+
+    def _write_variants(self, relative_path: str, content: bytes) -> None:
+        """生成压缩版本；压缩效果不明显的格式（xlsx/docx）不生成"""
+        for encoding, body in compress_variants(content).items():
+            self._write(relative_path + ENCODING_SUFFIXES[encoding], body)
+
+    def _stored_size(self, relative_path: str) -> int:
+        """文件及其压缩版本占用的字节数（计入配额）"""
+        size = 0
+        for suffix in ("", *ENCODING_SUFFIXES.values()):
+            try:
+                size += (self.root / (relative_path + suffix)).stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def _lock_content(self, db: Session, content_hash: str, wait: bool = True) -> bool:
+        """
+        获取内容哈希的事务级咨询锁（事务结束时释放）
+        保存与删除同一内容的文件互斥：删除前确认无引用到删除文件之间，不会有新记录引用该文件
+
+        Args:
+            wait: 是否等待；淘汰时不等待，避免多个淘汰事务按不同顺序加锁而死锁
+
+        Returns:
+            是否获得锁
+        """
+        key = _content_lock_key(content_hash)
+        if wait:
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": key})
+            return True
+        return db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": key}).scalar()
+
+    def encoded_path(
+        self, relative_path: str, accept_encoding: Optional[str]
+    ) -> Tuple[Path, Optional[str]]:
+        """
+        按 Accept-Encoding 选择要发送的文件
+
+        Returns:
+            (文件路径, 内容编码)，没有可用的压缩版本时返回原文件和None
+        """
+        if not accept_encoding:
+            return self.root / relative_path, None
+        available = [
+            encoding for encoding, suffix in ENCODING_SUFFIXES.items()
+            if (self.root / (relative_path + suffix)).exists()
+        ]
+        encoding = negotiate(accept_encoding, available)
+        if encoding is None:
+            return self.root / relative_path, None
+        return self.root / (relative_path + ENCODING_SUFFIXES[encoding]), encoding
+
+    def _remove_if_unreferenced(self, db: Session, content_hash: str, relative_path: str) -> None:
+        """
+        没有其他记录引用该内容时删除文件及其压缩版本
+
+        调用方须在删除记录前获取该内容的锁（_lock_content）并持有到提交，
+        记录与文件在同一把锁下删除，保存同一内容的事务不会在两者之间写入新记录
+        """
+        in_use = db.query(QuoteExport.id).filter(
+            QuoteExport.content_hash == content_hash
+        ).first()
+        if in_use:
+            return
+        for suffix in ("", *ENCODING_SUFFIXES.values()):
+            try:
+                (self.root / (relative_path + suffix)).unlink()
+            except FileNotFoundError:
+                pass
+
+    def lookup(
+        self, db: Session, quote: Quote, export_format: str, theme: str = ""
+    ) -> Optional[QuoteExport]:
+        """查找当前报价单版本的导出文件"""
+        artifact = db.query(QuoteExport).filter(
+            QuoteExport.quote_id == quote.id,
+            QuoteExport.export_format == export_format,
+            QuoteExport.theme == theme,
+            QuoteExport.quote_version == quote.updated_at,
+        ).first()
+        if artifact is None:
+            return None
+
+        # 文件被外部清理时删除失效记录
+        if not self.path_of(artifact).exists():
+            db.delete(artifact)
+            db.commit()
+            return None
+
+        now = datetime.utcnow()
+        if artifact.last_accessed_at < now - ACCESS_TOUCH_INTERVAL:
+            artifact.last_accessed_at = now
+            db.commit()
+        return artifact
+
+    def save(
+        self, db: Session, quote: Quote, export_format: str, theme: str, content: bytes
+    ) -> QuoteExport:
+        """保存导出文件并记录到 quote_exports"""
+        content_hash = hashlib.sha256(content).hexdigest()
+        relative_path = self._relative_path(content_hash, export_format)
+        # 持有内容锁直到记录提交，期间淘汰任务不会删除该文件
+        self._lock_content(db, content_hash)
+        # 相同内容已保存过时压缩版本也已存在
+        if self._write(relative_path, content):
+            self._write_variants(relative_path, content)
+
+        artifact = QuoteExport(
+            quote_id=quote.id,
+            export_format=export_format,
+            theme=theme,
+            quote_version=quote.updated_at,
+            file_path=relative_path,
+            # 配额按实际占用计算，包含压缩版本
+            file_size=self._stored_size(relative_path),
+            content_hash=content_hash,
+        )
+        db.add(artifact)
+        try:
+            db.commit()
+        except IntegrityError:
+            # 其他进程已保存同一版本
+            db.rollback()
+            self._lock_content(db, content_hash)
+            self._remove_if_unreferenced(db, content_hash, relative_path)
+            db.commit()
+            existing = self.lookup(db, quote, export_format, theme)
+            if existing is None:
+                raise
+            return existing
+        return artifact
+
+    def get_or_create(
+        self,
+        db: Session,
+        quote: Quote,
+        export_format: str,
+        theme: str,
+        render: Callable[[], bytes],
+    ) -> QuoteExport:
+        """命中直接返回已保存的文件，否则渲染后保存"""
+        artifact = self.lookup(db, quote, export_format, theme)
+        if artifact is None:
+            artifact = self.save(db, quote, export_format, theme, render())
+        return artifact
+
+    def purge_quote(self, db: Session, quote_id: int) -> int:
+        """删除报价单的全部导出文件（不提交事务）"""
+        artifacts = db.query(QuoteExport).filter(QuoteExport.quote_id == quote_id).all()
+        # 按固定顺序加锁，避免与其他删除事务互相等待
+        for content_hash in sorted({artifact.content_hash for artifact in artifacts if artifact.content_hash}):
+            self._lock_content(db, content_hash)
+        for artifact in artifacts:
+            db.delete(artifact)
+        db.flush()
+        for artifact in artifacts:
+            if artifact.content_hash:
+                self._remove_if_unreferenced(db, artifact.content_hash, artifact.file_path)
+        return len(artifacts)
+
+    def usage(self, db: Session) -> dict:
+        """存储占用统计（字节数包含压缩版本）"""
+        count, total = db.query(
+            func.count(QuoteExport.id),
+            func.coalesce(func.sum(QuoteExport.file_size), 0)
+        ).one()
+        return {"artifacts": count, "bytes": total, "quota_bytes": self.quota_bytes}
+
+    def evict(self, db: Session) -> dict:
+        """
+        按配额淘汰最久未访问的导出文件（占用按文件及其压缩版本计算）
+
+        多个进程同时执行时通过 SKIP LOCKED 跳过其他进程正在处理的记录；
+        内容锁被占用的记录本次不删除，避免只删记录而留下无人引用的文件
+        """
+        total = db.query(func.coalesce(func.sum(QuoteExport.file_size), 0)).scalar()
+        removed = 0
+        freed = 0
+        skipped = set()
+
+        while total - freed > self.quota_bytes:
+            query = db.query(QuoteExport)
+            if skipped:
+                query = query.filter(QuoteExport.id.notin_(skipped))
+            batch = query.order_by(
+                QuoteExport.last_accessed_at
+            ).with_for_update(skip_locked=True).limit(100).all()
+            if not batch:
+                break
+
+            for artifact in batch:
+                if total - freed <= self.quota_bytes:
+                    break
+                # 同一内容正在保存或被其他进程删除时跳过，记录和文件留到下次淘汰
+                if artifact.content_hash and not self._lock_content(db, artifact.content_hash, wait=False):
+                    skipped.add(artifact.id)
+                    continue
+                db.delete(artifact)
+                db.flush()
+                if artifact.content_hash:
+                    self._remove_if_unreferenced(db, artifact.content_hash, artifact.file_path)
+                freed += artifact.file_size or 0
+                removed += 1
+            db.commit()
+
+        if removed:
+            logger.info("导出文件淘汰: 删除%d个, 释放%d字节", removed, freed)
+        return {"removed": removed, "freed_bytes": freed, "total_bytes": total - freed}
+
+
+@lru_cache()
+def get_artifact_store() -> ArtifactStore:
+    """获取导出文件存储单例"""
+    settings = get_settings()
+    return ArtifactStore(
+        root=Path(settings.UPLOAD_DIR) / "exports",
+        quota_bytes=settings.EXPORT_STORE_QUOTA_BYTES,
+    )
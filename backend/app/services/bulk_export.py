@@ -0,0 +1,80 @@
+"""
+批量导出
+边渲染边写ZIP，内存占用与报价单数量无关
+"""
+import io
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 已压缩的格式直接存储，避免重复压缩浪费CPU
+STORED_EXTENSIONS = {"pdf", "xlsx", "docx", "zip"}
+
+
+class _ZipSink(io.RawIOBase):
+    """收集zipfile写出的字节，供生成器逐块取走（不可seek，zipfile会使用数据描述符）"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[Tuple[str, bytes]]) -> Iterator[bytes]:
+    """
+    将 (文件名, 内容) 序列逐个写入ZIP并产出字节块
+
+    每写完一个文件就把已生成的字节交给调用方，不在内存中保留整个压缩包
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, mode="w") as zf:
+        for name, content in entries:
+            ext = name.rsplit(".", 1)[-1].lower()
+            compress_type = zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+            zf.writestr(name, content, compress_type=compress_type)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
+
+
+def render_ahead(
+    items: Iterable[T],
+    render: Callable[[T], R],
+    workers: int = 4,
+    lookahead: int = 8,
+) -> Iterator[R]:
+    """
+    并行渲染，按输入顺序产出结果
+
+    最多提前提交 lookahead 个任务，消费方（ZIP写入）跟不上时停止读取输入
+    """
+    lookahead = max(lookahead, 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-export") as pool:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(pool.submit(render, item))
+                if len(pending) >= lookahead:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
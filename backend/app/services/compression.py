@@ -0,0 +1,135 @@
+"""
+导出内容预压缩
+渲染完成时生成 gzip / brotli 压缩版本，与原文一起缓存或保存，
+下载时按 Accept-Encoding 直接发送压缩好的内容，不再重复压缩
+"""
+import gzip
+import zlib
+from typing import Dict, Iterable, Optional
+
+try:
+    import brotli
+except ImportError:
+    # brotli为可选依赖，未安装时只提供gzip
+    brotli = None
+
+# 可提供的编码，客户端权重相同时按此顺序优先
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# 压缩版本只生成一次，使用较高的压缩级别
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# 小于该大小不压缩；压缩后节省不足该比例时不保存压缩版本（xlsx/docx本身已是压缩包）
+MIN_SIZE = 1024
+MIN_SAVING = 0.1
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """按指定编码压缩"""
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    # 固定mtime，相同内容的压缩结果一致
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_variant(data: bytes, encoding: str) -> Optional[bytes]:
+    """
+    生成压缩版本
+
+    Returns:
+        压缩后内容；内容过小或压缩效果未达到 MIN_SAVING 时返回None
+    """
+    if len(data) < MIN_SIZE:
+        return None
+    body = compress(data, encoding)
+    if len(body) > len(data) * (1 - MIN_SAVING):
+        return None
+    return body
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """
+    生成全部压缩版本
+
+    Returns:
+        编码 -> 压缩后内容，只包含值得压缩的编码
+    """
+    variants = {}
+    for encoding in ENCODINGS:
+        body = compress_variant(data, encoding)
+        if body is not None:
+            variants[encoding] = body
+    return variants
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """解析 Accept-Encoding 为 编码 -> 权重"""
+    weights = {}
+    for item in (header or "").split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    return weights
+
+
+def negotiate(header: Optional[str], available: Iterable[str] = ENCODINGS) -> Optional[str]:
+    """
+    选择响应编码
+
+    Args:
+        header: 请求的 Accept-Encoding
+        available: 可提供的编码（按服务端优先顺序）
+
+    Returns:
+        选中的编码，不压缩时返回None
+    """
+    weights = parse_accept_encoding(header)
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def encoding_headers(encoding: Optional[str]) -> Dict[str, str]:
+    """压缩相关响应头；同一地址按请求头返回不同内容，始终带 Vary"""
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return headers
+
+
+class StreamCompressor:
+    """
+    流式压缩（边渲染边发送时使用）
+    每块输出后立即刷新，保持分块发送的首字节时间
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
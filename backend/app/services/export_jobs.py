@@ -0,0 +1,375 @@
+"""
+导出任务
+任务状态存储（Redis / 内存 / PostgreSQL）与后台执行线程池
+"""
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 任务状态
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobStore(ABC):
+    """任务状态存储接口，任务以字典形式保存"""
+
+    # 是否由API进程自身的线程池执行任务；否则交给独立Worker领取
+    local_execution = True
+
+    @abstractmethod
+    def create(self, job: dict) -> None:
+        """保存新任务"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[dict]:
+        """获取任务，不存在或已过期时返回None"""
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> None:
+        """更新任务字段，任务不存在时忽略"""
+
+    @abstractmethod
+    def increment(self, job_id: str, field: str, amount: int = 1) -> None:
+        """累加任务的计数字段（进度），任务不存在时忽略"""
+
+
+class MemoryJobStore(JobStore):
+    """进程内存储（单进程部署和测试使用）"""
+
+    def __init__(self, ttl: int = 86400):
+        self.ttl = ttl
+        self._jobs: Dict[str, dict] = {}
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for job_id in [job_id for job_id, expires in self._expires.items() if expires < now]:
+            self._jobs.pop(job_id, None)
+            self._expires.pop(job_id, None)
+
+    def create(self, job: dict) -> None:
+        with self._lock:
+            self._purge_expired()
+            self._jobs[job["id"]] = dict(job)
+            self._expires[job["id"]] = time.monotonic() + self.ttl
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def increment(self, job_id: str, field: str, amount: int = 1) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id][field] = self._jobs[job_id].get(field, 0) + amount
+
+
+class RedisJobStore(JobStore):
+    """
+    Redis存储，多个uvicorn进程共享任务状态
+
+    每个任务一个hash，字段值为JSON编码，整体设置过期时间
+    更新与进度计数通过脚本在键存在时原子执行，任务过期后不会重新创建无过期时间的键
+    """
+
+    KEY_PREFIX = "export_job:"
+
+    # ARGV 为交替的字段名、值
+    UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HSET', KEYS[1], unpack(ARGV))
+end
+"""
+
+    INCREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+end
+"""
+
+    def __init__(self, url: str, ttl: int = 86400):
+        import redis
+        self.ttl = ttl
+        self._redis = redis.Redis.from_url(url)
+        self._update = self._redis.register_script(self.UPDATE_SCRIPT)
+        self._increment = self._redis.register_script(self.INCREMENT_SCRIPT)
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    def create(self, job: dict) -> None:
+        key = self._key(job["id"])
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping={field: json.dumps(value) for field, value in job.items()})
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        data = self._redis.hgetall(self._key(job_id))
+        if not data:
+            return None
+        return {field.decode(): json.loads(value) for field, value in data.items()}
+
+    def update(self, job_id: str, **fields) -> None:
+        if not fields:
+            return
+        args = []
+        for field, value in fields.items():
+            args += [field, json.dumps(value)]
+        self._update(keys=[self._key(job_id)], args=args)
+
+    def increment(self, job_id: str, field: str, amount: int = 1) -> None:
+        self._increment(keys=[self._key(job_id)], args=[field, amount])
+
+
+class PostgresJobStore(JobStore):
+    """
+    PostgreSQL存储，任务持久化并由独立Worker领取执行
+
+    API进程只负责入队，Worker通过 FOR UPDATE SKIP LOCKED 领取，
+    多个Worker并发领取互不阻塞，进程重启后未完成的任务不会丢失
+    """
+
+    local_execution = False
+
+    # 以字符串形式传入的时间字段
+    DATETIME_FIELDS = ("created_at", "started_at", "finished_at")
+
+    def __init__(self, session_factory=None):
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+
+    @classmethod
+    def _to_columns(cls, fields: dict) -> dict:
+        columns = dict(fields)
+        if "id" in columns:
+            columns["job_key"] = columns.pop("id")
+        for field in cls.DATETIME_FIELDS:
+            if isinstance(columns.get(field), str):
+                columns[field] = datetime.fromisoformat(columns[field])
+        return columns
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        def iso(value: Optional[datetime]) -> Optional[str]:
+            return value.isoformat() if value else None
+
+        return {
+            "id": row.job_key,
+            "user_id": row.user_id,
+            "params": row.params,
+            "status": row.status,
+            "total": row.total,
+            "completed": row.completed,
+            "error": row.error,
+            "result_path": row.result_path,
+            "filename": row.filename,
+            "media_type": row.media_type,
+            "created_at": iso(row.created_at),
+            "started_at": iso(row.started_at),
+            "finished_at": iso(row.finished_at),
+        }
+
+    def create(self, job: dict) -> None:
+        from app.models.export_job import ExportJob
+        db = self._session_factory()
+        try:
+            db.add(ExportJob(**self._to_columns(job)))
+            db.commit()
+        finally:
+            db.close()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        from app.models.export_job import ExportJob
+        db = self._session_factory()
+        try:
+            row = db.query(ExportJob).filter(ExportJob.job_key == job_id).first()
+            return self._to_dict(row) if row is not None else None
+        finally:
+            db.close()
+
+    def update(self, job_id: str, **fields) -> None:
+        from app.models.export_job import ExportJob
+        db = self._session_factory()
+        try:
+            db.query(ExportJob).filter(ExportJob.job_key == job_id).update(
+                self._to_columns(fields), synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def increment(self, job_id: str, field: str, amount: int = 1) -> None:
+        from app.models.export_job import ExportJob
+        column = getattr(ExportJob, field)
+        db = self._session_factory()
+        try:
+            # 进度更新同时刷新 updated_at，作为Worker的心跳
+            db.query(ExportJob).filter(ExportJob.job_key == job_id).update(
+                {column: column + amount}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def claim(self, worker_id: str) -> Optional[str]:
+        """
+        领取一个排队中的任务并标记为执行中
+
+        Returns:
+            任务ID，没有待处理任务时返回None
+        """
+        from app.models.export_job import ExportJob
+        db = self._session_factory()
+        try:
+            row = db.query(ExportJob).filter(
+                ExportJob.status == JOB_QUEUED
+            ).order_by(
+                ExportJob.created_at
+            ).with_for_update(skip_locked=True).first()
+            if row is None:
+                db.rollback()
+                return None
+
+            row.status = JOB_RUNNING
+            row.worker_id = worker_id
+            row.attempts += 1
+            row.started_at = datetime.utcnow()
+            db.commit()
+            return row.job_key
+        finally:
+            db.close()
+
+    def requeue_stale(self, stale_after: int, max_attempts: int) -> int:
+        """
+        回收长时间无进度的执行中任务（Worker崩溃或被强制终止）
+
+        未超过重试次数的重新排队，否则标记为失败
+        """
+        from app.models.export_job import ExportJob
+        cutoff = datetime.utcnow() - timedelta(seconds=stale_after)
+        db = self._session_factory()
+        try:
+            rows = db.query(ExportJob).filter(
+                ExportJob.status == JOB_RUNNING,
+                ExportJob.updated_at < cutoff
+            ).with_for_update(skip_locked=True).all()
+            for row in rows:
+                if row.attempts < max_attempts:
+                    row.status = JOB_QUEUED
+                    row.worker_id = None
+                    row.completed = 0
+                else:
+                    row.status = JOB_FAILED
+                    row.error = "导出任务执行中断"
+                    row.finished_at = datetime.utcnow()
+            db.commit()
+            if rows:
+                logger.warning("回收中断的导出任务: %d个", len(rows))
+            return len(rows)
+        finally:
+            db.close()
+
+    def purge_finished(self, max_age: int) -> int:
+        """删除超过保留期的已结束任务记录"""
+        from app.models.export_job import ExportJob
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age)
+        db = self._session_factory()
+        try:
+            removed = db.query(ExportJob).filter(
+                ExportJob.status.in_([JOB_SUCCEEDED, JOB_FAILED]),
+                ExportJob.finished_at < cutoff
+            ).delete(synchronize_session=False)
+            db.commit()
+            return removed
+        finally:
+            db.close()
+
+
+def new_job(user_id: int, params: dict, total: int) -> dict:
+    """创建任务记录"""
+    return {
+        "id": uuid.uuid4().hex,
+        "user_id": user_id,
+        "params": params,
+        "status": JOB_QUEUED,
+        "total": total,
+        "completed": 0,
+        "error": None,
+        "result_path": None,
+        "filename": None,
+        "media_type": None,
+        "created_at": datetime.utcnow().isoformat(),
+        "started_at": None,
+        "finished_at": None,
+    }
+
+
+def job_result_dir() -> Path:
+    """任务结果文件目录"""
+    path = Path(get_settings().UPLOAD_DIR) / "jobs"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def cleanup_job_files(max_age: int) -> int:
+    """删除超过保留期的任务结果文件"""
+    cutoff = time.time() - max_age
+    removed = 0
+    for path in job_result_dir().iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+@lru_cache()
+def get_job_store() -> JobStore:
+    """获取任务状态存储单例"""
+    settings = get_settings()
+    if settings.EXPORT_JOB_BACKEND == "memory":
+        return MemoryJobStore(ttl=settings.EXPORT_JOB_TTL)
+    if settings.EXPORT_JOB_BACKEND == "postgres":
+        return PostgresJobStore()
+    return RedisJobStore(settings.redis_url, ttl=settings.EXPORT_JOB_TTL)
+
+
+@lru_cache()
+def get_job_executor() -> ThreadPoolExecutor:
+    """获取后台任务线程池单例"""
+    return ThreadPoolExecutor(
+        max_workers=get_settings().EXPORT_JOB_WORKERS,
+        thread_name_prefix="export-job",
+    )
+
+
+def submit_job(run: Callable[[str], None], job_id: str) -> None:
+    """提交任务到后台线程池；使用独立Worker时任务已入队，无需处理"""
+    if get_job_store().local_execution:
+        get_job_executor().submit(run, job_id)
@@ -0,0 +1,346 @@
+"""
+PDF渲染服务
+在预启动的独立进程池中运行WeasyPrint，避免阻塞API线程和占用GIL
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from functools import lru_cache
+from typing import Callable, Optional, Set
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PdfRenderError(Exception):
+    """PDF渲染失败"""
+
+
+class PdfRenderBusy(PdfRenderError):
+    """渲染队列已满"""
+
+
+class PdfRenderTimeout(PdfRenderError):
+    """渲染超时"""
+
+
+# PDF中文字体：优先使用样式表指定的微软雅黑，服务器未安装时回退到Noto CJK
+PDF_FONT_CSS = """
+body, table, th, td {
+    font-family: "Microsoft YaHei", "Noto Sans CJK SC", "Noto Sans SC", "WenQuanYi Micro Hei", sans-serif;
+}
+"""
+
+# 预热时渲染的文档，提前加载中文字体
+WARMUP_HTML = "<p>中通快递服务报价单 0123456789</p>"
+
+# 渲染进程内的字体配置和已解析的各主题样式表，每个进程只加载一次
+_resources: Optional[dict] = None
+
+
+def _font_css() -> str:
+    """字体样式表；配置了字体文件时注册为微软雅黑"""
+    font_file = get_settings().PDF_FONT_FILE
+    if not font_file:
+        return PDF_FONT_CSS
+    return (
+        f'@font-face {{ font-family: "Microsoft YaHei"; src: url("file://{font_file}"); }}\n'
+        + PDF_FONT_CSS
+    )
+
+
+def _get_resources() -> dict:
+    """
+    获取渲染进程的共享资源（首次调用时加载）
+
+    FontConfiguration 在多次渲染间复用，已加载的字体不再重复读取；
+    主题样式表预先解析为CSS对象，渲染时不再解析内嵌样式
+    """
+    global _resources
+    if _resources is None:
+        from weasyprint import CSS
+        from weasyprint.text.fonts import FontConfiguration
+        from app.services.quote_templates import get_quote_templates
+
+        font_config = FontConfiguration()
+        fonts = CSS(string=_font_css(), font_config=font_config)
+        _resources = {
+            "font_config": font_config,
+            "stylesheets": {
+                theme: [CSS(string=str(stylesheet), font_config=font_config), fonts]
+                for theme, stylesheet in get_quote_templates().stylesheets.items()
+            },
+        }
+    return _resources
+
+
+def _warmup() -> int:
+    """预热渲染进程：导入WeasyPrint、加载字体和样式表，并渲染一次中文文档"""
+    from app.services.quote_templates import DEFAULT_THEME
+    _render_pdf(WARMUP_HTML, DEFAULT_THEME)
+    return os.getpid()
+
+
+def _render_pdf(html: str, theme: Optional[str] = None) -> bytes:
+    """
+    在渲染进程中将HTML转换为PDF
+
+    Args:
+        html: HTML文档；指定theme时为不含样式表的文档
+        theme: 主题，使用进程内缓存的样式表和字体配置；为None时使用HTML内嵌样式
+
+    字体按文档用到的字符子集嵌入（WeasyPrint默认行为）
+    """
+    from weasyprint import HTML
+    if theme is None:
+        return HTML(string=html).write_pdf()
+
+    from app.services.quote_templates import DEFAULT_THEME
+    resources = _get_resources()
+    stylesheets = resources["stylesheets"]
+    return HTML(string=html).write_pdf(
+        stylesheets=stylesheets.get(theme, stylesheets[DEFAULT_THEME]),
+        font_config=resources["font_config"],
+    )
+
+
+def _process_main(conn, max_tasks: Optional[int]) -> None:
+    """
+    渲染进程主循环：逐个接收 (函数, 参数) 并返回结果
+    渲染 max_tasks 次后退出，由进程池换新进程
+    """
+    # Ctrl+C 由主进程处理
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    tasks = 0
+    while True:
+        try:
+            fn, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, fn(*args)))
+        except Exception as exc:
+            conn.send((False, f"{type(exc).__name__}: {exc}"))
+        tasks += 1
+        if max_tasks and tasks >= max_tasks:
+            return
+
+
+class _RenderProcess:
+    """单个渲染进程，通过管道一次执行一个任务"""
+
+    def __init__(self, context, max_tasks: Optional[int]):
+        self.max_tasks = max_tasks
+        self.tasks = 0
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_process_main, args=(child_conn, max_tasks), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+    @property
+    def usable(self) -> bool:
+        """进程存活且未达到回收次数"""
+        return self._process.is_alive() and not (self.max_tasks and self.tasks >= self.max_tasks)
+
+    def run(self, fn: Callable, args: tuple, timeout: float):
+        """
+        执行任务，超时从任务交给本进程时开始计算
+
+        Raises:
+            PdfRenderTimeout: 超时，已终止本进程
+            PdfRenderError: 任务失败或进程异常退出
+        """
+        try:
+            self._conn.send((fn, args))
+            if not self._conn.poll(timeout):
+                self.terminate()
+                raise PdfRenderTimeout("PDF渲染超时")
+            ok, value = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            self.terminate()
+            raise PdfRenderError("PDF渲染进程异常") from exc
+        self.tasks += 1
+        if not ok:
+            raise PdfRenderError(f"PDF渲染失败: {value}")
+        return value
+
+    def terminate(self) -> None:
+        """结束进程并回收"""
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(5)
+            if self._process.is_alive():
+                self._process.kill()
+        self._process.join()
+        self._conn.close()
+
+
+class PdfRenderPool:
+    """
+    PDF渲染进程池
+
+    - 进程数默认等于CPU核数，启动时预先拉起并导入WeasyPrint
+    - 提交数量受信号量限制（渲染中 + 排队中），超出直接拒绝；排队等待空闲进程超过 queue_timeout 同样拒绝
+    - 超时从任务开始渲染时计算，超时只终止该任务的渲染进程，其他进程上的任务不受影响
+    - 进程渲染N次后自动回收；退出或被终止的进程在后台换新并预热
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        queue_size: int = 8,
+        timeout: float = 30,
+        max_tasks_per_child: Optional[int] = 50,
+        queue_timeout: Optional[float] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout if queue_timeout is not None else timeout
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._lock = threading.Lock()
+        self._idle: "queue.Queue[_RenderProcess]" = queue.Queue()
+        self._processes: Set[_RenderProcess] = set()
+        self._started = False
+        self._closed = False
+        # max_tasks_per_child 需要回收进程，统一使用spawn，不复制主进程的线程和连接
+        self._context = multiprocessing.get_context("spawn")
+
+    def _new_process(self) -> Optional[_RenderProcess]:
+        """启动渲染进程并登记；进程池已关闭时返回None"""
+        with self._lock:
+            if self._closed:
+                return None
+            process = _RenderProcess(self._context, self.max_tasks_per_child)
+            self._processes.add(process)
+        return process
+
+    def _discard(self, process: _RenderProcess) -> None:
+        with self._lock:
+            self._processes.discard(process)
+        process.terminate()
+
+    def _spawn(self) -> Optional[_RenderProcess]:
+        """启动并预热一个渲染进程；进程池已关闭时返回None"""
+        process = self._new_process()
+        if process is None:
+            return None
+        try:
+            process.run(_warmup, (), self.timeout)
+        except PdfRenderError as exc:
+            if self._closed:
+                return None
+            logger.warning("PDF渲染进程预热失败: %s", exc)
+            if not process.usable:
+                # 预热超时或进程退出，换一个不预热的新进程
+                self._discard(process)
+                process = self._new_process()
+        return process
+
+    def _replace(self) -> None:
+        """换新进程并放回空闲队列"""
+        try:
+            process = self._spawn()
+        except Exception:
+            logger.exception("PDF渲染进程启动失败")
+            return
+        if process is not None:
+            self._idle.put(process)
+
+    def _release(self, process: _RenderProcess) -> None:
+        """任务结束后放回空闲队列；进程已退出、被终止或达到回收次数时在后台换新"""
+        if process.usable:
+            self._idle.put(process)
+            return
+        self._discard(process)
+        if not self._closed:
+            threading.Thread(target=self._replace, name="pdf-render-replace", daemon=True).start()
+
+    def start(self) -> None:
+        """启动并预热进程池"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        threads = [
+            threading.Thread(target=self._replace, name="pdf-render-start", daemon=True)
+            for _ in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def shutdown(self) -> None:
+        """关闭进程池，结束全部渲染进程"""
+        with self._lock:
+            self._closed = True
+            processes, self._processes = self._processes, set()
+        for process in processes:
+            process.terminate()
+
+    def render(self, html: str, wait: Optional[float] = None, theme: Optional[str] = None) -> bytes:
+        """
+        渲染PDF
+
+        Args:
+            html: HTML文档
+            wait: 队列已满时最多等待的秒数，默认立即拒绝
+            theme: 主题；指定时html不含样式表，由渲染进程套用缓存的主题样式表
+
+        Returns:
+            PDF字节
+
+        Raises:
+            PdfRenderBusy: 队列已满或排队超时
+            PdfRenderTimeout: 渲染超时
+            PdfRenderError: 渲染失败
+        """
+        if not self._started:
+            self.start()
+
+        acquired = (
+            self._slots.acquire(timeout=wait) if wait
+            else self._slots.acquire(blocking=False)
+        )
+        if not acquired:
+            raise PdfRenderBusy("PDF渲染队列已满")
+
+        try:
+            try:
+                process = self._idle.get(timeout=self.queue_timeout)
+            except queue.Empty:
+                raise PdfRenderBusy("PDF渲染排队超时")
+
+            try:
+                return process.run(_render_pdf, (html, theme), self.timeout)
+            except PdfRenderTimeout:
+                logger.warning("PDF渲染超时(%ss)，已终止该渲染进程", self.timeout)
+                raise
+            finally:
+                self._release(process)
+        finally:
+            self._slots.release()
+
+
+@lru_cache()
+def get_pdf_render_pool() -> PdfRenderPool:
+    """获取PDF渲染进程池单例"""
+    settings = get_settings()
+    # 每个uvicorn进程各有一个进程池，默认按web进程数分摊CPU核数
+    workers = settings.PDF_RENDER_WORKERS or max(1, (os.cpu_count() or 1) // settings.WEB_CONCURRENCY)
+    return PdfRenderPool(
+        workers=workers,
+        queue_size=settings.PDF_RENDER_QUEUE_SIZE,
+        timeout=settings.PDF_RENDER_TIMEOUT,
+        max_tasks_per_child=settings.PDF_RENDER_MAX_TASKS_PER_CHILD,
+        queue_timeout=settings.PDF_RENDER_QUEUE_TIMEOUT,
+    )
@@ -0,0 +1,113 @@
+"""
+导出预渲染
+报价单发出（已发送/已确认）后在后台生成默认主题的导出文件，客户下载时直接读取
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Set
+
+from app.config import get_settings
+from app.services.quote_templates import DEFAULT_THEME
+
+logger = logging.getLogger(__name__)
+
+
+class Prerenderer:
+    """
+    预渲染调度器
+
+    - 固定数量的后台线程执行，限制与在线导出争用PDF渲染进程池
+    - 同一报价单排队中时不重复提交
+    - 渲染失败只记录日志，下载时按原流程现场渲染
+    """
+
+    def __init__(self, formats: Iterable[str], workers: int = 1, theme: str = DEFAULT_THEME):
+        self.formats = list(formats)
+        self.theme = theme
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="prerender")
+        self._pending: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stats = {"scheduled": 0, "completed": 0, "failed": 0}
+
+    def schedule(self, quote_id: int) -> bool:
+        """
+        提交预渲染，立即返回
+
+        Returns:
+            是否提交（已在队列中时返回False）
+        """
+        with self._lock:
+            if quote_id in self._pending:
+                return False
+            self._pending.add(quote_id)
+            self._stats["scheduled"] += 1
+        self._executor.submit(self._run, quote_id)
+        return True
+
+    def _run(self, quote_id: int) -> None:
+        # 开始执行即移出队列，执行期间报价单再次修改时可重新提交
+        with self._lock:
+            self._pending.discard(quote_id)
+        try:
+            self.render(quote_id)
+        except Exception:
+            logger.exception("预渲染失败: 报价单%s", quote_id)
+
+    def render(self, quote_id: int) -> None:
+        """生成报价单当前版本的各格式导出文件（已存在的跳过）"""
+        from fastapi import HTTPException
+        from app.database import SessionLocal
+        from app.api.exports import get_quote_and_quoter, get_export_artifact
+        from app.services.artifact_store import STORED_STATUSES
+        from app.services.pdf_renderer import get_pdf_render_pool
+
+        db = SessionLocal()
+        try:
+            try:
+                quote, quoter = get_quote_and_quoter(db, quote_id)
+            except HTTPException:
+                return
+            if quote.status not in STORED_STATUSES:
+                return
+
+            wait = get_pdf_render_pool().timeout
+            for export_format in self.formats:
+                try:
+                    get_export_artifact(db, quote, quoter, export_format, self.theme, wait=wait)
+                except Exception as exc:
+                    db.rollback()
+                    self._count("failed")
+                    logger.warning("预渲染失败: 报价单%s %s: %s", quote_id, export_format, exc)
+                else:
+                    self._count("completed")
+        finally:
+            db.close()
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            self._stats[field] += 1
+
+    def stats(self) -> dict:
+        """预渲染统计"""
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending), "formats": self.formats}
+
+    def shutdown(self) -> None:
+        """停止后台线程，丢弃未开始的任务"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache()
+def get_prerenderer() -> Prerenderer:
+    """获取预渲染调度器单例"""
+    settings = get_settings()
+    return Prerenderer(formats=settings.PRERENDER_FORMATS, workers=settings.PRERENDER_WORKERS)
+
+
+def schedule_prerender(quote_id: int) -> bool:
+    """报价单发出或发出后修改时调用；未启用预渲染时不处理"""
+    if not get_settings().PRERENDER_FORMATS:
+        return False
+    return get_prerenderer().schedule(quote_id)
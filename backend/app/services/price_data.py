@@ -0,0 +1,137 @@
+"""
+价格数据整理
+price_data 为前端编辑器保存的JSON，不同模板类型结构不同；
+这里统一展开为固定字段的价格明细，供数据导出使用
+"""
+from typing import Iterator, List, Optional, Tuple
+
+# 价格明细字段
+PRICE_ITEM_FIELDS = (
+    "group",
+    "name",
+    "provinces",
+    "start_weight",
+    "end_weight",
+    "first_weight",
+    "additional_weight",
+    "price",
+    "min_charge",
+    "remark",
+)
+
+# 明细字段对应的price_data键（兼容新旧两种命名）
+PRICE_ITEM_KEYS = {
+    "name": ("regionName", "region_name", "range"),
+    "provinces": ("provinces",),
+    "start_weight": ("start_weight", "startWeight"),
+    "end_weight": ("end_weight", "endWeight"),
+    "first_weight": ("firstWeight", "first_weight_price", "first_weight"),
+    "additional_weight": ("additionalWeight", "additional_weight_price", "additional_weight"),
+    "price": ("price",),
+    "min_charge": ("min_charge", "minCharge"),
+    "remark": ("remark",),
+}
+
+
+# 各模板类型的价格表: 价格数据分组、列(表头, 明细字段, 是否数值)
+PRICE_TABLES = {
+    "TONGPIAO": {
+        "group": "regions",
+        "columns": [
+            ("区域", "name", False),
+            ("省份", "provinces", False),
+            ("首重(元/KG)", "first_weight", True),
+            ("续重(元/KG)", "additional_weight", True),
+            ("最低收费(元)", "min_charge", True),
+            ("时效", "remark", False),
+        ],
+    },
+    "DAKEHU": {
+        "group": "weightRanges",
+        "columns": [
+            ("重量段", "name", False),
+            ("起始重量(KG)", "start_weight", True),
+            ("截止重量(KG)", "end_weight", True),
+            ("价格(元)", "price", True),
+        ],
+    },
+}
+# 仓配报价与大客户使用相同的重量段价格表
+PRICE_TABLES["CANGPEI"] = PRICE_TABLES["DAKEHU"]
+
+
+def _pick(item: dict, keys: tuple):
+    for key in keys:
+        value = item.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def iter_price_items(price_data: Optional[dict]) -> Iterator[dict]:
+    """
+    展开价格数据
+
+    price_data 中每个对象列表（如 regions、weightRanges）的每一项产出一条明细，
+    group 为所属列表名，省份列表以“、”连接
+
+    Yields:
+        包含 PRICE_ITEM_FIELDS 全部字段的字典
+    """
+    for group, items in (price_data or {}).items():
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            row = {"group": group}
+            for field, keys in PRICE_ITEM_KEYS.items():
+                row[field] = _pick(item, keys)
+            if isinstance(row["provinces"], list):
+                row["provinces"] = "、".join(row["provinces"])
+            yield row
+
+
+def _format_cell(value, numeric: bool) -> str:
+    if value is None or value == "":
+        return ""
+    if numeric:
+        try:
+            return f"{float(value):.2f}"
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
+
+def build_price_table(
+    template_type: str, price_data: Optional[dict]
+) -> Optional[Tuple[List[str], List[tuple]]]:
+    """
+    整理文档中的价格表（单元格已格式化为字符串，数值保留两位小数）
+
+    只读取价格表所属分组和表格用到的字段（结果与按 iter_price_items 展开后筛选相同），
+    大表格渲染时不再为每行构造完整的明细字典
+
+    Returns:
+        (表头, 行列表)；模板类型没有价格表时返回None
+    """
+    table = PRICE_TABLES.get(template_type)
+    if table is None:
+        return None
+
+    columns = table["columns"]
+    headers = [header for header, _, _ in columns]
+    fields = [(field, PRICE_ITEM_KEYS[field], numeric) for _, field, numeric in columns]
+    items = (price_data or {}).get(table["group"])
+    rows = []
+    for item in items if isinstance(items, list) else ():
+        if not isinstance(item, dict):
+            continue
+        cells = []
+        for field, keys, numeric in fields:
+            value = _pick(item, keys)
+            if field == "provinces" and isinstance(value, list):
+                value = "、".join(value)
+            cells.append(_format_cell(value, numeric))
+        rows.append(tuple(cells))
+    return headers, rows
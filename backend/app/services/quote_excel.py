@@ -0,0 +1,146 @@
+"""
+报价单Excel
+样式和各模板类型的表格布局在进程内只构建一次，每次导出套用到新工作簿
+"""
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Tuple
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+from app.services.price_data import iter_price_items, PRICE_TABLES
+
+# 模板类型名称
+TEMPLATE_TYPE_LABELS = {
+    "TONGPIAO": "通票",
+    "DAKEHU": "大客户",
+    "CANGPEI": "仓配",
+}
+
+_thin = Side(style="thin", color="999999")
+_border = Border(left=_thin, right=_thin, top=_thin, bottom=_thin)
+
+# 命名样式定义：单元格只引用样式名，比逐个设置字体/填充/边框快一倍
+NAMED_STYLES = {
+    "quote_title": {"font": Font(size=14, bold=True)},
+    "quote_section": {"font": Font(size=12, bold=True)},
+    "quote_label": {"font": Font(bold=True)},
+    "price_header": {
+        "font": Font(bold=True),
+        "fill": PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"),
+        "border": _border,
+        "alignment": Alignment(horizontal="center", vertical="center"),
+    },
+    "price_text": {
+        "border": _border,
+        "alignment": Alignment(vertical="center", wrap_text=True),
+    },
+    "price_number": {
+        "border": _border,
+        "number_format": "0.00",
+        "alignment": Alignment(horizontal="right", vertical="center"),
+    },
+}
+
+# 价格表列宽（B列同时显示基本信息的值，保持较宽）
+COLUMN_WIDTHS = {
+    "TONGPIAO": [15, 30, 15, 15, 15, 20],
+    "DAKEHU": [15, 30, 15, 15],
+    "CANGPEI": [15, 30, 15, 15],
+}
+
+
+class QuoteExcelBuilder:
+    """报价单Excel生成器，持有预先整理好的样式和表格布局"""
+
+    def __init__(self):
+        self.named_styles = NAMED_STYLES
+        self.layouts: Dict[str, Tuple[List[tuple], Dict[str, float]]] = {}
+        for template_type, table in PRICE_TABLES.items():
+            columns = [
+                (field, "price_number" if numeric else "price_text")
+                for _, field, numeric in table["columns"]
+            ]
+            widths = {
+                chr(ord("A") + index): width
+                for index, width in enumerate(COLUMN_WIDTHS[template_type])
+            }
+            self.layouts[template_type] = (columns, widths)
+
+    def new_workbook(self, template_type: str) -> Workbook:
+        """创建已注册命名样式、设置好列宽的空白工作簿"""
+        wb = Workbook()
+        # NamedStyle注册时绑定到工作簿，每个工作簿需要新的实例
+        for name, attrs in self.named_styles.items():
+            wb.add_named_style(NamedStyle(name=name, **attrs))
+
+        ws = wb.active
+        ws.title = "报价单"
+        _, widths = self.layouts.get(template_type, self.layouts["TONGPIAO"])
+        for letter, width in widths.items():
+            ws.column_dimensions[letter].width = width
+        return wb
+
+    def build(self, quote, quoter) -> bytes:
+        """
+        生成报价单Excel
+
+        Returns:
+            xlsx文件字节
+        """
+        wb = self.new_workbook(quote.template_type)
+        ws = wb.active
+
+        # 标题
+        ws["A1"] = f"报价单编号: {quote.quote_number}"
+        ws["A1"].style = "quote_title"
+
+        # 基本信息
+        row = 3
+        for label, value in (
+            ("客户名称:", quote.customer_name),
+            ("联系人:", quote.contact_person),
+            ("联系电话:", quote.contact_phone),
+            ("报价日期:", str(quote.quote_date)),
+            ("有效期至:", str(quote.expire_date)),
+            ("报价人:", f"{quoter.name} ({quoter.phone})"),
+            ("价格模板:", TEMPLATE_TYPE_LABELS.get(quote.template_type, quote.template_type)),
+            ("是否含税:", "是" if quote.is_tax_included else "否"),
+        ):
+            ws.cell(row=row, column=1, value=label).style = "quote_label"
+            ws.cell(row=row, column=2, value=value)
+            row += 1
+
+        # 价格表
+        table = PRICE_TABLES.get(quote.template_type)
+        if table is not None:
+            row += 1
+            ws.cell(row=row, column=1, value="价格明细").style = "quote_section"
+
+            row += 1
+            for col, (header, _, _) in enumerate(table["columns"], start=1):
+                ws.cell(row=row, column=col, value=header).style = "price_header"
+
+            columns, _ = self.layouts[quote.template_type]
+            for item in iter_price_items(quote.price_data):
+                if item["group"] != table["group"]:
+                    continue
+                row += 1
+                for col, (field, style) in enumerate(columns, start=1):
+                    ws.cell(row=row, column=col, value=item[field]).style = style
+
+        if quote.remark:
+            row += 2
+            ws.cell(row=row, column=1, value="备注:").style = "quote_label"
+            ws.cell(row=row, column=2, value=quote.remark)
+
+        excel_file = BytesIO()
+        wb.save(excel_file)
+        return excel_file.getvalue()
+
+
+@lru_cache()
+def get_quote_excel_builder() -> QuoteExcelBuilder:
+    """获取报价单Excel生成器单例"""
+    return QuoteExcelBuilder()
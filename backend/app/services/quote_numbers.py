@@ -0,0 +1,65 @@
+"""
+报价单编号分配
+每个日期在 quote_number_counters 中一行计数，通过一条
+INSERT ... ON CONFLICT DO UPDATE ... RETURNING 原子递增，多个进程并发创建也不会重号
+"""
+from datetime import date, datetime
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.quote import QuoteNumberCounter
+
+QUOTE_NUMBER_PREFIX = "ZTO-JCYB"
+
+
+def format_quote_number(quote_date: date, seq: int) -> str:
+    """
+    格式化报价单编号
+    格式: ZTO-JCYB-{YYYYMMDD}-{序号}，序号至少两位，超过99时自然扩展为三位及以上
+    """
+    return f"{QUOTE_NUMBER_PREFIX}-{quote_date.strftime('%Y%m%d')}-{seq:02d}"
+
+
+def reserve_quote_numbers(db: Session, quote_date: date, count: int = 1) -> List[str]:
+    """
+    预留连续的报价单编号
+
+    计数行的行锁保持到事务结束：报价单保存失败回滚时编号一并回退，不产生空号；
+    同一天的并发创建在此排队，直到前一个事务提交
+
+    Args:
+        quote_date: 编号日期
+        count: 预留数量（批量创建时一次预留）
+
+    Returns:
+        编号列表（按序号递增）
+    """
+    if count < 1:
+        return []
+
+    stmt = insert(QuoteNumberCounter).values(
+        quote_date=quote_date,
+        last_seq=count,
+        updated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QuoteNumberCounter.quote_date],
+        set_={
+            "last_seq": QuoteNumberCounter.last_seq + stmt.excluded.last_seq,
+            "updated_at": stmt.excluded.updated_at,
+        }
+    ).returning(QuoteNumberCounter.last_seq)
+
+    last_seq = db.execute(stmt).scalar_one()
+    return [format_quote_number(quote_date, seq) for seq in range(last_seq - count + 1, last_seq + 1)]
+
+
+def peek_quote_number(db: Session, quote_date: date) -> str:
+    """下一个报价单编号（只读取，不预留；实际编号以保存时分配的为准）"""
+    last_seq = db.execute(
+        select(QuoteNumberCounter.last_seq).where(QuoteNumberCounter.quote_date == quote_date)
+    ).scalar()
+    return format_quote_number(quote_date, (last_seq or 0) + 1)
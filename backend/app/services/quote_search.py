@@ -0,0 +1,86 @@
+"""
+报价单关键字搜索
+客户名称、联系电话按子串匹配（ILIKE '%关键字%'），由 pg_trgm GIN 索引支持，不再顺序扫描报价单表。
+
+- 关键字少于3个字符时提取不出三元组，索引无法过滤，因此要求最小长度；
+  中文客户名称常用2字简称检索，含中文的关键字允许2个字，此时不使用索引，按ILIKE逐行匹配
+- 中文三元组依赖数据库的 LC_CTYPE 为UTF-8区域（如 C.UTF-8、en_US.UTF-8、zh_CN.UTF-8）；
+  LC_CTYPE 为 C 时 pg_trgm 不把中文当作单词字符，中文关键字提取不出三元组，全部退化为逐行匹配
+"""
+import re
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+from app.models.quote import Quote
+
+LIKE_ESCAPE = "\\"
+
+# 中日韩文字（含假名、韩文音节）
+CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+
+
+def min_keyword_length(keyword: str) -> int:
+    """关键字最小长度，含中文时较短"""
+    settings = get_settings()
+    if CJK_PATTERN.search(keyword):
+        return settings.QUOTE_SEARCH_MIN_LENGTH_CJK
+    return settings.QUOTE_SEARCH_MIN_LENGTH
+
+
+def normalize_keyword(keyword: Optional[str], label: str) -> Optional[str]:
+    """
+    整理搜索关键字
+
+    Returns:
+        去掉首尾空白的关键字，为空时返回None
+
+    Raises:
+        HTTPException: 关键字短于最小长度
+    """
+    if keyword is None:
+        return None
+    keyword = keyword.strip()
+    if not keyword:
+        return None
+
+    if len(keyword) < min_keyword_length(keyword):
+        settings = get_settings()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"{label}至少输入{settings.QUOTE_SEARCH_MIN_LENGTH}个字符"
+                f"（中文至少{settings.QUOTE_SEARCH_MIN_LENGTH_CJK}个字）"
+            )
+        )
+    return keyword
+
+
+def escape_like(keyword: str) -> str:
+    """转义LIKE通配符，用户输入的 % _ 按普通字符匹配"""
+    return (
+        keyword.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def contains(column, keyword: str):
+    """子串匹配条件（不区分大小写，可使用该列的三元组索引）"""
+    return column.ilike(f"%{escape_like(keyword)}%", escape=LIKE_ESCAPE)
+
+
+def apply_keyword_filters(
+    query,
+    customer_name: Optional[str] = None,
+    contact_phone: Optional[str] = None
+):
+    """应用客户名称、联系电话搜索条件"""
+    customer_name = normalize_keyword(customer_name, "客户名称")
+    if customer_name:
+        query = query.filter(contains(Quote.customer_name, customer_name))
+    contact_phone = normalize_keyword(contact_phone, "联系电话")
+    if contact_phone:
+        query = query.filter(contains(Quote.contact_phone, contact_phone))
+    return query
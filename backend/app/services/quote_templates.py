@@ -0,0 +1,175 @@
+"""
+报价单文档模板
+启动时加载并编译Jinja2模板，预先生成各主题的样式表
+"""
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+from app.services.price_data import build_price_table
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# 主题颜色配置
+THEMES = {
+    "blue": {"primary": "#0066CC", "secondary": "#E6F2FF"},
+    "gray": {"primary": "#666666", "secondary": "#F5F5F5"},
+    "beige": {"primary": "#8B7355", "secondary": "#FFF8DC"},
+}
+DEFAULT_THEME = "blue"
+
+# 流式输出的分块大小（字符数）
+STREAM_CHUNK_SIZE = 32 * 1024
+
+# 批量转义时的单元格、行分隔符（HTML文本中不会出现的控制字符）
+CELL_SEPARATOR = "\x1f"
+ROW_SEPARATOR = "\x1e"
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def join_escaped(rows: Sequence[Sequence[str]], cell_html: str, row_html: str) -> str:
+    """
+    转义并拼接二维文本：单元格之间插入 cell_html，行之间插入 row_html
+
+    整块文本只调用一次escape，替换分隔符后得到各行HTML；逐个单元格转义占大表格渲染耗时的大半。
+    文本本身含分隔符时退回逐个转义
+    """
+    if not rows:
+        return ""
+    raw = ROW_SEPARATOR.join([CELL_SEPARATOR.join(row) for row in rows])
+    if (
+        raw.count(CELL_SEPARATOR) == sum(map(len, rows)) - len(rows)
+        and raw.count(ROW_SEPARATOR) == len(rows) - 1
+    ):
+        return str(escape(raw)).replace(CELL_SEPARATOR, cell_html).replace(ROW_SEPARATOR, row_html)
+    return row_html.join([cell_html.join([str(escape(cell)) for cell in row]) for row in rows])
+
+
+def _rows_html(rows: Sequence[Sequence[str]], row_start: str, cell_html: str, row_end: str) -> Markup:
+    """已转义的多行HTML片段，每行为 row_start + 单元格 + row_end"""
+    if not rows:
+        return Markup("")
+    return Markup(row_start + join_escaped(rows, cell_html, row_end + "\n" + row_start) + row_end)
+
+
+def build_document_context(quote) -> dict:
+    """
+    准备模板变量：价格表与条款在Python中一次性整理好
+
+    HTML文档的价格行、条款预先转义为HTML片段（Markup），模板直接输出，
+    不在循环中逐个单元格自动转义；原始文本供Word文档使用
+    """
+    price_table = build_price_table(quote.template_type, quote.price_data)
+    price_headers, price_rows = price_table if price_table is not None else (None, None)
+    fixed_terms = [
+        (_text(term.get('title', '')), _text(term.get('content', '')))
+        for term in quote.fixed_terms or []
+    ]
+    optional_terms = [
+        (_text(term.get('title', '')), _text(term.get('content', '')))
+        for term in quote.optional_terms or []
+    ]
+    custom_terms = [_text(term) for term in quote.custom_terms or []]
+    return {
+        "price_headers": price_headers,
+        "price_rows": price_rows,
+        "fixed_terms": fixed_terms,
+        "optional_terms": optional_terms,
+        "custom_terms": custom_terms,
+        "price_rows_html": _rows_html(price_rows, "<tr><td>", "</td><td>", "</td></tr>"),
+        "fixed_terms_html": _rows_html(fixed_terms, "<p><strong>", ":</strong> ", "</p>"),
+        "optional_terms_html": _rows_html(optional_terms, "<p><strong>", ":</strong> ", "</p>"),
+        "custom_terms_html": _rows_html([(term,) for term in custom_terms], "<p>• ", "", "</p>"),
+    }
+
+
+class QuoteTemplates:
+    """已编译的报价单模板及各主题样式表"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR):
+        self.env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.document = self.env.get_template("quote/document.html")
+
+        styles = self.env.get_template("quote/styles.css")
+        self.stylesheets: Dict[str, Markup] = {
+            name: Markup(styles.render(colors=colors))
+            for name, colors in THEMES.items()
+        }
+
+    def stylesheet(self, theme: str) -> Markup:
+        """获取主题样式表，未知主题使用默认主题"""
+        return self.stylesheets.get(theme, self.stylesheets[DEFAULT_THEME])
+
+    def _generate(
+        self, quote, quoter, theme: str, context: Optional[dict], inline_styles: bool = True
+    ) -> Iterator[str]:
+        if context is None:
+            context = build_document_context(quote)
+        return self.document.generate(
+            quote=quote,
+            quoter=quoter,
+            stylesheet=self.stylesheet(theme) if inline_styles else None,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            **context,
+        )
+
+    def render_document(
+        self,
+        quote,
+        quoter,
+        theme: str = DEFAULT_THEME,
+        context: Optional[dict] = None,
+        inline_styles: bool = True,
+    ) -> str:
+        """
+        渲染完整的报价单HTML文档
+
+        Args:
+            context: 已整理好的文档数据，默认现场整理
+            inline_styles: 是否内嵌主题样式表；PDF渲染进程使用预先解析的样式表，不内嵌
+        """
+        return "".join(self._generate(quote, quoter, theme, context, inline_styles))
+
+    def stream_document(
+        self,
+        quote,
+        quoter,
+        theme: str = DEFAULT_THEME,
+        context: Optional[dict] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        分块渲染报价单HTML文档
+
+        模板逐段输出（头部、基本信息、价格行、条款），攒够 chunk_size 个字符产出一块，
+        不在内存中拼接完整文档
+        """
+        buffer: List[str] = []
+        size = 0
+        for piece in self._generate(quote, quoter, theme, context):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+
+@lru_cache()
+def get_quote_templates() -> QuoteTemplates:
+    """获取模板单例（每个进程编译一次）"""
+    return QuoteTemplates()
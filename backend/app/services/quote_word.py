@@ -0,0 +1,238 @@
+"""
+报价单Word文档
+模板 document.docx 在进程内只读取、解析一次。导出时复制正文并填充固定字段，
+价格行和条款按原型XML以字符串拼接生成（不逐个复制节点），
+再追加到预先压缩好的其余部件之后
+"""
+import re
+import zipfile
+from copy import deepcopy
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from lxml import etree
+
+from app.services.quote_templates import TEMPLATE_DIR
+
+WORD_TEMPLATE = TEMPLATE_DIR / "quote" / "document.docx"
+DOCUMENT_PART = "word/document.xml"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+NS_DECLARATION = re.compile(r'\sxmlns(?::\w+)?="[^"]*"')
+# XML不允许的控制字符
+INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _w(tag: str) -> str:
+    return f"{{{W_NS}}}{tag}"
+
+
+W_BODY = _w("body")
+W_P = _w("p")
+W_T = _w("t")
+W_TBL = _w("tbl")
+W_TBL_GRID = _w("tblGrid")
+W_GRID_COL = _w("gridCol")
+W_TR = _w("tr")
+W_TC = _w("tc")
+W_TC_WIDTH = f"{_w('tcPr')}/{_w('tcW')}"
+W_VAL_W = _w("w")
+
+
+def _clean(value) -> str:
+    return INVALID_XML_CHARS.sub("", str(value))
+
+
+def _xml_text(value) -> str:
+    """文本内容转义为XML"""
+    return escape(_clean(value), quote=False)
+
+
+def _fill(element, values: Dict[str, Optional[str]]) -> None:
+    """
+    替换元素内的占位符
+    占位符的值为None时删除所在段落
+    """
+    for paragraph in list(element.iter(W_P)):
+        nodes = [node for node in paragraph.iter(W_T) if node.text and "{" in node.text]
+        names = [name for node in nodes for name in PLACEHOLDER.findall(node.text) if name in values]
+        if not names:
+            continue
+        if any(values[name] is None for name in names):
+            paragraph.getparent().remove(paragraph)
+            continue
+        for node in nodes:
+            node.text = _clean(PLACEHOLDER.sub(
+                lambda match: str(values.get(match.group(1), match.group(0))), node.text
+            ))
+            node.set(XML_SPACE, "preserve")
+
+
+def _find(body, tag: str, placeholder: str):
+    """查找包含占位符的元素"""
+    for element in body.iter(tag):
+        if any(node.text and placeholder in node.text for node in element.iter(W_T)):
+            return element
+    return None
+
+
+def _fragment(element) -> str:
+    """
+    元素序列化为XML片段模板
+    去掉命名空间声明（由文档根节点提供），文本节点保留空白
+    """
+    for node in element.iter(W_T):
+        node.set(XML_SPACE, "preserve")
+    return NS_DECLARATION.sub("", etree.tostring(element, encoding="unicode"))
+
+
+def _substitute(template: str, values: Dict[str, str]) -> str:
+    """替换XML片段模板中的占位符（一次扫描，值中的花括号不会再被替换）"""
+    return PLACEHOLDER.sub(
+        lambda match: _xml_text(values[match.group(1)]) if match.group(1) in values else match.group(0),
+        template
+    )
+
+
+class _Expansions:
+    """原型元素先替换为注释标记，正文序列化后再把标记替换为生成的XML片段"""
+
+    def __init__(self):
+        self.fragments: Dict[str, str] = {}
+
+    def replace(self, prototype, xml: str) -> None:
+        marker = etree.Comment(f" expand-{len(self.fragments)} ")
+        prototype.addprevious(marker)
+        prototype.getparent().remove(prototype)
+        self.fragments[etree.tostring(marker, encoding="unicode")] = xml
+
+    def apply(self, document: str) -> str:
+        for marker, xml in self.fragments.items():
+            document = document.replace(marker, xml, 1)
+        return document
+
+
+class QuoteWordBuilder:
+    """报价单Word生成器，持有解析好的模板"""
+
+    def __init__(self, template_path: Path = WORD_TEMPLATE):
+        # 样式表等部件不随报价单变化，预先压缩打包，导出时只追加正文
+        package = BytesIO()
+        with zipfile.ZipFile(template_path) as source, \
+                zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if info.filename == DOCUMENT_PART:
+                    self.document = etree.fromstring(source.read(info))
+                else:
+                    target.writestr(info, source.read(info))
+        self.package = package.getvalue()
+
+    def _fill_price_table(
+        self, table, headers: Optional[List[str]], rows: Optional[List[tuple]], expansions: _Expansions
+    ) -> None:
+        if table is None:
+            return
+        if headers is None:
+            table.getparent().remove(table)
+            return
+
+        # 按列数均分表格宽度
+        grid = table.find(W_TBL_GRID)
+        grid_col = grid.find(W_GRID_COL)
+        width = str(int(grid_col.get(W_VAL_W)) // len(headers))
+        grid_col.set(W_VAL_W, width)
+        for _ in headers[1:]:
+            grid.append(deepcopy(grid_col))
+
+        # 行、单元格原型拆成前后两段字符串，逐行拼接
+        header_row, row_prototype = table.findall(W_TR)[:2]
+        for tr, values_list in ((header_row, [headers]), (row_prototype, rows)):
+            tc = tr.find(W_TC)
+            tc_width = tc.find(W_TC_WIDTH)
+            if tc_width is not None:
+                tc_width.set(W_VAL_W, width)
+            cell = _fragment(tc)
+            row_before, row_after = _fragment(tr).split(cell, 1)
+            cell_before, _, cell_after = PLACEHOLDER.split(cell, maxsplit=1)
+
+            expansions.replace(tr, "".join(
+                row_before
+                + "".join(cell_before + _xml_text(value) + cell_after for value in values)
+                + row_after
+                for values in values_list
+            ))
+
+    def _repeat(self, prototype, items: List[Dict[str, str]], expansions: _Expansions) -> None:
+        """按条目复制包含占位符的段落"""
+        if prototype is None:
+            return
+        template = _fragment(prototype)
+        expansions.replace(prototype, "".join(_substitute(template, item) for item in items))
+
+    def _package(self, document: bytes) -> bytes:
+        output = BytesIO(self.package)
+        output.seek(0, 2)
+        with zipfile.ZipFile(output, "a", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(DOCUMENT_PART, document)
+        return output.getvalue()
+
+    def build(self, quote, quoter, context: dict) -> bytes:
+        """
+        生成报价单Word
+
+        Args:
+            context: 文档数据（与HTML渲染共用，见 build_document_context）
+
+        Returns:
+            docx文件字节
+        """
+        root = deepcopy(self.document)
+        body = root.find(W_BODY)
+
+        # 先找到价格表、条款的原型并替换为标记：若先填充客户名称等字段，
+        # 值中含 {term_title} 之类文本的段落会被误当作原型
+        expansions = _Expansions()
+        self._fill_price_table(
+            _find(body, W_TBL, "{header}"),
+            context["price_headers"], context["price_rows"], expansions
+        )
+        self._repeat(_find(body, W_P, "{term_title}"), [
+            {"term_title": title, "term_content": content}
+            for title, content in context["fixed_terms"] + context["optional_terms"]
+        ], expansions)
+        self._repeat(_find(body, W_P, "{custom_term}"), [
+            {"custom_term": term} for term in context["custom_terms"]
+        ], expansions)
+
+        # 再填充固定占位符；原型已不在正文中，用户内容中的花括号不会被当作占位符
+        _fill(body, {
+            "quote_number": quote.quote_number,
+            "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M'),
+            "customer_name": quote.customer_name,
+            "contact_person": quote.contact_person,
+            "contact_phone": quote.contact_phone,
+            "quote_date": str(quote.quote_date),
+            "expire_date": str(quote.expire_date),
+            "quoter": f"{quoter.name} ({quoter.phone})",
+            "tax_note": "含税价格" if quote.is_tax_included else "不含税价格",
+            "fixed_heading": "服务条款" if context["fixed_terms"] else None,
+            "custom_heading": "特别说明" if context["custom_terms"] else None,
+            "remark": quote.remark or None,
+        })
+
+        document = expansions.apply(etree.tostring(root, encoding="unicode"))
+        return self._package((XML_DECLARATION + document).encode("utf-8"))
+
+
+@lru_cache()
+def get_quote_word_builder() -> QuoteWordBuilder:
+    """获取报价单Word生成器单例（每个进程解析一次模板）"""
+    return QuoteWordBuilder()
@@ -0,0 +1,173 @@
+"""
+导出准入控制
+限制每个进程同时执行的导出请求数，超出时短暂排队，队列已满或等待超时直接返回503，
+避免大量导出占满线程池，影响列表、登录等普通接口
+"""
+import asyncio
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Iterable
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+from app.config import get_settings
+
+
+class RenderRejected(Exception):
+    """导出请求被拒绝（队列已满或等待超时）"""
+
+
+class RenderAdmission:
+    """
+    导出并发控制（在事件循环中使用，非线程安全）
+
+    排队在事件循环中等待，不占用线程池线程；
+    名额释放时直接移交给队首的请求，先到先得
+    """
+
+    def __init__(self, max_concurrent: int = 4, queue_size: int = 8, queue_timeout: float = 10):
+        self.max_concurrent = max(max_concurrent, 1)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._admitted = 0
+        self._rejected = 0
+        self._queued = 0
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._peak_waiting = 0
+
+    async def acquire(self) -> float:
+        """
+        获取执行名额
+
+        Returns:
+            排队等待的秒数
+
+        Raises:
+            RenderRejected: 队列已满或等待超时
+        """
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self._admitted += 1
+            return 0.0
+
+        if len(self._waiters) >= self.queue_size:
+            self._rejected += 1
+            raise RenderRejected("导出队列已满")
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._queued += 1
+        self._peak_waiting = max(self._peak_waiting, len(self._waiters))
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            # 超时的同时恰好拿到名额时照常执行
+            if not future.done():
+                future.cancel()
+                self._rejected += 1
+                raise RenderRejected("导出排队超时")
+        except asyncio.CancelledError:
+            # 客户端断开：已移交的名额还回去
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+            raise
+        finally:
+            try:
+                self._waiters.remove(future)
+            except ValueError:
+                pass
+
+        waited = time.monotonic() - start
+        self._admitted += 1
+        self._waited += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        return waited
+
+    def release(self) -> None:
+        """释放名额；有排队请求时直接移交"""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def stats(self) -> dict:
+        """准入统计"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "queue_size": self.queue_size,
+            "active": self._active,
+            "waiting": len(self._waiters),
+            "peak_waiting": self._peak_waiting,
+            "admitted": self._admitted,
+            "queued": self._queued,
+            "rejected": self._rejected,
+            "wait_avg_ms": (
+                round(self._wait_total / self._waited * 1000, 3) if self._waited else 0.0
+            ),
+            "wait_max_ms": round(self._wait_max * 1000, 3),
+        }
+
+
+class RenderAdmissionMiddleware:
+    """
+    导出接口准入中间件
+
+    在响应（含流式响应）全部发送完成后才释放名额，
+    ZIP、汇总表等边生成边发送的导出同样计入并发
+    """
+
+    def __init__(self, app, path_prefix: str, exclude: Iterable[str] = ()):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.exclude = set(exclude)
+
+    def _guarded(self, scope) -> bool:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            return False
+        path = scope["path"]
+        return path.startswith(self.path_prefix) and path not in self.exclude
+
+    async def __call__(self, scope, receive, send):
+        if not self._guarded(scope):
+            await self.app(scope, receive, send)
+            return
+
+        admission = get_render_admission()
+        try:
+            await admission.acquire()
+        except RenderRejected:
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "导出繁忙，请稍后重试"},
+                headers={"Retry-After": str(get_settings().RENDER_RETRY_AFTER)}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission.release()
+
+
+@lru_cache()
+def get_render_admission() -> RenderAdmission:
+    """获取导出准入控制单例（每个进程一个）"""
+    settings = get_settings()
+    return RenderAdmission(
+        max_concurrent=settings.RENDER_MAX_CONCURRENT,
+        queue_size=settings.RENDER_QUEUE_SIZE,
+        queue_timeout=settings.RENDER_QUEUE_TIMEOUT,
+    )
@@ -0,0 +1,126 @@
+"""
+报价单渲染缓存
+按 (报价单ID, 报价单更新时间, 报价人ID, 报价人更新时间, 主题) 缓存渲染后的HTML，
+以及各格式共用的文档数据
+"""
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Hashable, Optional, Tuple
+
+from app.config import get_settings
+
+RenderKey = Tuple[int, Optional[datetime], int, Optional[datetime], str]
+
+
+def make_render_key(quote, quoter, theme: str) -> RenderKey:
+    """
+    生成缓存键
+
+    键中包含更新时间，数据修改后旧条目自然失效；
+    多个uvicorn进程各自持有缓存，也不会读到过期内容。
+    """
+    return (quote.id, quote.updated_at, quoter.id, quoter.updated_at, theme)
+
+
+def estimate_size(value) -> int:
+    """估算缓存值占用的内存（递归计入列表、元组、字典的元素）"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class RenderCache:
+    """按内存占用淘汰的LRU渲染缓存（线程安全）"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[object, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        """读取缓存，命中时移到队尾"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_render(self, key: Hashable, render: Callable[[], object]):
+        """命中直接返回，否则渲染并写入缓存"""
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.put(key, value)
+        return value
+
+    def _discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self.current_bytes -= self._entries.pop(key)[1]
+            return len(keys)
+
+    def invalidate_quote(self, quote_id: int) -> int:
+        """清除某个报价单的全部缓存"""
+        return self._discard(lambda key: key[0] == quote_id)
+
+    def invalidate_quoter(self, quoter_id: int) -> int:
+        """清除引用某个报价人的全部缓存"""
+        return self._discard(lambda key: key[2] == quoter_id)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """缓存统计"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+@lru_cache()
+def get_render_cache() -> RenderCache:
+    """获取渲染缓存单例"""
+    return RenderCache(max_bytes=get_settings().RENDER_CACHE_MAX_BYTES)
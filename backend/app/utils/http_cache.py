@@ -0,0 +1,140 @@
+"""
+HTTP条件请求工具
+根据报价单及报价人的更新时间生成 ETag / Last-Modified，
+处理 If-None-Match / If-Modified-Since，内容未变化时返回304
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.models.quote import Quote
+from app.models.quoter import Quoter
+
+# 需登录访问的内容只允许浏览器私有缓存，且每次使用前重新验证
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """
+    由版本信息生成ETag
+
+    使用弱ETag：HTML/PDF中含生成时间，同一版本的内容字节不完全相同，但语义等价
+    """
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def quote_validators(
+    quote_id: int,
+    quote_updated_at: datetime,
+    quoter_id: Optional[int],
+    quoter_updated_at: Optional[datetime],
+    variant: str = ""
+) -> Dict[str, str]:
+    """
+    生成报价单资源的缓存验证响应头
+
+    Args:
+        variant: 资源表示（如 json、pdf:blue），同一报价单的不同格式、主题使用不同ETag
+    """
+    last_modified = max(filter(None, (quote_updated_at, quoter_updated_at)))
+    return {
+        "ETag": make_etag(
+            quote_id, quote_updated_at.isoformat(),
+            quoter_id, quoter_updated_at.isoformat() if quoter_updated_at else "",
+            variant
+        ),
+        # 数据库中的时间为UTC
+        "Last-Modified": format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+
+def quote_headers(quote: Quote, quoter: Optional[Quoter], variant: str = "") -> Dict[str, str]:
+    """由已加载的报价单及报价人生成缓存验证响应头"""
+    return quote_validators(
+        quote.id, quote.updated_at,
+        quote.quoter_id, quoter.updated_at if quoter else None,
+        variant
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 弱比较"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    """If-Modified-Since 比较（HTTP日期精确到秒）"""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    判断客户端缓存是否仍然有效
+    同时提供两个条件时以 If-None-Match 为准
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, headers["ETag"])
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        return _not_modified_since(if_modified_since, headers["Last-Modified"])
+    return False
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    """304响应（不含响应体）"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def check_quote_not_modified(
+    request: Request, db: Session, quote_id: int, variant: str = ""
+) -> Optional[Response]:
+    """
+    检查报价单资源是否未修改
+
+    只查询更新时间等少量列，不加载price_data等JSON字段；
+    客户端未携带条件请求头时不查询
+
+    Returns:
+        未修改时返回304响应，否则返回None（报价单不存在时也返回None，由后续完整查询报错）
+    """
+    if "if-none-match" not in request.headers and "if-modified-since" not in request.headers:
+        return None
+
+    row = db.query(
+        Quote.updated_at, Quote.quoter_id, Quoter.updated_at
+    ).outerjoin(
+        Quoter, Quoter.id == Quote.quoter_id
+    ).filter(Quote.id == quote_id).first()
+    if row is None:
+        return None
+
+    quote_updated_at, quoter_id, quoter_updated_at = row
+    headers = quote_validators(quote_id, quote_updated_at, quoter_id, quoter_updated_at, variant)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return None
@@ -0,0 +1,103 @@
+"""
+列表分页工具
+按排序键做游标（keyset）分页：WHERE (排序键) < (上一页最后一行) ORDER BY 排序键 LIMIT n，
+深页与首页耗时相同，翻页期间插入新记录也不会错位；未传游标时按 skip 偏移分页
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+
+# 下一页游标响应头（列表响应体保持为数组）
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence) -> str:
+    """排序键的值编码为不透明游标"""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> Tuple:
+    """
+    解析游标
+
+    Raises:
+        HTTPException: 游标格式不正确或与排序键不匹配
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError(cursor)
+        return tuple(_decode_value(column, value) for column, value in zip(columns, values))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="分页游标无效"
+        )
+
+
+def paginate(
+    query,
+    columns: Sequence,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    descending: bool = False,
+    response: Optional[Response] = None
+) -> List:
+    """
+    按排序键分页
+
+    Args:
+        query: 已应用筛选条件、未排序的查询
+        columns: 排序键（最后一列须唯一，通常为主键），需有对应的组合索引
+        limit: 每页记录数
+        cursor: 上一页返回的游标；传入时忽略 skip
+        skip: 未传游标时的偏移量（兼容旧的翻页方式）
+        descending: 是否倒序（各列方向一致，可使用行值比较走组合索引）
+        response: 有下一页时在响应头 X-Next-Cursor 中返回游标
+
+    Returns:
+        当前页记录
+    """
+    query = query.order_by(*(column.desc() if descending else column for column in columns))
+    if cursor:
+        key, values = tuple_(*columns), tuple_(*decode_cursor(cursor, columns))
+        query = query.filter(key < values if descending else key > values)
+    elif skip:
+        query = query.offset(skip)
+
+    # 多取一条判断是否还有下一页
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows
+
+    rows = rows[:limit]
+    if response is not None:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, column.key) for column in columns]
+        )
+    return rows
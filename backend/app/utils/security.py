@@ -46,3 +46,23 @@ def decode_access_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def _share_key() -> str:
+    """分享链接签名密钥（由SECRET_KEY派生，分享令牌不能当作登录令牌使用）"""
+    return f"{settings.SECRET_KEY}:share"
+
+
+def create_share_token(data: dict, expires_delta: timedelta) -> str:
+    """创建报价单分享令牌"""
+    to_encode = data.copy()
+    to_encode.update({"exp": datetime.utcnow() + expires_delta})
+    return jwt.encode(to_encode, _share_key(), algorithm=settings.ALGORITHM)
+
+
+def decode_share_token(token: str) -> Optional[dict]:
+    """解码分享令牌，签名无效或已过期时返回None"""
+    try:
+        return jwt.decode(token, _share_key(), algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
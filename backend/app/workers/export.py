@@ -0,0 +1,120 @@
+"""
+导出任务Worker
+从 export_jobs 表领取任务并渲染，与API进程分开部署、独立扩容
+
+用法:
+    EXPORT_JOB_BACKEND=postgres python -m app.workers.export --concurrency 2
+
+结果文件写入 UPLOAD_DIR/jobs，需与API进程共享该目录
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+
+from app.config import get_settings
+from app.api.export_jobs import run_export_job
+from app.services.export_jobs import PostgresJobStore, get_job_store, cleanup_job_files
+from app.services.pdf_renderer import get_pdf_render_pool
+from app.services.quote_templates import get_quote_templates
+
+logger = logging.getLogger("app.workers.export")
+
+
+def work_loop(store: PostgresJobStore, worker_id: str, stop: threading.Event, poll_interval: float) -> None:
+    """循环领取并执行任务，收到停止信号后处理完当前任务再退出"""
+    while not stop.is_set():
+        try:
+            job_id = store.claim(worker_id)
+        except Exception:
+            logger.exception("领取导出任务失败")
+            stop.wait(poll_interval)
+            continue
+
+        if job_id is None:
+            stop.wait(poll_interval)
+            continue
+
+        logger.info("开始导出任务: %s", job_id)
+        run_export_job(job_id)
+        logger.info("导出任务结束: %s", job_id)
+
+
+def maintain(store: PostgresJobStore, stop: threading.Event) -> None:
+    """定期回收中断的任务，清理过期任务记录和结果文件"""
+    settings = get_settings()
+    interval = max(settings.EXPORT_JOB_STALE_AFTER // 2, 1)
+    while not stop.is_set():
+        try:
+            store.requeue_stale(settings.EXPORT_JOB_STALE_AFTER, settings.EXPORT_JOB_MAX_ATTEMPTS)
+            store.purge_finished(settings.EXPORT_JOB_TTL)
+            cleanup_job_files(settings.EXPORT_JOB_TTL)
+        except Exception:
+            logger.exception("导出任务维护失败")
+        stop.wait(interval)
+
+
+def main(argv=None) -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="导出任务Worker")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.EXPORT_JOB_WORKERS,
+        help="同时执行的任务数"
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=settings.EXPORT_JOB_POLL_INTERVAL,
+        help="空闲时轮询间隔(秒)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    store = get_job_store()
+    if not isinstance(store, PostgresJobStore):
+        logger.error("独立Worker需要设置 EXPORT_JOB_BACKEND=postgres")
+        return 1
+
+    get_quote_templates()
+    pdf_pool = get_pdf_render_pool()
+    pdf_pool.start()
+
+    stop = threading.Event()
+
+    def handle_signal(signum, frame):
+        logger.info("收到信号 %s，处理完当前任务后退出", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+    threads = [
+        threading.Thread(
+            target=work_loop,
+            args=(store, f"{worker_prefix}:{i}", stop, args.poll_interval),
+            name=f"export-worker-{i}",
+        )
+        for i in range(max(args.concurrency, 1))
+    ]
+    for thread in threads:
+        thread.start()
+    logger.info("导出Worker已启动: %s, 并发数 %d", worker_prefix, len(threads))
+
+    try:
+        maintain(store, stop)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        pdf_pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
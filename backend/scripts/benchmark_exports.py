@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+导出性能基准脚本
+对比HTML渲染、PDF进程池渲染、Word生成以及各模板类型Excel生成的耗时；
+PDF另在新进程中对比首次（冷）与后续（热，复用字体配置和样式表）的每页耗时
+
+用法: python scripts/benchmark_exports.py [--sizes 6,200,2000] [--rounds 20] [--skip-pdf]
+"""
+import argparse
+import multiprocessing
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.api.exports import render_quote_html, build_quote_excel, build_quote_word
+from app.services.render_cache import get_render_cache
+from app.services.quote_templates import get_quote_templates, build_document_context
+from app.services.pdf_renderer import PdfRenderPool
+from concurrent.futures import ProcessPoolExecutor
+
+
+def make_price_data(template_type: str, rows: int) -> dict:
+    """构造指定行数的价格数据"""
+    if template_type == "TONGPIAO":
+        return {
+            "regions": [
+                {
+                    "regionName": f"{i + 1}区",
+                    "provinces": ["江苏", "浙江", "安徽", "上海"],
+                    "firstWeight": 3.5 + i,
+                    "additionalWeight": 1.2 + i / 10,
+                    "remark": "次日达",
+                }
+                for i in range(rows)
+            ]
+        }
+    return {
+        "weightRanges": [
+            {
+                "id": str(i),
+                "range": f"{i}-{i + 1}kg",
+                "start_weight": i,
+                "end_weight": i + 1,
+                "price": 2.5 + i / 10,
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def make_quote(regions: int = 6, terms: int = 10, template_type: str = "TONGPIAO"):
+    """构造测试用报价单（不依赖数据库）"""
+    quote = SimpleNamespace(
+        id=1,
+        quote_number="ZTO-JCYB-20250101-01",
+        customer_name="测试客户有限公司",
+        contact_person="张三",
+        contact_phone="13800000000",
+        quote_date=date(2025, 1, 1),
+        expire_date=date(2025, 1, 31),
+        is_tax_included=True,
+        template_type=template_type,
+        price_data=make_price_data(template_type, regions),
+        fixed_terms=[{"title": f"条款{i}", "content": "内容" * 20} for i in range(terms)],
+        optional_terms=[{"title": f"可选条款{i}", "content": "内容" * 20} for i in range(terms)],
+        custom_terms=[f"特别说明{i}" for i in range(terms)],
+        remark="备注",
+        updated_at=datetime(2025, 1, 1),
+    )
+    quoter = SimpleNamespace(id=1, name="李四", phone="13900000000", updated_at=datetime(2025, 1, 1))
+    return quote, quoter
+
+
+def measure(func, rounds: int) -> dict:
+    """多次执行并统计耗时(毫秒)"""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "mean_ms": round(statistics.mean(samples), 3),
+        "p50_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def measure_pdf_fonts(inline_html: str, html: str, rounds: int) -> dict:
+    """
+    在新进程中执行：首次渲染加载字体和样式表（冷），之后复用（热）；
+    另测内嵌样式、每次新建字体配置的渲染作为对照
+    """
+    from weasyprint import HTML
+    from app.services.pdf_renderer import _render_pdf
+
+    pages = len(HTML(string=inline_html).render().pages)
+    start = time.perf_counter()
+    _render_pdf(html, "blue")
+    cold = (time.perf_counter() - start) * 1000
+
+    warm = measure(lambda: _render_pdf(html, "blue"), rounds)
+    inline = measure(lambda: _render_pdf(inline_html), rounds)
+    return {
+        "pages": pages,
+        "cold_ms_per_page": round(cold / pages, 3),
+        "warm_ms_per_page": round(warm["mean_ms"] / pages, 3),
+        "inline_ms_per_page": round(inline["mean_ms"] / pages, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="导出性能基准")
+    parser.add_argument("--sizes", default="6,200,2000", help="区域/条款数量，逗号分隔")
+    parser.add_argument("--rounds", type=int, default=20, help="执行轮数")
+    parser.add_argument("--skip-pdf", action="store_true", help="跳过PDF渲染")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    pool = None if args.skip_pdf else PdfRenderPool(workers=1, timeout=60)
+    try:
+        for size in sizes:
+            quote, quoter = make_quote(regions=size, terms=size)
+            html = render_quote_html(quote, quoter)
+
+            print(f"区域数/条款数: {size}, 轮数: {args.rounds}, HTML大小: {len(html.encode('utf-8'))}字节")
+            print("  HTML:", measure(lambda: render_quote_html(quote, quoter), args.rounds))
+
+            # 文档数据（价格表、已转义的价格行和条款）在渲染缓存中时只执行模板
+            templates = get_quote_templates()
+            context = build_document_context(quote)
+            print("  HTML(文档数据已缓存):", measure(
+                lambda: templates.render_document(quote, quoter, context=context), args.rounds
+            ))
+            # 流式输出的首块耗时（不命中缓存，文档数据已准备好）
+            print("  HTML首块:", measure(
+                lambda: next(templates.stream_document(quote, quoter, context=context)), args.rounds
+            ))
+
+            # Word与HTML共用缓存的文档数据，测试用报价单ID和版本相同，先清空缓存
+            get_render_cache().clear()
+            word_size = len(build_quote_word(quote, quoter))
+            result = measure(lambda: build_quote_word(quote, quoter), args.rounds)
+            print(f"  Word({word_size}字节):", result)
+
+            for template_type in ("TONGPIAO", "DAKEHU", "CANGPEI"):
+                excel_quote, _ = make_quote(regions=size, terms=size, template_type=template_type)
+                size_bytes = len(build_quote_excel(excel_quote, quoter))
+                result = measure(lambda: build_quote_excel(excel_quote, quoter), args.rounds)
+                print(f"  Excel({template_type}, {size_bytes}字节):", result)
+
+            if pool is None:
+                continue
+            try:
+                print("  PDF :", measure(lambda: pool.render(html), args.rounds))
+                pdf_html = get_quote_templates().render_document(quote, quoter, inline_styles=False)
+                with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    print("  PDF字体缓存:", executor.submit(
+                        measure_pdf_fonts, html, pdf_html, args.rounds
+                    ).result())
+            except Exception as exc:
+                print(f"  PDF : 跳过 ({exc})")
+                pool.shutdown()
+                pool = None
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
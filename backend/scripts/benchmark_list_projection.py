@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+列表投影基准
+在PostgreSQL中批量生成带完整价格数据、条款的报价单和模板，对比读取整行（投影前）与只读取列表列
+（投影后）的报价单列表、仪表盘最近报价单、模板列表：
+- 从PostgreSQL传输的字节数（按文本协议估算：sum(octet_length(行::text))）
+- 响应耗时（查询 + 按响应模型序列化为JSON）与响应体字节数
+结束后删除生成的数据
+
+需要连接PostgreSQL（DATABASE_URL），数据库中至少有一个报价人
+
+用法: python scripts/benchmark_list_projection.py [--rows 100000] [--regions 31] [--terms 10] [--rounds 5]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from benchmark_exports import measure, make_quote, make_price_data
+from benchmark_pagination import seed, cleanup, SEED_PREFIX
+from benchmark_search import LIST_LIMIT
+from app.database import SessionLocal
+from app.models.quote import Quote
+from app.models.quoter import Quoter
+from app.models.template import Template, TemplateType
+from app.schemas.quote import QuoteListItem
+from app.schemas.template import TemplateListItem
+from app.api.quotes import QUOTE_LIST_ORDER, QUOTE_LIST_COLUMNS
+from app.api.templates import TEMPLATE_LIST_ORDER, TEMPLATE_LIST_COLUMNS
+
+# 仪表盘最近报价单数量（与概览接口默认值一致）
+RECENT_LIMIT = 5
+TEMPLATE_COUNT = 100
+
+
+def fill_json_columns(db, regions: int, terms: int) -> None:
+    """为生成的报价单写入实际大小的价格数据和条款"""
+    quote, _ = make_quote(regions=regions, terms=terms)
+    db.execute(text("""
+        UPDATE quotes
+        SET price_data = CAST(:price_data AS json), fixed_terms = CAST(:fixed_terms AS json),
+            optional_terms = CAST(:optional_terms AS json), custom_terms = CAST(:custom_terms AS json)
+        WHERE quote_number LIKE :pattern
+    """), {
+        "price_data": json.dumps(quote.price_data, ensure_ascii=False),
+        "fixed_terms": json.dumps(quote.fixed_terms, ensure_ascii=False),
+        "optional_terms": json.dumps(quote.optional_terms, ensure_ascii=False),
+        "custom_terms": json.dumps(quote.custom_terms, ensure_ascii=False),
+        "pattern": SEED_PREFIX + "%",
+    })
+    db.commit()
+    db.execute(text("ANALYZE quotes"))
+
+
+def seed_templates(db, regions: int) -> None:
+    db.add_all([
+        Template(
+            name=f"{SEED_PREFIX}{i}",
+            template_type=TemplateType.TONGPIAO,
+            template_data=make_price_data("TONGPIAO", regions),
+            is_default=False,
+            is_active=True,
+        )
+        for i in range(TEMPLATE_COUNT)
+    ])
+    db.commit()
+
+
+def cleanup_templates(db) -> None:
+    db.execute(text("DELETE FROM templates WHERE name LIKE :pattern"), {"pattern": SEED_PREFIX + "%"})
+    db.commit()
+
+
+def transferred_bytes(db, query) -> int:
+    """查询结果从PostgreSQL传输的字节数（文本协议下各列值的文本长度之和）"""
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    result = db.connection().exec_driver_sql(
+        f"SELECT coalesce(sum(octet_length(t::text)), 0) FROM ({compiled}) AS t", compiled.params
+    )
+    return result.scalar()
+
+
+def respond(db, query, adapter: TypeAdapter) -> bytes:
+    """与列表接口相同：执行查询并按响应模型序列化"""
+    # 清空会话，整行查询每轮都重新构造ORM对象
+    db.expunge_all()
+    return adapter.dump_json(adapter.validate_python(query.all(), from_attributes=True))
+
+
+def list_cases(db) -> list:
+    """用例: (名称, 投影前查询, 投影后查询, 响应模型)"""
+    quote_order = [column.desc() for column in QUOTE_LIST_ORDER]
+    template_order = [column.desc() for column in TEMPLATE_LIST_ORDER]
+    quotes = TypeAdapter(List[QuoteListItem])
+    templates = TypeAdapter(List[TemplateListItem])
+    return [
+        (
+            "报价单列表",
+            db.query(Quote).order_by(*quote_order).limit(LIST_LIMIT),
+            db.query(*QUOTE_LIST_COLUMNS).order_by(*quote_order).limit(LIST_LIMIT),
+            quotes,
+        ),
+        (
+            "仪表盘最近报价单",
+            db.query(Quote).order_by(*quote_order).limit(RECENT_LIMIT),
+            db.query(*QUOTE_LIST_COLUMNS).order_by(*quote_order).limit(RECENT_LIMIT),
+            quotes,
+        ),
+        (
+            "模板列表(include_data=false)",
+            db.query(Template).filter(Template.is_active.is_(True)).order_by(*template_order).limit(LIST_LIMIT),
+            db.query(*TEMPLATE_LIST_COLUMNS).filter(Template.is_active.is_(True)).order_by(*template_order).limit(LIST_LIMIT),
+            templates,
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="列表投影基准")
+    parser.add_argument("--rows", type=int, default=100000, help="生成的报价单数")
+    parser.add_argument("--regions", type=int, default=31, help="价格数据区域数")
+    parser.add_argument("--terms", type=int, default=10, help="每类条款数量")
+    parser.add_argument("--rounds", type=int, default=5, help="每项执行轮数")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        quoter = db.query(Quoter).first()
+        if quoter is None:
+            print("数据库中没有报价人，请先执行 scripts/init_data.py")
+            sys.exit(1)
+        print(f"生成 {args.rows} 条报价单、{TEMPLATE_COUNT} 个模板...")
+        seed(db, quoter.id, args.rows)
+        fill_json_columns(db, args.regions, args.terms)
+        seed_templates(db, args.regions)
+
+        for name, full_query, projected_query, adapter in list_cases(db):
+            print(f"{name}:")
+            for label, query in (("投影前", full_query), ("投影后", projected_query)):
+                body = respond(db, query, adapter)
+                stats = measure(lambda: respond(db, query, adapter), args.rounds)
+                print(
+                    f"  {label}: 传输 {transferred_bytes(db, query)} 字节，"
+                    f"响应体 {len(body)} 字节，{stats}"
+                )
+    finally:
+        db.rollback()
+        cleanup(db)
+        cleanup_templates(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
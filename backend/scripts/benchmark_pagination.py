@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+列表分页基准
+在PostgreSQL中批量生成报价单，对比偏移分页（OFFSET）与游标分页在不同页深度的耗时：
+偏移分页随页码线性增长，游标分页与首页基本相同。结束后删除生成的数据
+
+需要连接PostgreSQL（DATABASE_URL），数据库中至少有一个报价人
+
+用法: python scripts/benchmark_pagination.py [--rows 100000] [--pages 1,10,100,1000] [--limit 100] [--rounds 5]
+"""
+import argparse
+import hashlib
+import sys
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+
+from benchmark_exports import measure
+from app.database import SessionLocal
+from app.models.quoter import Quoter
+from app.api.quotes import QUOTE_LIST_ORDER, QUOTE_LIST_COLUMNS
+from app.utils.pagination import paginate, encode_cursor
+
+# 生成数据的编号前缀，结束后按前缀删除
+SEED_PREFIX = "BENCH-PAGE-"
+
+
+# 客户名称中的地名、行业（组合约1000种，中文关键字搜索有足够的选择性）
+SEED_CITIES = (
+    "北京", "上海", "广州", "深圳", "杭州", "南京", "苏州", "成都", "重庆", "武汉",
+    "西安", "长沙", "郑州", "青岛", "厦门", "福州", "合肥", "济南", "沈阳", "大连",
+    "天津", "宁波", "无锡", "昆明", "贵阳", "南宁", "南昌", "太原", "石家庄", "哈尔滨",
+    "长春", "兰州", "乌鲁木齐", "呼和浩特", "银川", "西宁", "海口", "拉萨", "温州", "义乌",
+)
+SEED_TRADES = (
+    "商贸", "电子", "服饰", "食品", "家居", "五金", "医药", "化工", "机械", "物流",
+    "科技", "建材", "纺织", "日化", "文具", "玩具", "灯饰", "汽配", "母婴", "茶叶",
+    "酒业", "农业", "印刷", "包装", "陶瓷",
+)
+
+
+def seed_name_words(n: int) -> str:
+    """第n行客户名称中的地名+行业"""
+    return SEED_CITIES[n % len(SEED_CITIES)] + SEED_TRADES[n // len(SEED_CITIES) % len(SEED_TRADES)]
+
+
+def seed_name_code(n: int) -> str:
+    """第n行客户名称中的编码（各行不同）"""
+    return hashlib.md5(str(n).encode()).hexdigest()[:8]
+
+
+def seed_customer_name(n: int) -> str:
+    """第n行的客户名称（与数据库端生成规则一致，供搜索基准选取关键字）"""
+    return f"基准{seed_name_words(n)}{seed_name_code(n)}有限公司"
+
+
+def seed_contact_phone(n: int) -> str:
+    """第n行的联系电话"""
+    return f"138{n:08d}"
+
+
+def seed(db, quoter_id: int, rows: int) -> None:
+    """
+    在数据库端批量生成报价单
+    创建时间逐行递减（部分重复以覆盖id排序），客户名称、联系电话各不相同；
+    报价日期分布在近两年，状态按 草稿20%/已发送20%/已确认20%/已过期40% 分布。
+    生成后 VACUUM ANALYZE：新行先写入GIN索引的待合并列表，未合并时规划器会高估索引扫描代价
+    """
+    db.execute(text("""
+        INSERT INTO quotes (
+            quote_number, customer_name, contact_person, contact_phone, quoter_id,
+            quote_date, valid_days, expire_date, template_type, price_data,
+            is_tax_included, status, created_at, updated_at
+        )
+        SELECT :prefix || n,
+               '基准' || (CAST(:cities AS text[]))[n % :city_count + 1]
+                      || (CAST(:trades AS text[]))[n / :city_count % :trade_count + 1]
+                      || left(md5(n::text), 8) || '有限公司',
+               '测试',
+               '138' || lpad(n::text, 8, '0'), :quoter_id,
+               CURRENT_DATE - n % 730, 30, CURRENT_DATE - n % 730 + 30, 'TONGPIAO', '{"regions": []}',
+               true,
+               CAST(CASE
+                   WHEN n % 10 < 2 THEN 'DRAFT'
+                   WHEN n % 10 < 4 THEN 'SENT'
+                   WHEN n % 10 < 6 THEN 'CONFIRMED'
+                   ELSE 'EXPIRED'
+               END AS quotestatus),
+               now() - (n / 2) * interval '1 second',
+               now() - (n / 2) * interval '1 second'
+        FROM generate_series(1, :rows) AS n
+    """), {
+        "prefix": SEED_PREFIX, "quoter_id": quoter_id, "rows": rows,
+        "cities": list(SEED_CITIES), "city_count": len(SEED_CITIES),
+        "trades": list(SEED_TRADES), "trade_count": len(SEED_TRADES),
+    })
+    db.commit()
+    # VACUUM 不能在事务中执行
+    with db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE quotes"))
+
+
+def cleanup(db) -> None:
+    db.execute(text("DELETE FROM quotes WHERE quote_number LIKE :pattern"), {"pattern": SEED_PREFIX + "%"})
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="列表分页基准")
+    parser.add_argument("--rows", type=int, default=100000, help="生成的报价单数")
+    parser.add_argument("--pages", default="1,10,100,1000", help="页码，逗号分隔")
+    parser.add_argument("--limit", type=int, default=100, help="每页记录数")
+    parser.add_argument("--rounds", type=int, default=5, help="每项执行轮数")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        quoter = db.query(Quoter).first()
+        if quoter is None:
+            print("数据库中没有报价人，请先执行 scripts/init_data.py")
+            sys.exit(1)
+        print(f"生成 {args.rows} 条报价单...")
+        seed(db, quoter.id, args.rows)
+
+        for page in (int(value) for value in args.pages.split(",")):
+            skip = (page - 1) * args.limit
+            # 游标取自上一页最后一行（实际翻页时由上一页响应返回）
+            cursor = None
+            if skip:
+                last = db.query(*QUOTE_LIST_ORDER).order_by(
+                    *(column.desc() for column in QUOTE_LIST_ORDER)
+                ).offset(skip - 1).limit(1).first()
+                if last is None:
+                    print(f"第{page}页: 超出数据范围，跳过")
+                    continue
+                cursor = encode_cursor(last)
+
+            offset_stats = measure(
+                lambda: paginate(db.query(*QUOTE_LIST_COLUMNS), QUOTE_LIST_ORDER, args.limit, skip=skip, descending=True),
+                args.rounds
+            )
+            cursor_stats = measure(
+                lambda: paginate(db.query(*QUOTE_LIST_COLUMNS), QUOTE_LIST_ORDER, args.limit, cursor=cursor, descending=True),
+                args.rounds
+            )
+            print(f"第{page}页: offset {offset_stats}")
+            print(f"{'':>{len(str(page)) + 3}}  cursor {cursor_stats}")
+    finally:
+        cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
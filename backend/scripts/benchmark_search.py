@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+报价单搜索基准
+在PostgreSQL中批量生成报价单，对客户名称、联系电话子串搜索：
+- 检查执行计划（EXPLAIN）使用三元组索引、没有顺序扫描报价单表，不满足时退出码1
+- 对比使用索引与禁用索引（相当于迁移前的顺序扫描）的耗时
+结束后删除生成的数据
+
+需要连接PostgreSQL（DATABASE_URL）并已执行迁移 006，数据库中至少有一个报价人
+
+用法: python scripts/benchmark_search.py [--rows 1000000] [--rounds 5] [--keep-data]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+
+from benchmark_exports import measure
+from benchmark_pagination import seed, cleanup, seed_name_code, seed_name_words, seed_contact_phone
+from app.database import SessionLocal
+from app.models.quote import Quote
+from app.models.quoter import Quoter
+from app.api.quotes import apply_quote_filters, QUOTE_LIST_ORDER, QUOTE_LIST_COLUMNS
+
+LIST_LIMIT = 100
+
+
+def explain(db, query, analyze: bool = False) -> dict:
+    """获取查询的执行计划（JSON格式的根节点）"""
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+    result = db.connection().exec_driver_sql(f"EXPLAIN ({options}) {compiled}", compiled.params)
+    return result.scalar()[0]["Plan"]
+
+
+def plan_nodes(plan: dict):
+    """遍历执行计划的全部节点"""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def seq_scans(plan: dict, table: str) -> list:
+    """执行计划中对指定表的顺序扫描节点"""
+    return [
+        node for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == table
+    ]
+
+
+def used_indexes(plan: dict) -> set:
+    """执行计划中使用的索引"""
+    return {node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node}
+
+
+def list_query(db, **filters):
+    """与报价单列表接口相同的查询（首页）"""
+    return apply_quote_filters(db.query(*QUOTE_LIST_COLUMNS), **filters).order_by(
+        *(column.desc() for column in QUOTE_LIST_ORDER)
+    ).limit(LIST_LIMIT)
+
+
+def search_cases(rows: int) -> list:
+    """搜索用例: (名称, 筛选条件, 期望使用的索引)，关键字取自生成的数据"""
+    n = rows // 3
+    return [
+        ("客户名称(4字符)", {"customer_name": seed_name_code(n)[:4]}, "ix_quotes_customer_name_trgm"),
+        ("客户名称(8字符)", {"customer_name": seed_name_code(n)}, "ix_quotes_customer_name_trgm"),
+        ("客户名称(中文3字)", {"customer_name": seed_name_words(n)[:3]}, "ix_quotes_customer_name_trgm"),
+        ("客户名称(中文4字)", {"customer_name": seed_name_words(n)}, "ix_quotes_customer_name_trgm"),
+        ("联系电话(后6位)", {"contact_phone": seed_contact_phone(n)[-6:]}, "ix_quotes_contact_phone_trgm"),
+        ("联系电话(完整)", {"contact_phone": seed_contact_phone(n)}, "ix_quotes_contact_phone_trgm"),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="报价单搜索基准")
+    parser.add_argument("--rows", type=int, default=1000000, help="生成的报价单数")
+    parser.add_argument("--rounds", type=int, default=5, help="每项执行轮数")
+    parser.add_argument("--keep-data", action="store_true", help="保留生成的数据")
+    args = parser.parse_args()
+
+    failures = []
+    db = SessionLocal()
+    try:
+        quoter = db.query(Quoter).first()
+        if quoter is None:
+            print("数据库中没有报价人，请先执行 scripts/init_data.py")
+            sys.exit(1)
+        print(f"生成 {args.rows} 条报价单...")
+        seed(db, quoter.id, args.rows)
+
+        for name, filters, index in search_cases(args.rows):
+            query = list_query(db, **filters)
+            plan = explain(db, query)
+            indexes = used_indexes(plan)
+            scans = seq_scans(plan, Quote.__tablename__)
+            ok = index in indexes and not scans
+            if not ok:
+                failures.append(name)
+
+            indexed = measure(lambda: query.all(), args.rounds)
+            # 禁用索引扫描，对照迁移前的顺序扫描
+            db.execute(text("SET enable_bitmapscan = off"))
+            db.execute(text("SET enable_indexscan = off"))
+            try:
+                scanned = measure(lambda: query.all(), args.rounds)
+            finally:
+                db.execute(text("RESET enable_bitmapscan"))
+                db.execute(text("RESET enable_indexscan"))
+
+            print(f"{name} {filters}: {'通过' if ok else '未使用索引'}，索引 {sorted(indexes)}")
+            print(f"  使用索引: {indexed}")
+            print(f"  顺序扫描: {scanned}")
+    finally:
+        db.rollback()
+        if not args.keep_data:
+            cleanup(db)
+        db.close()
+
+    if failures:
+        print(f"执行计划检查未通过: {failures}")
+        sys.exit(1)
+    print("执行计划检查通过")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+导出性能基准套件
+按模板类型（通票/大客户/仓配）× 价格行数 × 条款数构造报价单，
+测量各导出格式的耗时、内存分配峰值（tracemalloc）和输出大小，结果保存为JSON基线；
+指定 --baseline 时与上次结果对比，超出阈值的项目视为性能回退（退出码1）；
+也可在pytest中按基线逐项对比（见 tests/test_export_benchmarks.py，未指定基线时跳过）
+
+用法:
+    python scripts/benchmark_suite.py --output baseline.json
+    python scripts/benchmark_suite.py --baseline baseline.json [--threshold 0.2]
+    python scripts/benchmark_suite.py --regions 6,200 --terms 10 --formats html,excel --pdf
+    BENCHMARK_BASELINE=baseline.json pytest tests/test_export_benchmarks.py
+"""
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_exports import make_quote, measure
+from app.api.exports import render_quote_html, build_quote_excel, build_quote_word
+from app.services.render_cache import get_render_cache
+from app.services.quote_templates import get_quote_templates
+
+TEMPLATE_TYPES = ("TONGPIAO", "DAKEHU", "CANGPEI")
+
+
+def render_html(quote, quoter) -> bytes:
+    return render_quote_html(quote, quoter).encode("utf-8")
+
+
+def render_html_stream(quote, quoter) -> bytes:
+    return b"".join(chunk.encode("utf-8") for chunk in get_quote_templates().stream_document(quote, quoter))
+
+
+def render_pdf(quote, quoter) -> bytes:
+    # 在当前进程中渲染，复用进程内缓存的字体配置和样式表（与渲染进程一致）
+    from app.services.pdf_renderer import _render_pdf
+    html = get_quote_templates().render_document(quote, quoter, inline_styles=False)
+    return _render_pdf(html, "blue")
+
+
+# 导出格式: 生成函数（每次调用前清空渲染缓存，测量完整耗时）
+FORMATS = {
+    "html": render_html,
+    "html_stream": render_html_stream,
+    "excel": build_quote_excel,
+    "word": build_quote_word,
+    "pdf": render_pdf,
+}
+
+
+def case_key(template_type: str, region_count: int, term_count: int, export_format: str) -> str:
+    """结果中的项目名称"""
+    return f"{template_type}/rows={region_count}/terms={term_count}/{export_format}"
+
+
+def parse_case_key(key: str) -> tuple:
+    """项目名称拆分为 (模板类型, 价格行数, 条款数, 导出格式)"""
+    template_type, rows, terms, export_format = key.split("/")
+    return template_type, int(rows.split("=")[1]), int(terms.split("=")[1]), export_format
+
+
+def run_case(export, quote, quoter, rounds: int) -> dict:
+    """测量单个格式：耗时、内存分配峰值、输出大小"""
+    def run() -> bytes:
+        get_render_cache().clear()
+        return export(quote, quoter)
+
+    # 预热一次，排除模板编译、模块导入等一次性开销
+    output = run()
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        **measure(run, rounds),
+        "peak_kb": round(peak / 1024, 1),
+        "output_bytes": len(output),
+    }
+
+
+def run_suite(args) -> dict:
+    regions = [int(value) for value in args.regions.split(",")]
+    terms = [int(value) for value in args.terms.split(",")]
+    formats = args.formats.split(",")
+    if args.pdf and "pdf" not in formats:
+        formats.append("pdf")
+
+    results = {}
+    for template_type in args.types.split(","):
+        for region_count in regions:
+            for term_count in terms:
+                quote, quoter = make_quote(regions=region_count, terms=term_count, template_type=template_type)
+                for export_format in formats:
+                    key = case_key(template_type, region_count, term_count, export_format)
+                    try:
+                        results[key] = run_case(FORMATS[export_format], quote, quoter, args.rounds)
+                    except Exception as exc:
+                        print(f"{key}: 跳过 ({exc})")
+                        continue
+                    print(f"{key}: {results[key]}")
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """
+    对比两次结果
+
+    Returns:
+        回退项目列表 (名称, 指标, 基线值, 当前值)
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "peak_kb", "output_bytes"):
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                regressions.append((key, metric, base[metric], result[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="导出性能基准套件")
+    parser.add_argument("--types", default=",".join(TEMPLATE_TYPES), help="模板类型，逗号分隔")
+    parser.add_argument("--regions", default="6,200,2000", help="价格行数（区域/重量段），逗号分隔")
+    parser.add_argument("--terms", default="10,200", help="条款数，逗号分隔")
+    parser.add_argument("--formats", default="html,html_stream,excel,word", help="导出格式，逗号分隔")
+    parser.add_argument("--pdf", action="store_true", help="包含PDF（需要WeasyPrint系统依赖）")
+    parser.add_argument("--rounds", type=int, default=10, help="每项执行轮数")
+    parser.add_argument("--output", help="结果保存路径(JSON)")
+    parser.add_argument("--baseline", help="基线结果路径(JSON)，与本次结果对比")
+    parser.add_argument("--threshold", type=float, default=0.2, help="回退阈值（相对基线增长比例）")
+    args = parser.parse_args()
+
+    current = run_suite(args)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"结果已保存: {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"性能回退 (阈值 {args.threshold:.0%}):")
+            for key, metric, before, after in regressions:
+                print(f"  {key} {metric}: {before} -> {after}")
+            sys.exit(1)
+        print(f"与基线 {args.baseline} 对比无回退")
+
+
+if __name__ == "__main__":
+    main()
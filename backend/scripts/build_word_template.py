@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+生成Word报价单模板
+输出 app/templates/quote/document.docx，修改版式后重新运行本脚本
+
+模板中的 {名称} 为占位符，由 app/services/quote_word.py 填充：
+- 价格表第一行的 {header} 单元格按列数复制，第二行 {cell} 按价格行复制
+- {term_title}/{custom_term} 所在段落按条款数复制
+- 值为空的占位符所在段落整段删除
+
+用法: python scripts/build_word_template.py
+"""
+import sys
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Cm, Pt, RGBColor
+
+from app.services.quote_word import WORD_TEMPLATE
+
+FONT_NAME = "Microsoft YaHei"
+PRIMARY_COLOR = RGBColor(0x00, 0x66, 0xCC)
+
+
+def set_font(style, size=None, bold=None, color=None):
+    """设置样式字体（含中文字体）"""
+    style.font.name = FONT_NAME
+    style.element.get_or_add_rPr().get_or_add_rFonts().set(qn("w:eastAsia"), FONT_NAME)
+    if size is not None:
+        style.font.size = Pt(size)
+    if bold is not None:
+        style.font.bold = bold
+    if color is not None:
+        style.font.color.rgb = color
+
+
+def shade(cell, fill: str):
+    """设置单元格底色"""
+    shading = OxmlElement("w:shd")
+    shading.set(qn("w:val"), "clear")
+    shading.set(qn("w:color"), "auto")
+    shading.set(qn("w:fill"), fill)
+    cell._tc.get_or_add_tcPr().append(shading)
+
+
+def add_runs(paragraph, *parts):
+    """按 (文本, 是否加粗) 添加文本段，每个占位符独占一段"""
+    for text, bold in parts:
+        paragraph.add_run(text).bold = bold
+    return paragraph
+
+
+def build() -> Document:
+    doc = Document()
+
+    section = doc.sections[0]
+    section.page_width, section.page_height = Cm(21), Cm(29.7)
+    section.left_margin = section.right_margin = Cm(2)
+    section.top_margin = section.bottom_margin = Cm(2)
+
+    set_font(doc.styles["Normal"], size=10.5)
+    set_font(doc.styles["Title"], size=22, bold=True, color=PRIMARY_COLOR)
+    set_font(doc.styles["Heading 1"], size=14, bold=True, color=PRIMARY_COLOR)
+    set_font(doc.styles["Heading 2"], size=12, bold=True, color=RGBColor(0x33, 0x33, 0x33))
+
+    # 标题
+    doc.add_paragraph("中通快递服务报价单", style="Title")
+    add_runs(
+        doc.add_paragraph(),
+        ("编号: ", False), ("{quote_number}", False),
+        (" | 生成日期: ", False), ("{generated_at}", False),
+    )
+
+    # 基本信息
+    info = doc.add_table(rows=3, cols=4, style="Table Grid")
+    info.alignment = WD_TABLE_ALIGNMENT.CENTER
+    for row, items in zip(info.rows, [
+        ("客户名称", "{customer_name}", "联系人", "{contact_person}"),
+        ("联系电话", "{contact_phone}", "报价日期", "{quote_date}"),
+        ("有效期至", "{expire_date}", "报价人", "{quoter}"),
+    ]):
+        for index, (cell, text) in enumerate(zip(row.cells, items)):
+            add_runs(cell.paragraphs[0], (text, index % 2 == 0))
+            if index % 2 == 0:
+                shade(cell, "E6F2FF")
+
+    # 价格方案
+    doc.add_paragraph("价格方案", style="Heading 1")
+    prices = doc.add_table(rows=2, cols=1, style="Table Grid")
+    prices.alignment = WD_TABLE_ALIGNMENT.CENTER
+    header = prices.rows[0].cells[0]
+    add_runs(header.paragraphs[0], ("{header}", True))
+    header.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+    shade(header, "CCCCCC")
+    add_runs(prices.rows[1].cells[0].paragraphs[0], ("{cell}", False))
+    add_runs(doc.add_paragraph(), ("{tax_note}", False))
+
+    # 条款
+    doc.add_paragraph("{fixed_heading}", style="Heading 2")
+    add_runs(doc.add_paragraph(), ("{term_title}", True), (": ", True), ("{term_content}", False))
+    doc.add_paragraph("{custom_heading}", style="Heading 2")
+    add_runs(doc.add_paragraph(), ("• ", False), ("{custom_term}", False))
+
+    # 备注
+    add_runs(doc.add_paragraph(), ("备注: ", True), ("{remark}", False))
+
+    # 页脚
+    footer = section.footer.paragraphs[0]
+    footer.text = "中通快递服务有限公司 | 本报价单由系统自动生成，如有疑问请联系报价人"
+    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    return doc
+
+
+def main():
+    build().save(WORD_TEMPLATE)
+    print(f"已生成: {WORD_TEMPLATE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+报价单查询计划回归检查
+在PostgreSQL中批量生成报价单并 ANALYZE，对报价单列表的各筛选组合、数据接口增量同步、
+按报价人查询获取执行计划（EXPLAIN），任一查询顺序扫描报价单表时退出码1；
+--output 保存各查询的计划摘要（节点类型、索引、估算代价），便于与上次结果对比。
+结束后删除生成的数据
+
+需要连接PostgreSQL（DATABASE_URL）并已执行全部迁移，数据库中至少有一个报价人
+
+用法: python scripts/check_query_plans.py [--rows 500000] [--output plans.json] [--analyze]
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_pagination import seed, cleanup, seed_name_code, seed_contact_phone
+from benchmark_search import explain, plan_nodes, seq_scans, used_indexes, list_query
+from app.database import SessionLocal
+from app.models.quote import Quote, QuoteStatus
+from app.models.quoter import Quoter
+from app.api.exports import FEED_COLUMNS
+from app.api.quotes import apply_quote_filters
+
+
+def feed_query(db, updated_since: datetime):
+    """与数据接口相同的增量同步查询"""
+    return apply_quote_filters(
+        db.query(*FEED_COLUMNS).outerjoin(Quoter, Quote.quoter_id == Quoter.id)
+    ).filter(Quote.updated_at >= updated_since).order_by(Quote.updated_at, Quote.id)
+
+
+def query_cases(db, rows: int) -> list:
+    """查询用例: (名称, 查询)，覆盖报价单列表页的筛选组合"""
+    today = date.today()
+    last_month = today - timedelta(days=30)
+    n = rows // 3
+    return [
+        ("列表", list_query(db)),
+        ("状态", list_query(db, status=QuoteStatus.SENT)),
+        ("报价日期范围", list_query(db, start_date=last_month, end_date=today)),
+        ("状态+报价日期范围", list_query(db, status=QuoteStatus.DRAFT, start_date=last_month, end_date=today)),
+        ("客户名称", list_query(db, customer_name=seed_name_code(n)[:6])),
+        ("联系电话", list_query(db, contact_phone=seed_contact_phone(n)[-6:])),
+        ("客户名称+状态", list_query(db, customer_name=seed_name_code(n)[:6], status=QuoteStatus.SENT)),
+        ("数据接口增量同步", feed_query(db, datetime.utcnow() - timedelta(hours=1))),
+        # 生成的数据都属于同一报价人，用不存在的报价人ID模拟删除报价人时的外键检查
+        ("报价人的报价单", db.query(Quote.id).filter(Quote.quoter_id == 0).limit(1)),
+    ]
+
+
+def summarize(plan: dict) -> dict:
+    """计划摘要：节点类型（含表或索引）、使用的索引、估算代价"""
+    return {
+        "nodes": [
+            node["Node Type"] + (
+                f" ({node.get('Index Name') or node.get('Relation Name')})"
+                if node.get("Index Name") or node.get("Relation Name") else ""
+            )
+            for node in plan_nodes(plan)
+        ],
+        "indexes": sorted(used_indexes(plan)),
+        "total_cost": plan["Total Cost"],
+        "actual_ms": plan.get("Actual Total Time"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="报价单查询计划回归检查")
+    parser.add_argument("--rows", type=int, default=500000, help="生成的报价单数")
+    parser.add_argument("--output", help="计划摘要保存路径(JSON)")
+    parser.add_argument("--analyze", action="store_true", help="实际执行查询（EXPLAIN ANALYZE），记录耗时")
+    parser.add_argument("--keep-data", action="store_true", help="保留生成的数据")
+    args = parser.parse_args()
+
+    plans = {}
+    regressions = []
+    db = SessionLocal()
+    try:
+        quoter = db.query(Quoter).first()
+        if quoter is None:
+            print("数据库中没有报价人，请先执行 scripts/init_data.py")
+            sys.exit(1)
+        print(f"生成 {args.rows} 条报价单...")
+        seed(db, quoter.id, args.rows)
+
+        for name, query in query_cases(db, args.rows):
+            plan = explain(db, query, analyze=args.analyze)
+            plans[name] = summarize(plan)
+            if seq_scans(plan, Quote.__tablename__):
+                regressions.append(name)
+            print(f"{name}: {'顺序扫描' if name in regressions else '通过'} {plans[name]}")
+    finally:
+        db.rollback()
+        if not args.keep_data:
+            cleanup(db)
+        db.close()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(plans, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"计划摘要已保存: {args.output}")
+
+    if regressions:
+        print(f"以下查询顺序扫描报价单表: {regressions}")
+        sys.exit(1)
+    print("全部查询使用索引")
+
+
+if __name__ == "__main__":
+    main()
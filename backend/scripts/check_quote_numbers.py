@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+报价单编号并发检查
+多个线程（各自独立的数据库会话）同时调用创建报价单、复制报价单接口，
+检查分配的编号没有重复、没有唯一约束冲突、同一天的序号连续；结束后删除本次创建的报价单
+
+需要连接PostgreSQL（DATABASE_URL），数据库中至少有一个报价人
+
+用法: python scripts/check_quote_numbers.py [--workers 8] [--count 200] [--copy-ratio 0.5] [--keep]
+"""
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.exc import IntegrityError
+
+from app.database import SessionLocal
+from app.models.quote import Quote
+from app.models.quoter import Quoter
+from app.api.quotes import create_quote, copy_quote
+from app.schemas.quote import QuoteCreate
+
+
+def make_quote_in(quoter_id: int, index: int) -> QuoteCreate:
+    return QuoteCreate(
+        customer_name=f"编号并发检查{index}",
+        contact_person="测试",
+        contact_phone="13800000000",
+        quoter_id=quoter_id,
+        quote_date=date.today(),
+        template_type="TONGPIAO",
+        price_data={"regions": []},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="报价单编号并发检查")
+    parser.add_argument("--workers", type=int, default=8, help="并发线程数")
+    parser.add_argument("--count", type=int, default=200, help="创建报价单总数")
+    parser.add_argument("--copy-ratio", type=float, default=0.5, help="其中复制报价单的比例")
+    parser.add_argument("--keep", action="store_true", help="保留本次创建的报价单")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        quoter = db.query(Quoter).first()
+        if quoter is None:
+            print("数据库中没有报价人，请先执行 scripts/init_data.py")
+            sys.exit(1)
+        source = create_quote(make_quote_in(quoter.id, 0), db=db, current_user=None)
+        quoter_id, source_id = quoter.id, source.id
+    finally:
+        db.close()
+
+    copies = int(args.count * args.copy_ratio)
+    lock = threading.Lock()
+    numbers = []
+    created_ids = [source_id]
+    errors = Counter()
+
+    def run(index: int) -> None:
+        db = SessionLocal()
+        try:
+            if index < copies:
+                quote = copy_quote(source_id, db=db, current_user=None)
+            else:
+                quote = create_quote(make_quote_in(quoter_id, index), db=db, current_user=None)
+            with lock:
+                numbers.append(quote.quote_number)
+                created_ids.append(quote.id)
+        except IntegrityError:
+            errors["唯一约束冲突"] += 1
+        except Exception as exc:
+            errors[type(exc).__name__] += 1
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(run, range(args.count)))
+    elapsed = time.perf_counter() - start
+
+    duplicates = [number for number, count in Counter(numbers).items() if count > 1]
+    seqs = sorted(int(number.rsplit("-", 1)[1]) for number in numbers)
+    gaps = [seq for prev, seq in zip(seqs, seqs[1:]) if seq != prev + 1]
+
+    print(f"创建: {len(numbers)}/{args.count}（复制 {copies}），线程 {args.workers}，耗时 {elapsed:.2f}s")
+    print(f"序号范围: {seqs[0] if seqs else '-'} ~ {seqs[-1] if seqs else '-'}")
+    print(f"重复编号: {len(duplicates)} {duplicates[:10]}")
+    print(f"序号不连续: {len(gaps)}")
+    print(f"失败: {dict(errors) or 0}")
+
+    if not args.keep:
+        db = SessionLocal()
+        try:
+            db.query(Quote).filter(Quote.id.in_(created_ids)).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    if duplicates or gaps or errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
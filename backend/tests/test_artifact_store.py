@@ -0,0 +1,92 @@
+"""
+导出文件存储测试
+配额按文件及其压缩版本计算；淘汰与同一内容的保存互斥（需要PostgreSQL，见 conftest）
+"""
+from datetime import date
+
+import pytest
+
+from app.models.quote import Quote, QuoteExport, QuoteStatus
+from app.services.artifact_store import ArtifactStore, ENCODING_SUFFIXES
+from app.services.compression import ENCODINGS
+
+# 可压缩的导出内容（超过最小压缩大小）
+CONTENT = ("<p>中通快递服务报价单</p>\n" * 500).encode("utf-8")
+
+
+@pytest.fixture
+def quote_id(pg_sessionmaker, pg_quoter):
+    """测试用报价单ID（测试结束时删除报价单及其导出记录）"""
+    db = pg_sessionmaker()
+    quote = Quote(
+        quote_number="TEST-ARTIFACT-1",
+        customer_name="测试客户",
+        contact_person="测试",
+        contact_phone="13800000000",
+        quoter_id=pg_quoter,
+        quote_date=date.today(),
+        expire_date=date.today(),
+        template_type="TONGPIAO",
+        price_data={"regions": []},
+        status=QuoteStatus.SENT,
+    )
+    db.add(quote)
+    db.commit()
+    quote_id = quote.id
+    db.close()
+
+    yield quote_id
+
+    db = pg_sessionmaker()
+    db.query(QuoteExport).filter(QuoteExport.quote_id == quote_id).delete()
+    db.query(Quote).filter(Quote.id == quote_id).delete()
+    db.commit()
+    db.close()
+
+
+def stored_files(store: ArtifactStore, artifact: QuoteExport) -> list:
+    paths = [store.path_of(artifact)]
+    paths += [store.root / (artifact.file_path + ENCODING_SUFFIXES[encoding]) for encoding in ENCODINGS]
+    return paths
+
+
+def test_quota_counts_compressed_variants(pg_sessionmaker, quote_id, tmp_path):
+    store = ArtifactStore(tmp_path, quota_bytes=0)
+    db = pg_sessionmaker()
+    try:
+        artifact = store.save(db, db.get(Quote, quote_id), "html", "", CONTENT)
+        files = stored_files(store, artifact)
+
+        assert all(path.exists() for path in files)
+        assert artifact.file_size == sum(path.stat().st_size for path in files)
+        assert artifact.file_size > len(CONTENT)
+
+        result = store.evict(db)
+        assert result["freed_bytes"] == artifact.file_size
+        assert not any(path.exists() for path in files)
+    finally:
+        db.close()
+
+
+def test_evict_skips_content_being_saved(pg_sessionmaker, quote_id, tmp_path):
+    # 另一事务正持有该内容的锁（保存同一内容）时，淘汰不删除记录也不删除文件，留到下次
+    store = ArtifactStore(tmp_path, quota_bytes=0)
+    db = pg_sessionmaker()
+    saving = pg_sessionmaker()
+    try:
+        artifact = store.save(db, db.get(Quote, quote_id), "html", "", CONTENT)
+        files = stored_files(store, artifact)
+        store._lock_content(saving, artifact.content_hash)
+
+        assert store.evict(db)["removed"] == 0
+        assert store.usage(db)["artifacts"] == 1
+        assert all(path.exists() for path in files)
+
+        # 锁释放后记录和文件一起删除
+        saving.rollback()
+        assert store.evict(db)["removed"] == 1
+        assert store.usage(db)["artifacts"] == 0
+        assert not any(path.exists() for path in files)
+    finally:
+        saving.close()
+        db.close()
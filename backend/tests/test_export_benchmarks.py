@@ -0,0 +1,47 @@
+"""
+导出性能基准测试
+按保存的基线逐项重新测量，耗时(p50)、内存分配峰值或输出大小超出阈值时失败；
+未指定 BENCHMARK_BASELINE 时跳过，基线由 scripts/benchmark_suite.py --output 生成:
+
+    BENCHMARK_BASELINE=baseline.json [BENCHMARK_THRESHOLD=0.2] pytest tests/test_export_benchmarks.py
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from benchmark_exports import make_quote
+from benchmark_suite import FORMATS, compare, parse_case_key, run_case
+
+BENCHMARK_BASELINE = os.environ.get("BENCHMARK_BASELINE")
+BENCHMARK_THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", "0.2"))
+
+pytestmark = pytest.mark.skipif(
+    not BENCHMARK_BASELINE, reason="未指定 BENCHMARK_BASELINE，跳过性能基准"
+)
+
+
+def load_baseline() -> dict:
+    if not BENCHMARK_BASELINE:
+        return {"meta": {}, "results": {}}
+    return json.loads(Path(BENCHMARK_BASELINE).read_text(encoding="utf-8"))
+
+
+BASELINE = load_baseline()
+
+
+@pytest.mark.parametrize("key", sorted(BASELINE["results"]))
+def test_no_regression(key):
+    template_type, region_count, term_count, export_format = parse_case_key(key)
+    quote, quoter = make_quote(regions=region_count, terms=term_count, template_type=template_type)
+    try:
+        result = run_case(FORMATS[export_format], quote, quoter, BASELINE["meta"].get("rounds", 10))
+    except OSError as exc:
+        # PDF需要WeasyPrint系统依赖
+        pytest.skip(f"{key}: {exc}")
+
+    regressions = compare({"results": {key: result}}, BASELINE, BENCHMARK_THRESHOLD)
+    assert not regressions, [
+        f"{metric}: {before} -> {after}" for _, metric, before, after in regressions
+    ]
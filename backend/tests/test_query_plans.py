@@ -0,0 +1,18 @@
+"""
+报价单查询计划回归测试
+报价单列表各筛选组合、数据接口增量同步、按报价人查询都不顺序扫描报价单表（需要PostgreSQL，见 conftest）
+"""
+from benchmark_search import explain, seq_scans
+from check_query_plans import query_cases, summarize
+from app.models.quote import Quote
+from tests.conftest import PLAN_TEST_ROWS
+
+
+def test_quote_queries_avoid_seq_scan(seeded_db):
+    regressions = {}
+    for name, query in query_cases(seeded_db, PLAN_TEST_ROWS):
+        plan = explain(seeded_db, query)
+        if seq_scans(plan, Quote.__tablename__):
+            regressions[name] = summarize(plan)
+
+    assert not regressions, regressions
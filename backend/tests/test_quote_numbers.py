@@ -0,0 +1,72 @@
+"""
+报价单编号并发测试
+多个会话同时从当天的计数行预留编号：编号不重复，已提交的序号连续（需要PostgreSQL，见 conftest）
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from app.models.quote import QuoteNumberCounter
+from app.services.quote_numbers import format_quote_number, reserve_quote_numbers
+
+# 使用不会有真实报价单的日期，测试前后删除该日计数行
+TEST_DATE = date(2000, 1, 1)
+WORKERS = 8
+RESERVATIONS = 200
+
+
+@pytest.fixture
+def counter_date(pg_sessionmaker):
+    def reset():
+        db = pg_sessionmaker()
+        db.query(QuoteNumberCounter).filter(QuoteNumberCounter.quote_date == TEST_DATE).delete()
+        db.commit()
+        db.close()
+
+    reset()
+    yield TEST_DATE
+    reset()
+
+
+def test_concurrent_reservations_unique_and_contiguous(pg_sessionmaker, counter_date):
+    def reserve(index: int):
+        db = pg_sessionmaker()
+        try:
+            # 每7次中1次预留3个（批量创建），每5次中1次回滚（保存失败），其编号应退回
+            numbers = reserve_quote_numbers(db, counter_date, count=3 if index % 7 == 0 else 1)
+            if index % 5 == 0:
+                db.rollback()
+                return []
+            db.commit()
+            return numbers
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(WORKERS) as executor:
+        results = list(executor.map(reserve, range(RESERVATIONS)))
+
+    committed = [number for numbers in results for number in numbers]
+    assert len(committed) == len(set(committed))
+    # 序号超过99时变宽，按集合比较而不是按字符串排序
+    assert set(committed) == {
+        format_quote_number(counter_date, seq) for seq in range(1, len(committed) + 1)
+    }
+
+    db = pg_sessionmaker()
+    counter = db.get(QuoteNumberCounter, counter_date)
+    db.close()
+    assert counter.last_seq == len(committed)
+
+
+def test_batch_reservation_is_consecutive(pg_sessionmaker, counter_date):
+    db = pg_sessionmaker()
+    try:
+        first = reserve_quote_numbers(db, counter_date)
+        batch = reserve_quote_numbers(db, counter_date, count=5)
+        db.commit()
+    finally:
+        db.close()
+
+    assert first == [format_quote_number(counter_date, 1)]
+    assert batch == [format_quote_number(counter_date, seq) for seq in range(2, 7)]
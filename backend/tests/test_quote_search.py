@@ -0,0 +1,64 @@
+"""
+报价单搜索执行计划测试
+客户名称（含中文）、联系电话子串搜索使用三元组索引，不顺序扫描报价单表（需要PostgreSQL，见 conftest）
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func
+
+from benchmark_pagination import SEED_CITIES, SEED_PREFIX
+from benchmark_search import explain, list_query, search_cases, seq_scans, used_indexes
+from app.api.quotes import apply_quote_filters
+from app.models.quote import Quote
+from app.services.quote_search import normalize_keyword
+from tests.conftest import PLAN_TEST_ROWS
+
+
+@pytest.mark.parametrize(
+    "name, filters, index",
+    search_cases(PLAN_TEST_ROWS),
+    ids=[case[0] for case in search_cases(PLAN_TEST_ROWS)]
+)
+def test_search_uses_trigram_index(seeded_db, name, filters, index):
+    plan = explain(seeded_db, list_query(seeded_db, **filters))
+
+    assert index in used_indexes(plan), plan
+    assert not seq_scans(plan, Quote.__tablename__), plan
+
+
+def test_search_matches_substring(seeded_db):
+    # 索引只影响执行计划，结果与子串匹配一致
+    _, filters, _ = search_cases(PLAN_TEST_ROWS)[0]
+    rows = list_query(seeded_db, **filters).all()
+
+    assert rows
+    assert all(filters["customer_name"] in row.customer_name for row in rows)
+
+
+def test_short_cjk_keyword_matches_substring(seeded_db):
+    # 2字中文关键字提取不出三元组，不走索引，按ILIKE逐行匹配
+    keyword = SEED_CITIES[2]
+    count = apply_quote_filters(
+        seeded_db.query(func.count(Quote.id)).filter(Quote.quote_number.like(SEED_PREFIX + "%")),
+        customer_name=keyword
+    ).scalar()
+
+    assert count == len(range(2, PLAN_TEST_ROWS + 1, len(SEED_CITIES)))
+
+
+@pytest.mark.parametrize("keyword, accepted", [
+    ("广州", True),
+    ("广", False),
+    ("a广", True),
+    ("abc", True),
+    ("ab", False),
+    ("13", False),
+])
+def test_keyword_min_length(keyword, accepted):
+    # 含中文的关键字至少2个字，其他至少3个字符
+    if accepted:
+        assert normalize_keyword(keyword, "客户名称") == keyword
+    else:
+        with pytest.raises(HTTPException) as exc_info:
+            normalize_keyword(keyword, "客户名称")
+        assert exc_info.value.status_code == 400
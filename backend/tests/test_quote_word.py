@@ -0,0 +1,43 @@
+"""
+报价单Word文档测试
+"""
+import zipfile
+from io import BytesIO
+
+from benchmark_exports import make_quote
+from app.services.quote_templates import build_document_context
+from app.services.quote_word import DOCUMENT_PART, get_quote_word_builder
+
+
+def build_document_xml(quote, quoter) -> str:
+    document = get_quote_word_builder().build(quote, quoter, build_document_context(quote))
+    with zipfile.ZipFile(BytesIO(document)) as package:
+        return package.read(DOCUMENT_PART).decode("utf-8")
+
+
+def test_terms_and_prices_expanded():
+    quote, quoter = make_quote(regions=3, terms=2)
+    xml = build_document_xml(quote, quoter)
+
+    for placeholder in ("{header}", "{term_title}", "{term_content}", "{custom_term}", "{customer_name}"):
+        assert placeholder not in xml
+    assert xml.count("可选条款0") == 1
+    assert xml.count("特别说明1") == 1
+    assert "3区" in xml
+
+
+def test_user_braces_not_taken_as_placeholders():
+    # 客户名称、备注含原型占位符文本时，不能被当作价格行、条款的原型复制
+    quote, quoter = make_quote(regions=2, terms=2)
+    quote.customer_name = "客户{term_title}{custom_term}"
+    quote.remark = "备注{header}{term_content}"
+    xml = build_document_xml(quote, quoter)
+
+    assert xml.count("客户{term_title}{custom_term}") == 1
+    assert xml.count("备注{header}{term_content}") == 1
+    # 条款、特别说明各展开一次，原型中的占位符全部替换
+    assert xml.count("{term_title}") == 1
+    assert xml.count("{term_content}") == 1
+    assert xml.count("{custom_term}") == 1
+    assert xml.count("条款0") == 2  # 固定条款0、可选条款0
+    assert xml.count("特别说明0") == 1
@@ -1,17 +1,78 @@
-import { Card, Row, Col, Statistic } from 'antd';
+import { useState, useEffect } from 'react';
+import { useNavigate } from 'react-router-dom';
+import { Card, Row, Col, Statistic, Table, Tag, Button } from 'antd';
+import type { TableProps } from 'antd';
 import { FileTextOutlined, CheckCircleOutlined, ClockCircleOutlined, CloseCircleOutlined } from '@ant-design/icons';
+import { quoteApi, QuoteSummary } from '@/services';
+import { Quote, QuoteStatus } from '@/types';
+import { formatDate, statusMap } from '@/utils/format';
 
 const Dashboard = () => {
+  const navigate = useNavigate();
+  const [loading, setLoading] = useState(false);
+  const [summary, setSummary] = useState<QuoteSummary | null>(null);
+
+  useEffect(() => {
+    loadSummary();
+  }, []);
+
+  const loadSummary = async () => {
+    try {
+      setLoading(true);
+      const data = await quoteApi.summary();
+      setSummary(data);
+    } catch (error) {
+      console.error('Load summary failed:', error);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const countOf = (status: QuoteStatus) => summary?.status_counts[status] ?? 0;
+
+  // 最近报价单列定义
+  const columns: TableProps<Quote>['columns'] = [
+    {
+      title: '报价单编号',
+      dataIndex: 'quote_number',
+      key: 'quote_number',
+      render: (text: string, record: Quote) => (
+        <Button type="link" size="small" onClick={() => navigate(`/quotes/${record.id}`)}>
+          {text}
+        </Button>
+      ),
+    },
+    {
+      title: '客户名称',
+      dataIndex: 'customer_name',
+      key: 'customer_name',
+    },
+    {
+      title: '报价日期',
+      dataIndex: 'quote_date',
+      key: 'quote_date',
+      render: (date: string) => formatDate(date),
+    },
+    {
+      title: '状态',
+      dataIndex: 'status',
+      key: 'status',
+      render: (status: QuoteStatus) => (
+        <Tag color={statusMap[status]?.color}>{statusMap[status]?.text}</Tag>
+      ),
+    },
+  ];
+
   return (
     <div>
       <h2 style={{ marginBottom: 24 }}>仪表盘</h2>
 
       <Row gutter={16}>
         <Col span={6}>
-          <Card>
+          <Card loading={loading}>
             <Statistic
               title="总报价单"
-              value={0}
+              value={summary?.total ?? 0}
               prefix={<FileTextOutlined />}
               valueStyle={{ color: '#3f8600' }}
             />
@@ -19,10 +80,10 @@ const Dashboard = () => {
         </Col>
 
         <Col span={6}>
-          <Card>
+          <Card loading={loading}>
             <Statistic
               title="待确认"
-              value={0}
+              value={countOf(QuoteStatus.SENT)}
               prefix={<ClockCircleOutlined />}
               valueStyle={{ color: '#faad14' }}
             />
@@ -30,10 +91,10 @@ const Dashboard = () => {
         </Col>
 
         <Col span={6}>
-          <Card>
+          <Card loading={loading}>
             <Statistic
               title="已确认"
-              value={0}
+              value={countOf(QuoteStatus.CONFIRMED)}
               prefix={<CheckCircleOutlined />}
               valueStyle={{ color: '#1890ff' }}
             />
@@ -41,10 +102,10 @@ const Dashboard = () => {
         </Col>
 
         <Col span={6}>
-          <Card>
+          <Card loading={loading}>
             <Statistic
               title="已过期"
-              value={0}
+              value={countOf(QuoteStatus.EXPIRED)}
               prefix={<CloseCircleOutlined />}
               valueStyle={{ color: '#cf1322' }}
             />
@@ -53,9 +114,14 @@ const Dashboard = () => {
       </Row>
 
       <Card title="最近报价单" style={{ marginTop: 24 }}>
-        <p style={{ textAlign: 'center', color: '#999', padding: '40px 0' }}>
-          暂无数据
-        </p>
+        <Table
+          columns={columns}
+          dataSource={summary?.recent ?? []}
+          rowKey="id"
+          loading={loading}
+          pagination={false}
+          locale={{ emptyText: '暂无数据' }}
+        />
       </Card>
     </div>
   );
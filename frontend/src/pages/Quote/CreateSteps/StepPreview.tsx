@@ -1,5 +1,7 @@
-import { Descriptions, Button, Space, Card, Tag } from 'antd';
+import { useState } from 'react';
+import { Descriptions, Button, Space, Card, Tag, Modal, message } from 'antd';
 import { Quoter } from '@/types';
+import { exportApi } from '@/services';
 import { formatDate, templateTypeMap } from '@/utils/format';
 
 interface Props {
@@ -12,6 +14,21 @@ interface Props {
 
 const StepPreview = ({ data, quoters, onSubmit, onPrev, loading }: Props) => {
   const quoter = quoters.find((q) => q.id === data.quoter_id);
+  const [previewHtml, setPreviewHtml] = useState('');
+  const [previewLoading, setPreviewLoading] = useState(false);
+
+  // 预览渲染效果（不保存报价单）
+  const handlePreview = async () => {
+    try {
+      setPreviewLoading(true);
+      setPreviewHtml(await exportApi.previewDraft(data));
+    } catch (error) {
+      console.error('Preview failed:', error);
+      message.error('预览失败');
+    } finally {
+      setPreviewLoading(false);
+    }
+  };
 
   return (
     <Space direction="vertical" size="large" style={{ width: '100%' }}>
@@ -94,10 +111,26 @@ const StepPreview = ({ data, quoters, onSubmit, onPrev, loading }: Props) => {
       {/* 操作按钮 */}
       <Space>
         <Button onClick={onPrev}>上一步</Button>
+        <Button onClick={handlePreview} loading={previewLoading}>
+          预览效果
+        </Button>
         <Button type="primary" onClick={onSubmit} loading={loading}>
           保存报价单
         </Button>
       </Space>
+
+      <Modal
+        title="报价单预览"
+        open={!!previewHtml}
+        onCancel={() => setPreviewHtml('')}
+        width={1000}
+        footer={null}
+      >
+        <iframe
+          srcDoc={previewHtml}
+          style={{ width: '100%', height: '600px', border: 'none' }}
+        />
+      </Modal>
     </Space>
   );
 };
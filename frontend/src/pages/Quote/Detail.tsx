@@ -20,7 +20,7 @@ import {
   DeleteOutlined,
 } from '@ant-design/icons';
 import { quoteApi, exportApi } from '@/services';
-import { Quote } from '@/types';
+import { Quote, QuoteStatus } from '@/types';
 import { formatDate, statusMap, templateTypeMap } from '@/utils/format';
 
 const QuoteDetail = () => {
@@ -82,6 +82,20 @@ const QuoteDetail = () => {
     setPreviewVisible(true);
   };
 
+  // 分享链接：复制到剪贴板
+  const handleShare = async (exportFormat: string) => {
+    if (!quote) return;
+    try {
+      const { url, expires_at } = await exportApi.createShareLink(quote.id, {
+        export_format: exportFormat,
+      });
+      await navigator.clipboard.writeText(`${window.location.origin}${url}`);
+      message.success(`分享链接已复制，有效期至 ${formatDate(expires_at)}`);
+    } catch (error) {
+      console.error('Share failed:', error);
+    }
+  };
+
   // 导出菜单
   const exportMenuItems: MenuProps['items'] = [
     {
@@ -102,6 +116,15 @@ const QuoteDetail = () => {
         exportApi.download(url, `${quote.quote_number}.xlsx`);
       },
     },
+    {
+      key: 'word',
+      label: '导出Word',
+      onClick: () => {
+        if (!quote) return;
+        const url = exportApi.exportWord(quote.id);
+        exportApi.download(url, `${quote.quote_number}.docx`);
+      },
+    },
     {
       key: 'pdf',
       label: '导出PDF',
@@ -111,6 +134,19 @@ const QuoteDetail = () => {
         exportApi.download(url, `${quote.quote_number}.pdf`);
       },
     },
+    { type: 'divider' },
+    {
+      key: 'share-pdf',
+      label: '复制分享链接(PDF)',
+      disabled: quote?.status === QuoteStatus.DRAFT,
+      onClick: () => handleShare('pdf'),
+    },
+    {
+      key: 'share-html',
+      label: '复制分享链接(网页)',
+      disabled: quote?.status === QuoteStatus.DRAFT,
+      onClick: () => handleShare('html'),
+    },
   ];
 
   if (loading || !quote) {
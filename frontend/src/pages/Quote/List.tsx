@@ -29,6 +29,20 @@ import { formatDate, statusMap } from '@/utils/format';
 
 const { RangePicker } = DatePicker;
 
+// 客户名称/联系电话搜索关键字最小长度（与后端 QUOTE_SEARCH_MIN_LENGTH / QUOTE_SEARCH_MIN_LENGTH_CJK 一致）
+const SEARCH_MIN_LENGTH = 3;
+const SEARCH_MIN_LENGTH_CJK = 2;
+// 中日韩文字（与后端 CJK_PATTERN 一致）
+const CJK_PATTERN = /[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]/;
+
+const isKeywordTooShort = (keyword: string) => {
+  const value = keyword.trim();
+  if (!value) {
+    return false;
+  }
+  return value.length < (CJK_PATTERN.test(value) ? SEARCH_MIN_LENGTH_CJK : SEARCH_MIN_LENGTH);
+};
+
 const QuoteList = () => {
   const navigate = useNavigate();
   const [loading, setLoading] = useState(false);
@@ -67,6 +81,13 @@ const QuoteList = () => {
 
   // 搜索
   const handleSearch = () => {
+    const tooShort = [searchParams.customer_name, searchParams.contact_phone].some(isKeywordTooShort);
+    if (tooShort) {
+      message.warning(
+        `搜索关键字至少输入${SEARCH_MIN_LENGTH}个字符（中文至少${SEARCH_MIN_LENGTH_CJK}个字）`
+      );
+      return;
+    }
     loadQuotes();
   };
 
@@ -41,7 +41,8 @@ const TemplateManage = () => {
   const loadTemplates = async () => {
     try {
       setLoading(true);
-      const params: any = {};
+      // 列表不需要模板数据，编辑时再读取详情
+      const params: any = { include_data: false };
       if (filterType) params.template_type = filterType;
       const data = await templateApi.list(params);
       setTemplates(data);
@@ -89,11 +90,18 @@ const TemplateManage = () => {
   };
 
   // 打开编辑/创建模态框
-  const openModal = (template?: Template) => {
-    setEditingTemplate(template || null);
+  const openModal = async (template?: Template) => {
     if (template) {
-      form.setFieldsValue(template);
+      try {
+        const detail = await templateApi.get(template.id);
+        setEditingTemplate(detail);
+        form.setFieldsValue(detail);
+      } catch (error) {
+        console.error('Load template failed:', error);
+        return;
+      }
     } else {
+      setEditingTemplate(null);
       form.resetFields();
     }
     setModalVisible(true);
@@ -9,6 +9,11 @@ export const exportApi = {
     return `/api/v1/exports/quotes/${quoteId}/preview?theme=${theme}`;
   },
 
+  // 预览未保存的报价单（创建/编辑向导，返回HTML）
+  previewDraft: (data: any, theme: string = 'blue'): Promise<string> => {
+    return api.post('/exports/preview', data, { params: { theme }, responseType: 'text' });
+  },
+
   // 导出HTML
   exportHtml: (quoteId: number, theme: string = 'blue'): string => {
     return `/api/v1/exports/quotes/${quoteId}/export/html?theme=${theme}`;
@@ -19,11 +24,36 @@ export const exportApi = {
     return `/api/v1/exports/quotes/${quoteId}/export/excel`;
   },
 
+  // 导出Word
+  exportWord: (quoteId: number): string => {
+    return `/api/v1/exports/quotes/${quoteId}/export/word`;
+  },
+
   // 导出PDF
   exportPdf: (quoteId: number, theme: string = 'blue'): string => {
     return `/api/v1/exports/quotes/${quoteId}/export/pdf?theme=${theme}`;
   },
 
+  // 创建分享链接（无需登录即可打开，返回的url为站内路径）
+  createShareLink: (
+    quoteId: number,
+    data: { export_format?: string; theme?: string; expires_in?: number } = {}
+  ): Promise<{ url: string; expires_at: string }> => {
+    return api.post(`/exports/quotes/${quoteId}/share`, data);
+  },
+
+  // 批量导出ZIP（筛选条件与报价单列表相同）
+  exportBulk: (format: string = 'pdf', params: Record<string, string> = {}): string => {
+    const query = new URLSearchParams({ format, ...params });
+    return `/api/v1/exports/quotes/bulk?${query.toString()}`;
+  },
+
+  // 报价单汇总表Excel（筛选条件与报价单列表相同）
+  exportReport: (params: Record<string, string> = {}): string => {
+    const query = new URLSearchParams(params);
+    return `/api/v1/exports/quotes/report.xlsx?${query.toString()}`;
+  },
+
   // 下载文件
   download: async (url: string, filename: string): Promise<void> => {
     try {
@@ -47,6 +47,7 @@ export interface QuoteUpdateRequest {
 export interface QuoteListParams {
   skip?: number;
   limit?: number;
+  cursor?: string;
   customer_name?: string;
   contact_phone?: string;
   status?: string;
@@ -54,12 +55,23 @@ export interface QuoteListParams {
   end_date?: string;
 }
 
+export interface QuoteSummary {
+  total: number;
+  status_counts: Record<string, number>;
+  recent: Quote[];
+}
+
 export const quoteApi = {
   // 获取报价单列表
   list: (params?: QuoteListParams): Promise<Quote[]> => {
     return api.get('/quotes', { params });
   },
 
+  // 获取报价单概览（仪表盘）
+  summary: (recent_limit?: number): Promise<QuoteSummary> => {
+    return api.get('/quotes/summary', { params: { recent_limit } });
+  },
+
   // 创建报价单
   create: (data: QuoteCreateRequest): Promise<Quote> => {
     return api.post('/quotes', data);
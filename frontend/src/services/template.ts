@@ -21,7 +21,7 @@ export interface TemplateUpdateRequest {
 
 export const templateApi = {
   // 获取模板列表
-  list: (params?: { template_type?: string; is_active?: boolean }): Promise<Template[]> => {
+  list: (params?: { template_type?: string; is_active?: boolean; include_data?: boolean }): Promise<Template[]> => {
     return api.get('/templates', { params });
   },
 